@@ -188,6 +188,14 @@ run_migrations() {
         export ENVIRONMENT="production"
         export GOOGLE_CLOUD_PROJECT="$PROJECT_ID"
         
+        # Deploy composite indexes used by content list queries
+        if command -v firebase &> /dev/null; then
+            firebase deploy --only firestore:indexes --project "$PROJECT_ID"
+            log_success "Firestore indexes deployed"
+        else
+            log_warning "firebase CLI not found, skipping Firestore index deployment"
+        fi
+        
         # Run migration script
         if [ -f "scripts/migrate.py" ]; then
             python scripts/migrate.py
@@ -9,16 +9,18 @@ This module contains all authentication-related endpoints including:
 """
 
 from datetime import timedelta
-from typing import Dict
+from typing import Dict, Optional
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.security import HTTPBearer
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
+from fastapi.responses import ORJSONResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from src.models.schemas.auth import (
     ChangePasswordRequest,
     LoginRequest,
     LoginResponse,
+    LoginResponseStruct,
     PasswordResetConfirmRequest,
     PasswordResetRequest,
     RefreshTokenRequest,
@@ -26,27 +28,42 @@ from src.models.schemas.auth import (
     SocialAuthRequest,
     SocialAuthResponse,
     TokenResponse,
+    TokenResponseStruct,
 )
 from src.models.schemas.common import ErrorResponse, SuccessResponse
 from src.models.user import User, UserCreateRequest, UserResponse
 from src.services.auth import AuthService
 from src.services.user import UserService
-from src.utils.auth import get_current_user
+from src.utils.auth import (
+    client_ip,
+    consume_rate_limit,
+    enforce_rate_limit,
+    get_current_user,
+    rate_limit_available,
+    rate_limit_by_ip,
+    verify_token,
+)
+from src.utils.responses import MsgspecJSONResponse
 from src.integrations.firestore import get_user_by_id
 
 # Initialize router and logger
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 security = HTTPBearer()
 logger = structlog.get_logger(__name__)
 
-# Dependency injection
+# Dependency injection; both services are stateless and shared across requests
+_AUTH_SERVICE = AuthService()
+_USER_SERVICE = UserService()
+
+
 def get_auth_service() -> AuthService:
     """Get authentication service instance."""
-    return AuthService()
+    return _AUTH_SERVICE
+
 
 def get_user_service() -> UserService:
     """Get user service instance."""
-    return UserService()
+    return _USER_SERVICE
 
 
 @router.post(
@@ -56,7 +73,9 @@ def get_user_service() -> UserService:
     responses={
         400: {"model": ErrorResponse, "description": "Invalid registration data"},
         409: {"model": ErrorResponse, "description": "User already exists"},
-    }
+        429: {"model": ErrorResponse, "description": "Too many requests"},
+    },
+    dependencies=[Depends(rate_limit_by_ip("register", 5, 60))],
 )
 async def register(
     request: RegisterRequest,
@@ -70,17 +89,20 @@ async def register(
     The user will need to verify their email before accessing all features.
     """
     logger.info("User registration attempt", email=request.email)
+    await enforce_rate_limit(request.email.lower(), "register", 10, 3600)
     
     try:
-        # Check if user already exists
-        existing_user = await user_service.get_user_by_email(request.email)
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="User with this email already exists"
-            )
-        
-        # Create new user
+        # Accounts created before the email index existed are only found by
+        # lookup; the email filter rules that out for most new addresses
+        if await user_service.email_may_exist(request.email):
+            existing_user = await user_service.get_user_by_email(request.email)
+            if existing_user:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="User with this email already exists"
+                )
+        
+        # Create new user; the write itself rejects a taken email
         user_data = UserCreateRequest(
             email=request.email,
             full_name=request.full_name,
@@ -89,27 +111,15 @@ async def register(
             company=request.company,
         )
         
-        user = await user_service.create_user(user_data)
+        user = await user_service.create_user_if_absent(user_data)
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="User with this email already exists"
+            )
         logger.info("User registered successfully", user_id=user.id, email=user.email)
         
-        return UserResponse(
-            id=user.id,
-            email=user.email,
-            full_name=user.full_name,
-            avatar_url=user.avatar_url,
-            job_title=user.job_title,
-            company=user.company,
-            industry=user.industry,
-            bio=user.bio,
-            role=user.role,
-            subscription_tier=user.subscription_tier,
-            is_active=user.is_active,
-            is_verified=user.is_verified,
-            content_preferences=user.content_preferences,
-            stats=user.stats,
-            created_at=user.created_at,
-            updated_at=user.updated_at
-        )
+        return user.to_response()
         
     except HTTPException:
         raise
@@ -127,26 +137,37 @@ async def register(
     responses={
         401: {"model": ErrorResponse, "description": "Invalid credentials"},
         423: {"model": ErrorResponse, "description": "Account locked"},
-    }
+        429: {"model": ErrorResponse, "description": "Too many requests"},
+    },
+    dependencies=[Depends(rate_limit_by_ip("login", 5, 60))],
 )
 async def login(
     request: LoginRequest,
+    http_request: Request,
+    background_tasks: BackgroundTasks,
     auth_service: AuthService = Depends(get_auth_service),
-    user_service: UserService = Depends(get_user_service),
-) -> LoginResponse:
+) -> MsgspecJSONResponse:
     """
     Authenticate user and return access tokens.
     
     Validates user credentials and returns JWT access and refresh tokens
     for authenticated API access.
     """
-    logger.info("User login attempt", email=request.email)
+    # Failed attempts are limited per email and client, so guessing passwords
+    # from one address cannot lock the account out for everyone else
+    login_limit_key = f"{request.email.lower()}:{client_ip(http_request)}"
+    if not await rate_limit_available(login_limit_key, "login_failures", 10, 3600):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests. Please try again later.",
+        )
     
     try:
-        # Authenticate user
-        user = await auth_service.authenticate_user(request.email, request.password)
+        # Authenticate user and record the login
+        user = await auth_service.authenticate_and_touch(request.email, request.password)
         if not user:
             logger.warning("Failed login attempt", email=request.email)
+            await consume_rate_limit(login_limit_key, "login_failures", 10, 3600)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password"
@@ -159,20 +180,23 @@ async def login(
                 detail="Account is deactivated"
             )
         
+        # Upgrade legacy or outdated password hashes after the response
+        if auth_service.password_needs_rehash(user.password_hash):
+            background_tasks.add_task(auth_service.rehash_password, user.id, request.password)
+        
         # Generate tokens
         access_token, refresh_token = await auth_service.create_tokens(user.id)
         
-        # Update last login timestamp
-        await user_service.update_last_login(user.id)
-        
-        logger.info("User logged in successfully", user_id=user.id, email=user.email)
+        logger.debug("User logged in successfully", user_id=user.id, email=user.email)
         
-        return LoginResponse(
-            access_token=access_token,
-            refresh_token=refresh_token,
-            token_type="bearer",
-            expires_in=30 * 60,  # 30 minutes
-            user_id=user.id,
+        return MsgspecJSONResponse(
+            LoginResponseStruct(
+                access_token=access_token,
+                refresh_token=refresh_token,
+                token_type="bearer",
+                expires_in=30 * 60,  # 30 minutes
+                user_id=user.id,
+            )
         )
         
     except HTTPException:
@@ -195,24 +219,24 @@ async def login(
 async def refresh_token(
     request: RefreshTokenRequest,
     auth_service: AuthService = Depends(get_auth_service),
-) -> TokenResponse:
+) -> MsgspecJSONResponse:
     """
     Refresh access token using refresh token.
     
     Validates the refresh token and returns a new access token.
     """
-    logger.info("Token refresh attempt")
-    
     try:
         # Validate refresh token and get new access token
         access_token = await auth_service.refresh_access_token(request.refresh_token)
         
-        logger.info("Token refreshed successfully")
+        logger.debug("Token refreshed successfully")
         
-        return TokenResponse(
-            access_token=access_token,
-            token_type="bearer",
-            expires_in=30 * 60,  # 30 minutes
+        return MsgspecJSONResponse(
+            TokenResponseStruct(
+                access_token=access_token,
+                token_type="bearer",
+                expires_in=30 * 60,  # 30 minutes
+            )
         )
         
     except Exception as e:
@@ -226,9 +250,10 @@ async def refresh_token(
 @router.post(
     "/logout",
     response_model=SuccessResponse,
-    dependencies=[Depends(security)]
 )
 async def logout(
+    request: Optional[RefreshTokenRequest] = None,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
     current_user: User = Depends(get_current_user),
     auth_service: AuthService = Depends(get_auth_service),
 ) -> SuccessResponse:
@@ -236,12 +261,16 @@ async def logout(
     Logout user and invalidate tokens.
     
     Adds the current access token to a blacklist to prevent further use.
+    If the refresh token is sent in the body, it is revoked as well.
     """
     logger.info("User logout", user_id=current_user.id)
     
     try:
         # Invalidate user tokens
-        await auth_service.logout_user(current_user.id)
+        payload = verify_token(credentials.credentials) or {}
+        await auth_service.logout_user(current_user.id, payload.get("jti"), payload.get("exp"))
+        if request is not None:
+            await auth_service.revoke_refresh_token(request.refresh_token)
         
         logger.info("User logged out successfully", user_id=current_user.id)
         
@@ -263,7 +292,9 @@ async def logout(
     response_model=SuccessResponse,
     responses={
         404: {"model": ErrorResponse, "description": "User not found"},
-    }
+        429: {"model": ErrorResponse, "description": "Too many requests"},
+    },
+    dependencies=[Depends(rate_limit_by_ip("password-reset", 5, 60))],
 )
 async def request_password_reset(
     request: PasswordResetRequest,
@@ -275,6 +306,7 @@ async def request_password_reset(
     Sends a password reset email with a secure token if the email exists.
     """
     logger.info("Password reset requested", email=request.email)
+    await enforce_rate_limit(request.email.lower(), "password-reset", 10, 3600)
     
     try:
         # Generate password reset token and send email
@@ -301,7 +333,9 @@ async def request_password_reset(
     response_model=SuccessResponse,
     responses={
         400: {"model": ErrorResponse, "description": "Invalid or expired token"},
-    }
+        429: {"model": ErrorResponse, "description": "Too many requests"},
+    },
+    dependencies=[Depends(rate_limit_by_ip("password-reset-confirm", 5, 60))],
 )
 async def confirm_password_reset(
     request: PasswordResetConfirmRequest,
@@ -608,25 +642,7 @@ async def get_current_user_info(
     Returns the authenticated user's profile information.
     """
     try:
-        # Convert User to UserResponse
-        return UserResponse(
-            id=current_user.id,
-            email=current_user.email,
-            full_name=current_user.full_name,
-            avatar_url=current_user.avatar_url,
-            job_title=current_user.job_title,
-            company=current_user.company,
-            industry=current_user.industry,
-            bio=current_user.bio,
-            role=current_user.role,
-            subscription_tier=current_user.subscription_tier,
-            is_active=current_user.is_active,
-            is_verified=current_user.is_verified,
-            content_preferences=current_user.content_preferences,
-            stats=current_user.stats,
-            created_at=current_user.created_at,
-            updated_at=current_user.updated_at
-        )
+        return current_user.to_response()
     except Exception as e:
         logger.error("Error in get_current_user_info", error=str(e))
         raise HTTPException(
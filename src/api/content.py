@@ -9,10 +9,11 @@ This module contains content-related endpoints including:
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.security import HTTPBearer
 
 from src.models.content import (
@@ -32,52 +33,99 @@ from src.models.schemas.common import (
     PaginatedResponse,
     PaginationParams,
     SuccessResponse,
+    pagination_params,
 )
 from src.models.user import User
 from src.services.content_discovery import ContentDiscoveryService
 from src.services.content_generation import ContentGenerationService
 from src.services.publishing import PublishingService
 from src.utils.auth import get_current_user
+from src.utils.batcher import AsyncBatcher
+from src.utils.error_handling import ValidationError, handle_service_errors
+from src.utils.responses import MsgspecJSONResponse, to_response
+from src.utils.routing import TrustedRoute
 
 # Initialize router and dependencies
-router = APIRouter()
+router = APIRouter(route_class=TrustedRoute)
 security = HTTPBearer()
 logger = structlog.get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
 def get_content_discovery_service() -> ContentDiscoveryService:
     """Get content discovery service instance."""
     return ContentDiscoveryService()
 
 
+@lru_cache(maxsize=1)
 def get_content_generation_service() -> ContentGenerationService:
     """Get content generation service instance."""
     return ContentGenerationService()
 
 
+@lru_cache(maxsize=1)
 def get_publishing_service() -> PublishingService:
     """Get publishing service instance."""
     return PublishingService()
 
 
+_PLATFORMS_BY_VALUE = {platform.value: platform for platform in PlatformType}
+
+
+def parse_platforms(
+    platforms: List[str] = Query(..., description="Platforms to publish to"),
+) -> List[PlatformType]:
+    """Parse platform query values with a dict lookup instead of enum validation."""
+    try:
+        return [_PLATFORMS_BY_VALUE[platform] for platform in platforms]
+    except KeyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown platform: {e.args[0]}"
+        )
+
+
+def create_discovery_batcher() -> AsyncBatcher:
+    """Create the batcher that coalesces manual discovery triggers into bulk runs."""
+    return AsyncBatcher(
+        get_content_discovery_service().discover_content_for_users,
+        max_size=64,
+        max_wait_ms=20,
+    )
+
+
+def get_discovery_batcher(request: Request) -> AsyncBatcher:
+    """Get the discovery batcher created by the application lifespan."""
+    return request.app.state.discovery_batcher
+
+
 @router.get(
     "",
     response_model=ContentListResponse,
     dependencies=[Depends(security)]
 )
+@handle_service_errors(
+    "Failed to fetch content. Please try again.",
+    client_errors=(ValidationError,),
+    client_error_detail="Invalid cursor",
+)
 async def get_content_list(
-    pagination: PaginationParams = Depends(),
+    pagination: PaginationParams = Depends(pagination_params),
     status_filter: Optional[ContentStatus] = Query(None, alias="status"),
     topic_filter: Optional[ContentTopic] = Query(None, alias="topic"),
     platform_filter: Optional[PlatformType] = Query(None, alias="platform"),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page; replaces page offsets"
+    ),
     current_user: User = Depends(get_current_user),
     content_discovery: ContentDiscoveryService = Depends(get_content_discovery_service),
-) -> ContentListResponse:
+) -> MsgspecJSONResponse:
     """
     Get paginated list of content items.
     
     Returns a paginated list of content items with optional filtering
-    by status, topic, and platform.
+    by status, topic, and platform. For deep pages, pass the previous
+    response's next_cursor as cursor instead of a page number.
     """
     logger.info(
         "Content list requested",
@@ -86,32 +134,29 @@ async def get_content_list(
         page_size=pagination.page_size
     )
     
-    try:
-        filters = {}
-        if status_filter:
-            filters["status"] = status_filter
-        if topic_filter:
-            filters["topic"] = topic_filter
-        if platform_filter:
-            filters["platform"] = platform_filter
-        
-        content_list = await content_discovery.get_user_content(
-            user_id=current_user.id,
-            page=pagination.page,
-            page_size=pagination.page_size,
-            filters=filters,
-            sort_by=pagination.sort_by,
-            sort_order=pagination.sort_order,
-        )
-        
-        return content_list
-        
-    except Exception as e:
-        logger.error("Failed to fetch content list", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch content. Please try again."
-        )
+    filters = {
+        key: value
+        for key, value in (
+            ("status", status_filter),
+            ("topic", topic_filter),
+            ("platform", platform_filter),
+        )
+        if value is not None
+    }
+    
+    # Pages are capped at 100 items, so the page is read in full before any
+    # of the response is sent, and read errors still become error responses
+    content_list = await content_discovery.get_user_content(
+        user_id=current_user.id,
+        page=pagination.page,
+        page_size=pagination.page_size,
+        filters=filters,
+        sort_by=pagination.sort_by,
+        sort_order=pagination.sort_order,
+        cursor=cursor,
+    )
+    
+    return MsgspecJSONResponse(content_list)
 
 
 @router.get(
@@ -122,6 +167,7 @@ async def get_content_list(
         404: {"model": ErrorResponse, "description": "Content not found"},
     }
 )
+@handle_service_errors("Failed to fetch content item. Please try again.", client_errors=())
 async def get_content_item(
     content_id: str,
     current_user: User = Depends(get_current_user),
@@ -135,29 +181,16 @@ async def get_content_item(
     """
     logger.info("Content item requested", user_id=current_user.id, content_id=content_id)
     
-    try:
-        content_item = await content_discovery.get_content_item(content_id, current_user.id)
-        if not content_item:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Content item not found"
-            )
-        
-        return ContentResponse.from_orm(content_item)
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(
-            "Failed to fetch content item",
-            user_id=current_user.id,
-            content_id=content_id,
-            error=str(e)
-        )
+    content_item = await content_discovery.get_content_item(
+        content_id, current_user.id, use_cache=True
+    )
+    if not content_item:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch content item. Please try again."
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Content item not found"
         )
+    
+    return to_response(ContentResponse, content_item)
 
 
 @router.post(
@@ -165,6 +198,7 @@ async def get_content_item(
     response_model=ContentResponse,
     dependencies=[Depends(security)]
 )
+@handle_service_errors("Content generation failed. Please try again.", client_errors=())
 async def generate_content_direct(
     request: ContentGenerationRequest,
     current_user: User = Depends(get_current_user),
@@ -181,33 +215,21 @@ async def generate_content_direct(
         platforms=request.platforms
     )
     
-    try:
-        # Generate content directly using AI
-        new_content = await content_generation.generate_direct_content(
-            user_id=current_user.id,
-            platforms=request.platforms,
-            custom_instructions=request.custom_instructions,
-            user_preferences=current_user.content_preferences,
-        )
-        
-        logger.info(
-            "Direct content generation completed",
-            user_id=current_user.id,
-            content_id=new_content.id
-        )
-        
-        return ContentResponse.from_orm(new_content)
-        
-    except Exception as e:
-        logger.error(
-            "Direct content generation failed",
-            user_id=current_user.id,
-            error=str(e)
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Content generation failed. Please try again."
-        )
+    # Generate content directly using AI
+    new_content = await content_generation.generate_direct_content(
+        user_id=current_user.id,
+        platforms=request.platforms,
+        custom_instructions=request.custom_instructions,
+        user_preferences=current_user.content_preferences,
+    )
+    
+    logger.info(
+        "Direct content generation completed",
+        user_id=current_user.id,
+        content_id=new_content.id
+    )
+    
+    return to_response(ContentResponse, new_content)
 
 
 @router.post(
@@ -215,9 +237,10 @@ async def generate_content_direct(
     response_model=SuccessResponse,
     dependencies=[Depends(security)]
 )
+@handle_service_errors("Content discovery failed. Please try again.", client_errors=())
 async def trigger_content_discovery(
     current_user: User = Depends(get_current_user),
-    content_discovery: ContentDiscoveryService = Depends(get_content_discovery_service),
+    discovery_batcher: AsyncBatcher = Depends(get_discovery_batcher),
 ) -> SuccessResponse:
     """
     Manually trigger content discovery.
@@ -227,24 +250,12 @@ async def trigger_content_discovery(
     """
     logger.info("Manual content discovery triggered", user_id=current_user.id)
     
-    try:
-        await content_discovery.discover_content_for_user(current_user.id)
-        
-        return SuccessResponse(
-            success=True,
-            message="Content discovery initiated successfully"
-        )
-        
-    except Exception as e:
-        logger.error(
-            "Content discovery failed",
-            user_id=current_user.id,
-            error=str(e)
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Content discovery failed. Please try again."
-        )
+    await discovery_batcher.submit(current_user.id)
+    
+    return SuccessResponse(
+        success=True,
+        message="Content discovery initiated successfully"
+    )
 
 
 @router.post(
@@ -256,6 +267,7 @@ async def trigger_content_discovery(
         400: {"model": ErrorResponse, "description": "Content already generated"},
     }
 )
+@handle_service_errors("Content generation failed. Please try again.", client_errors=())
 async def generate_content_posts(
     content_id: str,
     request: ContentGenerationRequest,
@@ -275,45 +287,30 @@ async def generate_content_posts(
         platforms=request.platforms
     )
     
-    try:
-        # Validate content belongs to user
-        content_item = await content_generation.get_content_item(content_id, current_user.id)
-        if not content_item:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Content item not found"
-            )
-        
-        # Generate posts for specified platforms
-        updated_content = await content_generation.generate_posts(
-            content_id=content_id,
-            platforms=request.platforms,
-            custom_instructions=request.custom_instructions,
-            user_preferences=current_user.content_preferences,
-        )
-        
-        logger.info(
-            "Content generation completed",
-            user_id=current_user.id,
-            content_id=content_id,
-            platforms=request.platforms
-        )
-        
-        return ContentResponse.from_orm(updated_content)
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(
-            "Content generation failed",
-            user_id=current_user.id,
-            content_id=content_id,
-            error=str(e)
-        )
+    # Validate content belongs to user
+    content_item = await content_generation.get_content_item(content_id, current_user.id)
+    if not content_item:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Content generation failed. Please try again."
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Content item not found"
         )
+    
+    # Generate posts for specified platforms
+    updated_content = await content_generation.generate_posts(
+        content_id=content_id,
+        platforms=request.platforms,
+        custom_instructions=request.custom_instructions,
+        user_preferences=current_user.content_preferences,
+    )
+    
+    logger.info(
+        "Content generation completed",
+        user_id=current_user.id,
+        content_id=content_id,
+        platforms=request.platforms
+    )
+    
+    return to_response(ContentResponse, updated_content)
 
 
 @router.post(
@@ -325,6 +322,7 @@ async def generate_content_posts(
         400: {"model": ErrorResponse, "description": "Content not ready for approval"},
     }
 )
+@handle_service_errors("Content approval failed. Please try again.")
 async def approve_content(
     content_id: str,
     request: ContentApprovalRequest,
@@ -344,45 +342,21 @@ async def approve_content(
         approved=request.approved
     )
     
-    try:
-        updated_content = await content_discovery.approve_content(
-            content_id=content_id,
-            user_id=current_user.id,
-            approved=request.approved,
-            rejection_reason=request.rejection_reason,
-        )
-        
-        logger.info(
-            "Content approval processed",
-            user_id=current_user.id,
-            content_id=content_id,
-            approved=request.approved
-        )
-        
-        return ContentResponse.from_orm(updated_content)
-        
-    except ValueError as e:
-        logger.warning(
-            "Invalid content approval request",
-            user_id=current_user.id,
-            content_id=content_id,
-            error=str(e)
-        )
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        logger.error(
-            "Content approval failed",
-            user_id=current_user.id,
-            content_id=content_id,
-            error=str(e)
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Content approval failed. Please try again."
-        )
+    updated_content = await content_discovery.approve_content(
+        content_id=content_id,
+        user_id=current_user.id,
+        approved=request.approved,
+        rejection_reason=request.rejection_reason,
+    )
+    
+    logger.info(
+        "Content approval processed",
+        user_id=current_user.id,
+        content_id=content_id,
+        approved=request.approved
+    )
+    
+    return to_response(ContentResponse, updated_content)
 
 
 @router.post(
@@ -394,6 +368,7 @@ async def approve_content(
         400: {"model": ErrorResponse, "description": "Content not ready for scheduling"},
     }
 )
+@handle_service_errors("Content scheduling failed. Please try again.")
 async def schedule_content(
     content_id: str,
     request: ContentSchedulingRequest,
@@ -414,45 +389,21 @@ async def schedule_content(
         platforms=request.platforms
     )
     
-    try:
-        updated_content = await publishing.schedule_content(
-            content_id=content_id,
-            user_id=current_user.id,
-            scheduled_for=request.scheduled_for,
-            platforms=request.platforms,
-        )
-        
-        logger.info(
-            "Content scheduled successfully",
-            user_id=current_user.id,
-            content_id=content_id,
-            scheduled_for=request.scheduled_for
-        )
-        
-        return ContentResponse.from_orm(updated_content)
-        
-    except ValueError as e:
-        logger.warning(
-            "Invalid content scheduling request",
-            user_id=current_user.id,
-            content_id=content_id,
-            error=str(e)
-        )
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        logger.error(
-            "Content scheduling failed",
-            user_id=current_user.id,
-            content_id=content_id,
-            error=str(e)
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Content scheduling failed. Please try again."
-        )
+    updated_content = await publishing.schedule_content(
+        content_id=content_id,
+        user_id=current_user.id,
+        scheduled_for=request.scheduled_for,
+        platforms=request.platforms,
+    )
+    
+    logger.info(
+        "Content scheduled successfully",
+        user_id=current_user.id,
+        content_id=content_id,
+        scheduled_for=request.scheduled_for
+    )
+    
+    return to_response(ContentResponse, updated_content)
 
 
 @router.post(
@@ -464,9 +415,10 @@ async def schedule_content(
         400: {"model": ErrorResponse, "description": "Content not ready for publishing"},
     }
 )
+@handle_service_errors("Content publishing failed. Please try again.")
 async def publish_content_now(
     content_id: str,
-    platforms: List[PlatformType] = Query(..., description="Platforms to publish to"),
+    platforms: List[PlatformType] = Depends(parse_platforms),
     current_user: User = Depends(get_current_user),
     publishing: PublishingService = Depends(get_publishing_service),
 ) -> ContentResponse:
@@ -483,44 +435,20 @@ async def publish_content_now(
         platforms=platforms
     )
     
-    try:
-        updated_content = await publishing.publish_content(
-            content_id=content_id,
-            user_id=current_user.id,
-            platforms=platforms,
-        )
-        
-        logger.info(
-            "Content published successfully",
-            user_id=current_user.id,
-            content_id=content_id,
-            platforms=platforms
-        )
-        
-        return ContentResponse.from_orm(updated_content)
-        
-    except ValueError as e:
-        logger.warning(
-            "Invalid content publishing request",
-            user_id=current_user.id,
-            content_id=content_id,
-            error=str(e)
-        )
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        logger.error(
-            "Content publishing failed",
-            user_id=current_user.id,
-            content_id=content_id,
-            error=str(e)
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Content publishing failed. Please try again."
-        )
+    updated_content = await publishing.publish_content(
+        content_id=content_id,
+        user_id=current_user.id,
+        platforms=platforms,
+    )
+    
+    logger.info(
+        "Content published successfully",
+        user_id=current_user.id,
+        content_id=content_id,
+        platforms=platforms
+    )
+    
+    return to_response(ContentResponse, updated_content)
 
 
 @router.delete(
@@ -531,6 +459,11 @@ async def publish_content_now(
         404: {"model": ErrorResponse, "description": "Content not found"},
     }
 )
+@handle_service_errors(
+    "Content deletion failed. Please try again.",
+    client_error_status=status.HTTP_404_NOT_FOUND,
+    client_error_detail="Content item not found",
+)
 async def delete_content_item(
     content_id: str,
     current_user: User = Depends(get_current_user),
@@ -543,35 +476,11 @@ async def delete_content_item(
     """
     logger.info("Content deletion requested", user_id=current_user.id, content_id=content_id)
     
-    try:
-        await content_discovery.delete_content_item(content_id, current_user.id)
-        
-        logger.info("Content deleted successfully", user_id=current_user.id, content_id=content_id)
-        
-        return SuccessResponse(
-            success=True,
-            message="Content item deleted successfully"
-        )
-        
-    except ValueError as e:
-        logger.warning(
-            "Content deletion denied",
-            user_id=current_user.id,
-            content_id=content_id,
-            error=str(e)
-        )
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Content item not found"
-        )
-    except Exception as e:
-        logger.error(
-            "Content deletion failed",
-            user_id=current_user.id,
-            content_id=content_id,
-            error=str(e)
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Content deletion failed. Please try again."
-        )
\ No newline at end of file
+    await content_discovery.delete_content_item(content_id, current_user.id)
+    
+    logger.info("Content deleted successfully", user_id=current_user.id, content_id=content_id)
+    
+    return SuccessResponse(
+        success=True,
+        message="Content item deleted successfully"
+    )
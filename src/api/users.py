@@ -8,14 +8,20 @@ This module contains user profile management endpoints including:
 - User statistics and analytics
 """
 
-from typing import List, Optional
+import hashlib
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer
 
+from src.config.redis import get_redis
 from src.models.schemas.common import ErrorResponse, PaginatedResponse, PaginationParams, SuccessResponse
 from src.models.user import (
+    PLATFORM_STR,
+    TIER_STR,
     ContentPreferences,
     SubscriptionTier,
     User,
@@ -25,26 +31,129 @@ from src.models.user import (
 )
 from src.services.user import UserService
 from src.utils.auth import get_current_user
+from src.utils.error_handling import handle_service_errors
+from src.utils.routing import TrustedRoute
 
 # Initialize router and dependencies
-router = APIRouter()
+router = APIRouter(route_class=TrustedRoute)
 security = HTTPBearer()
 logger = structlog.get_logger(__name__)
 
+# Serialized profile payloads are cached briefly, tagged with the user's
+# updated_at, and dropped on update
+PROFILE_CACHE_TTL = 60
 
+
+@lru_cache(maxsize=1)
 def get_user_service() -> UserService:
     """Get user service instance."""
     return UserService()
 
 
+def _profile_cache_key(user_id: str) -> str:
+    """Get Redis key for a user's serialized profile."""
+    return f"user:{user_id}:profile"
+
+
+def _preferences_cache_key(user_id: str) -> str:
+    """Get Redis key for a user's serialized content preferences."""
+    return f"user:{user_id}:prefs"
+
+
+async def _get_cached_payload(key: str, version: str) -> Optional[Tuple[str, str]]:
+    """
+    Get a cached (etag, JSON payload) pair built from the given version.
+    
+    Redis errors and payloads built from another version count as a miss.
+    """
+    try:
+        etag, payload, cached_version = await get_redis().hmget(
+            key, "etag", "payload", "version"
+        )
+    except Exception as e:
+        logger.warning("Profile cache read failed", key=key, error=str(e))
+        return None
+    
+    if etag is None or payload is None or cached_version != version:
+        return None
+    return etag, payload
+
+
+async def _cache_payload(key: str, version: str, etag: str, payload: str) -> None:
+    """Cache an (etag, JSON payload) pair for PROFILE_CACHE_TTL seconds."""
+    try:
+        async with get_redis().pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={"etag": etag, "payload": payload, "version": version})
+            pipe.expire(key, PROFILE_CACHE_TTL)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning("Profile cache write failed", key=key, error=str(e))
+
+
+def _payload_etag(payload: str) -> str:
+    """Get a strong ETag for a JSON payload."""
+    return '"' + hashlib.blake2b(payload.encode(), digest_size=16).hexdigest() + '"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag using weak comparison."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+async def _cached_json_response(
+    request: Request,
+    key: str,
+    user: User,
+    build_payload: Callable[[], str],
+) -> Response:
+    """
+    Serve a cached JSON payload with an ETag, or 304 if the client has it.
+    
+    The payload is only reused if it was built from the same user.updated_at
+    as the freshly read user, so a payload cached by a request that raced an
+    update is rebuilt rather than served. build_payload is only called on a
+    cache miss.
+    """
+    version = user.updated_at.isoformat()
+    cached = await _get_cached_payload(key, version)
+    if cached is None:
+        payload = build_payload()
+        etag = _payload_etag(payload)
+        await _cache_payload(key, version, etag, payload)
+    else:
+        etag, payload = cached
+    
+    headers = {"ETag": etag}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+
+async def _invalidate_profile_cache(user_id: str) -> None:
+    """Drop a user's cached profile and preferences payloads."""
+    try:
+        await get_redis().delete(_profile_cache_key(user_id), _preferences_cache_key(user_id))
+    except Exception as e:
+        logger.warning("Profile cache invalidation failed", user_id=user_id, error=str(e))
+
+
 @router.get(
     "/profile",
     response_model=UserResponse,
     dependencies=[Depends(security)]
 )
 async def get_user_profile(
+    request: Request,
     current_user: User = Depends(get_current_user),
-) -> UserResponse:
+) -> Response:
     """
     Get current user's profile information.
     
@@ -52,7 +161,13 @@ async def get_user_profile(
     statistics, and connected social accounts.
     """
     logger.info("User profile requested", user_id=current_user.id)
-    return UserResponse.from_orm(current_user)
+    
+    return await _cached_json_response(
+        request,
+        _profile_cache_key(current_user.id),
+        current_user,
+        lambda: current_user.to_response().model_dump_json(),
+    )
 
 
 @router.put(
@@ -63,6 +178,7 @@ async def get_user_profile(
         400: {"model": ErrorResponse, "description": "Invalid profile data"},
     }
 )
+@handle_service_errors("Profile update failed. Please try again.")
 async def update_user_profile(
     request: UserUpdateRequest,
     current_user: User = Depends(get_current_user),
@@ -76,23 +192,10 @@ async def update_user_profile(
     """
     logger.info("User profile update", user_id=current_user.id)
     
-    try:
-        updated_user = await user_service.update_user(current_user.id, request)
-        logger.info("User profile updated successfully", user_id=current_user.id)
-        return UserResponse.from_orm(updated_user)
-        
-    except ValueError as e:
-        logger.warning("Invalid profile update data", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        logger.error("Profile update failed", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Profile update failed. Please try again."
-        )
+    updated_user = await user_service.update_user(current_user.id, request)
+    await _invalidate_profile_cache(current_user.id)
+    logger.info("User profile updated successfully", user_id=current_user.id)
+    return updated_user.to_response()
 
 
 @router.get(
@@ -101,8 +204,9 @@ async def update_user_profile(
     dependencies=[Depends(security)]
 )
 async def get_content_preferences(
+    request: Request,
     current_user: User = Depends(get_current_user),
-) -> ContentPreferences:
+) -> Response:
     """
     Get user's content preferences.
     
@@ -110,7 +214,13 @@ async def get_content_preferences(
     posting frequency, tone, and platform settings.
     """
     logger.info("Content preferences requested", user_id=current_user.id)
-    return current_user.content_preferences
+    
+    return await _cached_json_response(
+        request,
+        _preferences_cache_key(current_user.id),
+        current_user,
+        lambda: current_user.content_preferences.model_dump_json(),
+    )
 
 
 @router.put(
@@ -121,6 +231,7 @@ async def get_content_preferences(
         400: {"model": ErrorResponse, "description": "Invalid preferences data"},
     }
 )
+@handle_service_errors("Preferences update failed. Please try again.")
 async def update_content_preferences(
     preferences: ContentPreferences,
     current_user: User = Depends(get_current_user),
@@ -134,25 +245,12 @@ async def update_content_preferences(
     """
     logger.info("Content preferences update", user_id=current_user.id)
     
-    try:
-        updated_user = await user_service.update_content_preferences(
-            current_user.id, preferences
-        )
-        logger.info("Content preferences updated successfully", user_id=current_user.id)
-        return updated_user.content_preferences
-        
-    except ValueError as e:
-        logger.warning("Invalid preferences data", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        logger.error("Preferences update failed", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Preferences update failed. Please try again."
-        )
+    updated_user = await user_service.update_content_preferences(
+        current_user.id, preferences
+    )
+    await _invalidate_profile_cache(current_user.id)
+    logger.info("Content preferences updated successfully", user_id=current_user.id)
+    return updated_user.content_preferences
 
 
 @router.put(
@@ -160,6 +258,7 @@ async def update_content_preferences(
     response_model=SuccessResponse,
     dependencies=[Depends(security)]
 )
+@handle_service_errors("Settings update failed. Please try again.")
 async def update_user_settings(
     settings: dict,
     current_user: User = Depends(get_current_user),
@@ -172,27 +271,14 @@ async def update_user_settings(
     """
     logger.info("User settings update", user_id=current_user.id)
     
-    try:
-        await user_service.update_user_settings(current_user.id, settings)
-        logger.info("User settings updated successfully", user_id=current_user.id)
-        
-        return SuccessResponse(
-            success=True,
-            message="Settings updated successfully"
-        )
-        
-    except ValueError as e:
-        logger.warning("Invalid settings data", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        logger.error("Settings update failed", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Settings update failed. Please try again."
-        )
+    await user_service.update_user_settings(current_user.id, settings)
+    await _invalidate_profile_cache(current_user.id)
+    logger.info("User settings updated successfully", user_id=current_user.id)
+    
+    return SuccessResponse(
+        success=True,
+        message="Settings updated successfully"
+    )
 
 
 @router.get(
@@ -200,6 +286,7 @@ async def update_user_settings(
     response_model=UserStats,
     dependencies=[Depends(security)]
 )
+@handle_service_errors("Failed to fetch statistics. Please try again.", client_errors=())
 async def get_user_statistics(
     current_user: User = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service),
@@ -212,16 +299,8 @@ async def get_user_statistics(
     """
     logger.info("User statistics requested", user_id=current_user.id)
     
-    try:
-        stats = await user_service.get_user_statistics(current_user.id)
-        return stats
-        
-    except Exception as e:
-        logger.error("Failed to fetch user statistics", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch statistics. Please try again."
-        )
+    stats = await user_service.get_user_statistics(current_user.id)
+    return stats
 
 
 @router.get(
@@ -229,6 +308,7 @@ async def get_user_statistics(
     response_model=dict,
     dependencies=[Depends(security)]
 )
+@handle_service_errors("Failed to fetch subscription information. Please try again.", client_errors=())
 async def get_subscription_info(
     current_user: User = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service),
@@ -240,16 +320,8 @@ async def get_subscription_info(
     """
     logger.info("Subscription info requested", user_id=current_user.id)
     
-    try:
-        subscription_info = await user_service.get_subscription_info(current_user.id)
-        return subscription_info
-        
-    except Exception as e:
-        logger.error("Failed to fetch subscription info", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch subscription information. Please try again."
-        )
+    subscription_info = await user_service.get_subscription_info(current_user.id)
+    return subscription_info
 
 
 @router.post(
@@ -261,6 +333,7 @@ async def get_subscription_info(
         402: {"model": ErrorResponse, "description": "Payment required"},
     }
 )
+@handle_service_errors("Subscription upgrade failed. Please try again.")
 async def upgrade_subscription(
     tier: SubscriptionTier,
     current_user: User = Depends(get_current_user),
@@ -274,27 +347,14 @@ async def upgrade_subscription(
     """
     logger.info("Subscription upgrade request", user_id=current_user.id, tier=tier)
     
-    try:
-        await user_service.upgrade_subscription(current_user.id, tier)
-        logger.info("Subscription upgraded successfully", user_id=current_user.id, tier=tier)
-        
-        return SuccessResponse(
-            success=True,
-            message=f"Successfully upgraded to {tier.value} plan"
-        )
-        
-    except ValueError as e:
-        logger.warning("Invalid subscription upgrade", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        logger.error("Subscription upgrade failed", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Subscription upgrade failed. Please try again."
-        )
+    await user_service.upgrade_subscription(current_user.id, tier)
+    await _invalidate_profile_cache(current_user.id)
+    logger.info("Subscription upgraded successfully", user_id=current_user.id, tier=tier)
+    
+    return SuccessResponse(
+        success=True,
+        message=f"Successfully upgraded to {TIER_STR[tier]} plan"
+    )
 
 
 @router.delete(
@@ -305,6 +365,7 @@ async def upgrade_subscription(
         400: {"model": ErrorResponse, "description": "Account deletion not allowed"},
     }
 )
+@handle_service_errors("Account deletion failed. Please try again.")
 async def delete_account(
     current_user: User = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service),
@@ -317,27 +378,14 @@ async def delete_account(
     """
     logger.info("Account deletion request", user_id=current_user.id)
     
-    try:
-        await user_service.delete_user(current_user.id)
-        logger.info("Account deleted successfully", user_id=current_user.id)
-        
-        return SuccessResponse(
-            success=True,
-            message="Account deleted successfully"
-        )
-        
-    except ValueError as e:
-        logger.warning("Account deletion denied", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        logger.error("Account deletion failed", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Account deletion failed. Please try again."
-        )
+    await user_service.delete_user(current_user.id)
+    await _invalidate_profile_cache(current_user.id)
+    logger.info("Account deleted successfully", user_id=current_user.id)
+    
+    return SuccessResponse(
+        success=True,
+        message="Account deleted successfully"
+    )
 
 
 @router.post(
@@ -345,6 +393,7 @@ async def delete_account(
     response_model=SuccessResponse,
     dependencies=[Depends(security)]
 )
+@handle_service_errors("Account deactivation failed. Please try again.", client_errors=())
 async def deactivate_account(
     current_user: User = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service),
@@ -357,21 +406,14 @@ async def deactivate_account(
     """
     logger.info("Account deactivation request", user_id=current_user.id)
     
-    try:
-        await user_service.deactivate_user(current_user.id)
-        logger.info("Account deactivated successfully", user_id=current_user.id)
-        
-        return SuccessResponse(
-            success=True,
-            message="Account deactivated successfully"
-        )
-        
-    except Exception as e:
-        logger.error("Account deactivation failed", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Account deactivation failed. Please try again."
-        )
+    await user_service.deactivate_user(current_user.id)
+    await _invalidate_profile_cache(current_user.id)
+    logger.info("Account deactivated successfully", user_id=current_user.id)
+    
+    return SuccessResponse(
+        success=True,
+        message="Account deactivated successfully"
+    )
 
 
 @router.post(
@@ -379,6 +421,7 @@ async def deactivate_account(
     response_model=SuccessResponse,
     dependencies=[Depends(security)]
 )
+@handle_service_errors("Account reactivation failed. Please try again.", client_errors=())
 async def reactivate_account(
     current_user: User = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service),
@@ -391,21 +434,14 @@ async def reactivate_account(
     """
     logger.info("Account reactivation request", user_id=current_user.id)
     
-    try:
-        await user_service.reactivate_user(current_user.id)
-        logger.info("Account reactivated successfully", user_id=current_user.id)
-        
-        return SuccessResponse(
-            success=True,
-            message="Account reactivated successfully"
-        )
-        
-    except Exception as e:
-        logger.error("Account reactivation failed", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Account reactivation failed. Please try again."
-        )
+    await user_service.reactivate_user(current_user.id)
+    await _invalidate_profile_cache(current_user.id)
+    logger.info("Account reactivated successfully", user_id=current_user.id)
+    
+    return SuccessResponse(
+        success=True,
+        message="Account reactivated successfully"
+    )
 
 
 @router.get(
@@ -415,7 +451,7 @@ async def reactivate_account(
 )
 async def get_connected_social_accounts(
     current_user: User = Depends(get_current_user),
-) -> dict:
+) -> ORJSONResponse:
     """
     Get list of connected social media accounts.
     
@@ -424,18 +460,21 @@ async def get_connected_social_accounts(
     """
     logger.info("Social accounts requested", user_id=current_user.id)
     
-    # Convert social accounts to serializable format
+    # Convert social accounts to serializable format; orjson handles the datetimes
     social_accounts = {}
+    total_connected = 0
     for platform, account in current_user.social_accounts.items():
-        social_accounts[platform.value] = {
+        social_accounts[PLATFORM_STR[platform]] = {
             "username": account.username,
             "account_id": account.account_id,
             "is_active": account.is_active,
-            "last_post_at": account.last_post_at.isoformat() if account.last_post_at else None,
-            "connected_at": account.token_expires_at.isoformat() if account.token_expires_at else None,
+            "last_post_at": account.last_post_at,
+            "connected_at": account.token_expires_at,
         }
+        if account.is_active:
+            total_connected += 1
     
-    return {
+    return ORJSONResponse(content={
         "connected_accounts": social_accounts,
-        "total_connected": len([acc for acc in current_user.social_accounts.values() if acc.is_active])
-    }
\ No newline at end of file
+        "total_connected": total_connected,
+    })
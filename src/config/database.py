@@ -5,77 +5,105 @@ This module handles Firestore database connections and provides
 database session management for the PostSync application.
 """
 
-from typing import Optional
+import asyncio
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
-import firebase_admin
-from firebase_admin import credentials, firestore
-from google.cloud import firestore as firestore_client
+import structlog
 
 from src.config.settings import get_settings
 
+if TYPE_CHECKING:
+    from google.cloud import firestore as firestore_client
+
+# Set once the default Firebase app exists, so later setups skip the probe
+_firebase_initialized = False
+
 
 class DatabaseManager:
-    """Singleton database manager for Firestore connections."""
-    
-    _instance: Optional["DatabaseManager"] = None
-    _db: Optional[firestore_client.Client] = None
-    
-    def __new__(cls) -> "DatabaseManager":
-        """Create singleton instance."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    """Database manager for Firestore connections, shared via get_db_manager()."""
     
     def __init__(self):
-        """Initialize database manager."""
-        if self._db is None:
-            self._initialize_firestore()
+        """Initialize database manager; Firestore is connected on first db access."""
+        self._db: Optional["firestore_client.AsyncClient"] = None
+        self._initialized = False
+        self._init_lock = threading.Lock()
+        self.logger = structlog.get_logger(__name__)
     
     def _initialize_firestore(self) -> None:
         """Initialize Firestore database connection."""
+        # The Firebase SDK pulls in grpc, protobuf and google-auth, so it is
+        # only imported once a database connection is actually needed
+        import firebase_admin
+        from firebase_admin import credentials
+        from google.cloud import firestore
+        
+        global _firebase_initialized
         settings = get_settings()
         
-        try:
-            # Check if Firebase app is already initialized
-            firebase_admin.get_app()
-        except ValueError:
-            # Initialize Firebase app if not already done
-            if settings.google_application_credentials:
-                cred = credentials.Certificate(settings.google_application_credentials)
-                firebase_admin.initialize_app(cred, {
-                    'projectId': settings.google_cloud_project,
-                })
-            else:
-                # For development, use a mock/test mode
-                try:
-                    firebase_admin.initialize_app()
-                except Exception:
-                    # If no credentials available, initialize with test credentials
-                    firebase_admin.initialize_app(options={
+        if not _firebase_initialized:
+            try:
+                # Check if Firebase app is already initialized by another caller
+                firebase_admin.get_app()
+            except ValueError:
+                # Initialize Firebase app if not already done
+                if settings.google_application_credentials:
+                    cred = credentials.Certificate(settings.google_application_credentials)
+                    firebase_admin.initialize_app(cred, {
                         'projectId': settings.google_cloud_project,
                     })
+                else:
+                    # For development, use a mock/test mode
+                    try:
+                        firebase_admin.initialize_app()
+                    except Exception:
+                        # If no credentials available, initialize with test credentials
+                        firebase_admin.initialize_app(options={
+                            'projectId': settings.google_cloud_project,
+                        })
+            _firebase_initialized = True
         
         try:
-            # Initialize Firestore client
-            self._db = firestore.client(database_id=settings.firestore_database_id)
+            # Initialize an async Firestore client from the Firebase app's
+            # credentials so queries don't block the event loop
+            app = firebase_admin.get_app()
+            project = app.project_id or settings.google_cloud_project
+            if not project:
+                raise ValueError("Project ID is required to access Firestore")
+            
+            self._db = firestore.AsyncClient(
+                project=project,
+                credentials=app.credential.get_credential(),
+                database=settings.firestore_database_id,
+            )
         except Exception as e:
             # If Firestore initialization fails, set to None for graceful handling
-            print(f"Warning: Firestore initialization failed: {e}")
-            print("Running in development mode without Firestore")
+            self.logger.warning(
+                "Firestore initialization failed, running in development mode without Firestore",
+                error=str(e)
+            )
             self._db = None
+        
+        # Don't retry on every db access; a failed setup stays in development mode
+        self._initialized = True
     
     @property
-    def db(self) -> Optional[firestore_client.Client]:
+    def db(self) -> Optional["firestore_client.AsyncClient"]:
         """Get Firestore database client."""
-        if self._db is None:
-            self._initialize_firestore()
+        if not self._initialized:
+            # The app initializes in prewarm() before serving, so only
+            # threads outside the event loop ever wait on this lock
+            with self._init_lock:
+                if not self._initialized:
+                    self._initialize_firestore()
         return self._db
     
-    def get_collection(self, collection_name: str) -> firestore_client.CollectionReference:
+    def get_collection(self, collection_name: str) -> "firestore_client.AsyncCollectionReference":
         """Get a Firestore collection reference."""
         return self.db.collection(collection_name)
     
-    def get_document(self, collection_name: str, document_id: str) -> firestore_client.DocumentReference:
+    def get_document(self, collection_name: str, document_id: str) -> "firestore_client.AsyncDocumentReference":
         """Get a Firestore document reference."""
         return self.db.collection(collection_name).document(document_id)
     
@@ -84,26 +112,35 @@ class DatabaseManager:
         try:
             # Try to read from a test collection
             test_ref = self.db.collection('health_check').limit(1)
-            list(test_ref.stream())
+            async for _ in test_ref.stream():
+                break
             return True
         except Exception:
             return False
 
 
-# Global database manager instance
-db_manager = DatabaseManager()
+@lru_cache(maxsize=1)
+def get_db_manager() -> DatabaseManager:
+    """Get the shared database manager, creating it on first call."""
+    return DatabaseManager()
+
+
+async def prewarm() -> None:
+    """Connect to Firestore in a worker thread, so the event loop never blocks on setup."""
+    manager = get_db_manager()
+    await asyncio.to_thread(lambda: manager.db)
 
 
-def get_database() -> firestore_client.Client:
+def get_database() -> "firestore_client.AsyncClient":
     """Get the Firestore database client."""
-    return db_manager.db
+    return get_db_manager().db
 
 
-def get_collection(collection_name: str) -> firestore_client.CollectionReference:
+def get_collection(collection_name: str) -> "firestore_client.AsyncCollectionReference":
     """Get a Firestore collection reference."""
-    return db_manager.get_collection(collection_name)
+    return get_db_manager().get_collection(collection_name)
 
 
-def get_document(collection_name: str, document_id: str) -> firestore_client.DocumentReference:
+def get_document(collection_name: str, document_id: str) -> "firestore_client.AsyncDocumentReference":
     """Get a Firestore document reference."""
-    return db_manager.get_document(collection_name, document_id)
\ No newline at end of file
+    return get_db_manager().get_document(collection_name, document_id)
\ No newline at end of file
@@ -0,0 +1,30 @@
+"""
+Redis Configuration and Connection Management
+
+This module provides the shared asyncio Redis client used for caching,
+rate limiting and other short-lived state in the PostSync application.
+"""
+
+from functools import lru_cache
+
+from redis.asyncio import Redis
+
+from src.config.settings import get_settings
+
+
+@lru_cache
+def get_redis() -> Redis:
+    """
+    Get the shared Redis client.
+
+    The client connects lazily on first command. Timeouts are kept short so
+    callers can treat Redis as an optimization and fall back to Firestore
+    when it is unavailable.
+    """
+    settings = get_settings()
+    return Redis.from_url(
+        settings.redis_url,
+        decode_responses=True,
+        socket_connect_timeout=0.5,
+        socket_timeout=0.5,
+    )
@@ -5,17 +5,152 @@ This module provides database operations for PostSync using Firestore,
 including CRUD operations for users, content, and analytics data.
 """
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+import hashlib
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 import structlog
+from cachetools import TTLCache
+from google.api_core.exceptions import AlreadyExists
 from google.cloud import firestore
-from google.cloud.firestore_v1 import FieldFilter, Query
+from google.cloud.firestore_v1 import AsyncQuery, FieldFilter, Query
 
 from src.config.database import get_database
-from src.models.analytics import PostAnalytics, UserAnalytics
-from src.models.content import ContentItem, ContentStatus
-from src.models.user import User
+from src.models.analytics import (
+    MetricPoint,
+    MetricType,
+    PlatformType as AnalyticsPlatform,
+    PostAnalytics,
+)
+from src.models.content import (
+    ContentItem,
+    ContentSource,
+    ContentStatus,
+    ContentTopic,
+    GeneratedPost,
+    PlatformType,
+    PublishingResult,
+    SourceContent,
+)
+from src.models.user import (
+    ContentPreferences,
+    SocialMediaAccount,
+    SocialPlatform,
+    SubscriptionTier,
+    User,
+    UserRole,
+    UserStats,
+)
+from src.utils.error_handling import ValidationError
+
+# Fields read by content list queries; everything ContentResponse needs and
+# nothing else (approval and priority fields fall back to model defaults)
+CONTENT_LIST_FIELDS = [
+    "user_id",
+    "status",
+    "source_content",
+    "generated_posts",
+    "publishing_results",
+    "scheduled_for",
+    "created_at",
+    "updated_at",
+]
+
+# Seconds an opted-in (use_cache) document read may be stale. Writes evict
+# only this process's copy, so reads that drive a write never use the cache.
+READ_CACHE_TTL = 30
+
+# Maximum in-flight writes for batch_write_unordered
+UNORDERED_WRITE_CONCURRENCY = 50
+
+# Documents read per page when deleting old data
+CLEANUP_PAGE_SIZE = 500
+
+# Timestamps set by the server on create, so never serialized from the model
+SERVER_TIMESTAMP_FIELDS = {"created_at", "updated_at"}
+
+
+@dataclass(slots=True, frozen=True)
+class ScheduledContent:
+    """A content item due for publishing, with just what's needed to dispatch it."""
+    
+    content_id: str
+    user_id: str
+    scheduled_for: datetime
+    platforms: List[str]
+
+
+# Documents read back from Firestore were validated when they were written,
+# so they are rebuilt with model_construct. That skips validation, so nested
+# models and enum fields have to be rebuilt by hand.
+
+def _build_user(data: Dict[str, Any]) -> User:
+    """Build a User from a stored document without re-validating it."""
+    data = dict(data)
+    if "role" in data:
+        data["role"] = UserRole(data["role"])
+    if "subscription_tier" in data:
+        data["subscription_tier"] = SubscriptionTier(data["subscription_tier"])
+    if isinstance(data.get("content_preferences"), dict):
+        preferences = dict(data["content_preferences"])
+        if "platforms" in preferences:
+            preferences["platforms"] = [SocialPlatform(p) for p in preferences["platforms"]]
+        data["content_preferences"] = ContentPreferences.model_construct(**preferences)
+    if data.get("social_accounts"):
+        data["social_accounts"] = {
+            SocialPlatform(platform): SocialMediaAccount.model_construct(
+                **{**account, "platform": SocialPlatform(account["platform"])}
+            )
+            for platform, account in data["social_accounts"].items()
+        }
+    if isinstance(data.get("stats"), dict):
+        data["stats"] = UserStats.model_construct(**data["stats"])
+    return User.model_construct(**data)
+
+
+def _build_content(data: Dict[str, Any]) -> ContentItem:
+    """Build a ContentItem from a stored document without re-validating it."""
+    data = dict(data)
+    if "status" in data:
+        data["status"] = ContentStatus(data["status"])
+    if isinstance(data.get("source_content"), dict):
+        source = dict(data["source_content"])
+        source["source"] = ContentSource(source["source"])
+        if "topics" in source:
+            source["topics"] = [ContentTopic(t) for t in source["topics"]]
+        data["source_content"] = SourceContent.model_construct(**source)
+    if data.get("generated_posts"):
+        data["generated_posts"] = {
+            PlatformType(platform): GeneratedPost.model_construct(
+                **{**post, "platform": PlatformType(post["platform"])}
+            )
+            for platform, post in data["generated_posts"].items()
+        }
+    if data.get("publishing_results"):
+        data["publishing_results"] = {
+            PlatformType(platform): PublishingResult.model_construct(
+                **{**result, "platform": PlatformType(result["platform"])}
+            )
+            for platform, result in data["publishing_results"].items()
+        }
+    return ContentItem.model_construct(**data)
+
+
+def _build_analytics(data: Dict[str, Any]) -> PostAnalytics:
+    """Build a PostAnalytics from a stored document without re-validating it."""
+    data = dict(data)
+    if "platform" in data:
+        data["platform"] = AnalyticsPlatform(data["platform"])
+    if data.get("metrics_history"):
+        data["metrics_history"] = {
+            MetricType(metric): [MetricPoint.model_construct(**point) for point in points]
+            for metric, points in data["metrics_history"].items()
+        }
+    return PostAnalytics.model_construct(**data)
 
 
 class FirestoreClient:
@@ -28,19 +163,40 @@ class FirestoreClient:
         
         # Collection names
         self.users_collection = "users"
+        self.user_emails_collection = "user_emails"
         self.content_collection = "content"
         self.analytics_collection = "analytics"
         self.posts_collection = "posts"
         self.jobs_collection = "jobs"
         
-        # In-memory storage for development mode
-        self._mock_storage = {
-            "users": {},
-            "content": {},
-            "analytics": {},
-            "posts": {},
-            "jobs": {}
+        # Collection references are reused rather than rebuilt on every call
+        if self.db is not None:
+            self._users = self.db.collection(self.users_collection)
+            self._user_emails = self.db.collection(self.user_emails_collection)
+            self._content = self.db.collection(self.content_collection)
+            self._analytics = self.db.collection(self.analytics_collection)
+        
+        # Short-lived caches for hot single-document reads
+        self._user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=READ_CACHE_TTL)
+        self._content_cache: TTLCache = TTLCache(maxsize=10_000, ttl=READ_CACHE_TTL)
+        self._analytics_cache: TTLCache = TTLCache(maxsize=10_000, ttl=READ_CACHE_TTL)
+        self._read_caches = {
+            self.users_collection: self._user_cache,
+            self.content_collection: self._content_cache,
+            self.analytics_collection: self._analytics_cache,
         }
+        
+        # In-memory storage for development mode; a collection's dict is
+        # created the first time it is touched, and never in production
+        self._mock_storage: Dict[str, Dict[str, Any]] = (
+            defaultdict(dict) if self.db is None else {}
+        )
+    
+    def _evict_cached(self, collection: str, document_id: str) -> None:
+        """Drop a document from the read cache after writing to it."""
+        cache = self._read_caches.get(collection)
+        if cache is not None:
+            cache.pop(document_id, None)
     
     # User Operations
     async def create_user(self, user: User) -> User:
@@ -48,21 +204,25 @@ class FirestoreClient:
         try:
             if self.db is None:
                 # Development mode: use in-memory storage
-                user_dict = user.dict()
-                user_dict["created_at"] = datetime.utcnow().isoformat()
-                user_dict["updated_at"] = datetime.utcnow().isoformat()
+                user_dict = user.model_dump(exclude=SERVER_TIMESTAMP_FIELDS)
+                # Stored as datetimes, like Firestore timestamps are read back
+                now = datetime.utcnow()
+                user_dict["created_at"] = now
+                user_dict["updated_at"] = now
                 
                 self._mock_storage["users"][user.id] = user_dict
+                self._mock_storage["users_by_email"][user.email] = user.id
                 self.logger.info("User created in mock storage", user_id=user.id)
                 return user
             
             # Production mode: use Firestore
-            user_dict = user.dict()
+            user_dict = user.model_dump(exclude=SERVER_TIMESTAMP_FIELDS)
             user_dict["created_at"] = firestore.SERVER_TIMESTAMP
             user_dict["updated_at"] = firestore.SERVER_TIMESTAMP
             
-            doc_ref = self.db.collection(self.users_collection).document(user.id)
-            doc_ref.set(user_dict)
+            doc_ref = self._users.document(user.id)
+            await doc_ref.set(user_dict)
+            self._evict_cached(self.users_collection, user.id)
             
             self.logger.info("User created in Firestore", user_id=user.id)
             return user
@@ -71,24 +231,76 @@ class FirestoreClient:
             self.logger.error("Failed to create user", user_id=user.id, error=str(e))
             raise
     
-    async def get_user(self, user_id: str) -> Optional[User]:
-        """Get user by ID from Firestore."""
+    def _user_email_ref(self, email: str) -> firestore.AsyncDocumentReference:
+        """Get the email uniqueness marker document for an address."""
+        email_key = hashlib.sha256(email.lower().encode("utf-8")).hexdigest()
+        return self._user_emails.document(email_key)
+    
+    async def create_user_if_absent(self, user: User) -> Optional[User]:
+        """
+        Create a user unless the email is already registered.
+        
+        The user document and its email marker are committed in one batch;
+        the marker's create() fails if the email is taken, which aborts the
+        whole write.
+        """
+        try:
+            if self.db is None:
+                # Development mode: use in-memory storage
+                if user.email in self._mock_storage["users_by_email"]:
+                    return None
+                return await self.create_user(user)
+            
+            # Production mode: use Firestore
+            user_dict = user.model_dump(exclude=SERVER_TIMESTAMP_FIELDS)
+            user_dict["created_at"] = firestore.SERVER_TIMESTAMP
+            user_dict["updated_at"] = firestore.SERVER_TIMESTAMP
+            
+            batch = self.db.batch()
+            batch.create(self._user_email_ref(user.email), {"user_id": user.id})
+            batch.set(self._users.document(user.id), user_dict)
+            await batch.commit()
+            self._evict_cached(self.users_collection, user.id)
+            
+            self.logger.info("User created in Firestore", user_id=user.id)
+            return user
+            
+        except AlreadyExists:
+            return None
+        except Exception as e:
+            self.logger.error("Failed to create user", user_id=user.id, error=str(e))
+            raise
+    
+    async def get_user(self, user_id: str, use_cache: bool = False) -> Optional[User]:
+        """
+        Get user by ID from Firestore.
+        
+        use_cache allows a read up to READ_CACHE_TTL seconds old; only pass it
+        for reads whose result is displayed, never for ones that drive a write.
+        """
         try:
             if self.db is None:
                 # Development mode: use in-memory storage
                 user_data = self._mock_storage["users"].get(user_id)
                 if user_data:
-                    return User(**user_data)
+                    return _build_user(user_data)
                 return None
             
             # Production mode: use Firestore
-            doc_ref = self.db.collection(self.users_collection).document(user_id)
-            doc = doc_ref.get()
+            if use_cache:
+                cached = self._user_cache.get(user_id)
+                if cached is not None:
+                    return cached.model_copy(deep=True)
+            
+            doc_ref = self._users.document(user_id)
+            doc = await doc_ref.get()
             
             if doc.exists:
                 user_data = doc.to_dict()
                 user_data["id"] = doc.id
-                return User(**user_data)
+                user = _build_user(user_data)
+                self._user_cache[user_id] = user
+                return user.model_copy(deep=True)
             else:
                 return None
                 
@@ -96,40 +308,85 @@ class FirestoreClient:
             self.logger.error("Failed to get user", user_id=user_id, error=str(e))
             return None
     
-    async def get_user_by_email(self, email: str) -> Optional[User]:
-        """Get user by email from Firestore."""
+    async def get_user_by_email(
+        self, email: str, id_only: bool = False
+    ) -> Optional[Union[User, str]]:
+        """
+        Get user by email from Firestore.
+        
+        With id_only, only the matching document ID is fetched and returned,
+        which is enough for existence checks.
+        """
         try:
             if self.db is None:
                 # Development mode: use in-memory storage
-                for user_data in self._mock_storage["users"].values():
-                    if user_data.get("email") == email:
-                        return User(**user_data)
-                return None
+                user_id = self._mock_storage["users_by_email"].get(email)
+                if user_id is None or id_only:
+                    return user_id
+                return _build_user(self._mock_storage["users"][user_id])
             
             # Production mode: use Firestore
-            query = self.db.collection(self.users_collection).where(
+            query = self._users.where(
                 filter=FieldFilter("email", "==", email)
             ).limit(1)
+            if id_only:
+                query = query.select([])
             
-            docs = query.stream()
-            for doc in docs:
+            async for doc in query.stream():
+                if id_only:
+                    return doc.id
                 user_data = doc.to_dict()
                 user_data["id"] = doc.id
-                return User(**user_data)
+                return _build_user(user_data)
             
             return None
             
         except Exception as e:
             self.logger.error("Failed to get user by email", email=email, error=str(e))
             return None
-    
-    async def update_user(self, user_id: str, updates: Dict[str, Any]) -> Optional[User]:
-        """Update user in Firestore."""
+
+    async def get_all_user_emails(self) -> List[str]:
+        """Get the email address of every registered user."""
         try:
-            updates["updated_at"] = firestore.SERVER_TIMESTAMP
+            if self.db is None:
+                # Development mode: use in-memory storage
+                return [
+                    user_data["email"]
+                    for user_data in self._mock_storage["users"].values()
+                    if user_data.get("email")
+                ]
+
+            # Production mode: use Firestore
+            query = self._users.select(["email"])
+            return [
+                doc.get("email") async for doc in query.stream() if doc.get("email")
+            ]
+
+        except Exception as e:
+            self.logger.error("Failed to get user emails", error=str(e))
+            return []
+
+    async def update_user(
+        self, user_id: str, updates: Dict[str, Any], current: Optional[User] = None
+    ) -> Optional[User]:
+        """
+        Update user in Firestore.
+        
+        When the caller passes the current user, the result is merged locally
+        instead of being read back from Firestore.
+        """
+        try:
+            doc_ref = self._users.document(user_id)
             
-            doc_ref = self.db.collection(self.users_collection).document(user_id)
-            doc_ref.update(updates)
+            if current is not None:
+                updates["updated_at"] = datetime.utcnow()
+                await doc_ref.update(updates)
+                self._evict_cached(self.users_collection, user_id)
+                return User(**{**current.model_dump(), **updates})
+            
+            updates["updated_at"] = firestore.SERVER_TIMESTAMP
+            await doc_ref.update(updates)
+            self._evict_cached(self.users_collection, user_id)
             
             # Return updated user
             return await self.get_user(user_id)
@@ -138,12 +395,40 @@ class FirestoreClient:
             self.logger.error("Failed to update user", user_id=user_id, error=str(e))
             return None
     
+    async def record_login(self, user_id: str, login_at: datetime) -> bool:
+        """Record a user's login time without reading the document back."""
+        try:
+            if self.db is None:
+                # Development mode: use in-memory storage
+                user_data = self._mock_storage["users"].get(user_id)
+                if user_data is None:
+                    return False
+                user_data["last_login_at"] = user_data["updated_at"] = login_at
+                return True
+            
+            # Production mode: use Firestore
+            doc_ref = self._users.document(user_id)
+            await doc_ref.update({"last_login_at": login_at, "updated_at": login_at})
+            self._evict_cached(self.users_collection, user_id)
+            return True
+            
+        except Exception as e:
+            self.logger.error("Failed to record login", user_id=user_id, error=str(e))
+            return False
+    
     async def delete_user(self, user_id: str) -> bool:
         """Delete user from Firestore."""
         try:
-            # Delete user document
-            doc_ref = self.db.collection(self.users_collection).document(user_id)
-            doc_ref.delete()
+            # Delete user document and its email marker
+            doc_ref = self._users.document(user_id)
+            doc = await doc_ref.get()
+            
+            batch = self.db.batch()
+            if doc.exists and doc.get("email"):
+                batch.delete(self._user_email_ref(doc.get("email")))
+            batch.delete(doc_ref)
+            await batch.commit()
+            self._evict_cached(self.users_collection, user_id)
             
             # TODO: Also delete related content and analytics
             
@@ -158,12 +443,13 @@ class FirestoreClient:
     async def create_content_item(self, content: ContentItem) -> ContentItem:
         """Create a new content item in Firestore."""
         try:
-            content_dict = content.dict()
+            content_dict = content.model_dump(exclude=SERVER_TIMESTAMP_FIELDS)
             content_dict["created_at"] = firestore.SERVER_TIMESTAMP
             content_dict["updated_at"] = firestore.SERVER_TIMESTAMP
             
-            doc_ref = self.db.collection(self.content_collection).document(content.id)
-            doc_ref.set(content_dict)
+            doc_ref = self._content.document(content.id)
+            await doc_ref.set(content_dict)
+            self._evict_cached(self.content_collection, content.id)
             
             self.logger.info("Content item created in Firestore", content_id=content.id)
             return content
@@ -172,16 +458,30 @@ class FirestoreClient:
             self.logger.error("Failed to create content item", content_id=content.id, error=str(e))
             raise
     
-    async def get_content_item(self, content_id: str) -> Optional[ContentItem]:
-        """Get content item by ID from Firestore."""
+    async def get_content_item(
+        self, content_id: str, use_cache: bool = False
+    ) -> Optional[ContentItem]:
+        """
+        Get content item by ID from Firestore.
+        
+        use_cache allows a read up to READ_CACHE_TTL seconds old; status checks
+        before a state transition must read fresh.
+        """
         try:
-            doc_ref = self.db.collection(self.content_collection).document(content_id)
-            doc = doc_ref.get()
+            if use_cache:
+                cached = self._content_cache.get(content_id)
+                if cached is not None:
+                    return cached.model_copy(deep=True)
+            
+            doc_ref = self._content.document(content_id)
+            doc = await doc_ref.get()
             
             if doc.exists:
                 content_data = doc.to_dict()
                 content_data["id"] = doc.id
-                return ContentItem(**content_data)
+                content_item = _build_content(content_data)
+                self._content_cache[content_id] = content_item
+                return content_item.model_copy(deep=True)
             else:
                 return None
                 
@@ -189,6 +489,48 @@ class FirestoreClient:
             self.logger.error("Failed to get content item", content_id=content_id, error=str(e))
             return None
     
+    async def _user_content_query(
+        self,
+        user_id: str,
+        status: Optional[ContentStatus],
+        topic: Optional[ContentTopic],
+        limit: int,
+        offset: int,
+        order_by: str,
+        descending: bool,
+        start_after: Optional[str] = None
+    ) -> AsyncQuery:
+        """
+        Build a projected content list query for a user.
+        
+        Filters are applied server-side and served by the composite indexes
+        in firestore.indexes.json. When start_after names a content item, the
+        page starts after it and offset is ignored, so Firestore doesn't read
+        and bill every skipped document.
+        """
+        query = self._content.where(
+            filter=FieldFilter("user_id", "==", user_id)
+        )
+        
+        if status:
+            query = query.where(filter=FieldFilter("status", "==", status.value))
+        
+        if topic:
+            query = query.where(
+                filter=FieldFilter("source_content.topics", "array_contains", topic.value)
+            )
+        
+        direction = Query.DESCENDING if descending else Query.ASCENDING
+        query = query.select(CONTENT_LIST_FIELDS).order_by(order_by, direction=direction)
+        
+        if start_after:
+            cursor = await self._content.document(start_after).get()
+            if not cursor.exists or cursor.get("user_id") != user_id:
+                raise ValidationError(f"Unknown content cursor: {start_after}", field="cursor")
+            return query.start_after(cursor).limit(limit)
+        
+        return query.offset(offset).limit(limit)
+    
     async def get_user_content(
         self,
         user_id: str,
@@ -196,45 +538,52 @@ class FirestoreClient:
         limit: int = 50,
         offset: int = 0,
         order_by: str = "created_at",
-        descending: bool = True
+        descending: bool = True,
+        topic: Optional[ContentTopic] = None,
+        start_after: Optional[str] = None
     ) -> List[ContentItem]:
         """Get content items for a user with filtering and pagination."""
         try:
-            query = self.db.collection(self.content_collection).where(
-                filter=FieldFilter("user_id", "==", user_id)
+            query = await self._user_content_query(
+                user_id, status, topic, limit, offset, order_by, descending, start_after
             )
             
-            if status:
-                query = query.where(filter=FieldFilter("status", "==", status.value))
-            
-            # Add ordering
-            direction = Query.DESCENDING if descending else Query.ASCENDING
-            query = query.order_by(order_by, direction=direction)
-            
-            # Add pagination
-            query = query.offset(offset).limit(limit)
-            
             content_items = []
-            for doc in query.stream():
+            async for doc in query.stream():
                 content_data = doc.to_dict()
                 content_data["id"] = doc.id
-                content_items.append(ContentItem(**content_data))
+                content_items.append(_build_content(content_data))
             
             return content_items
             
         except Exception as e:
             self.logger.error("Failed to get user content", user_id=user_id, error=str(e))
-            return []
+            raise
     
     async def update_content_item(
-        self, content_id: str, updates: Dict[str, Any]
+        self,
+        content_id: str,
+        updates: Dict[str, Any],
+        current: Optional[ContentItem] = None
     ) -> Optional[ContentItem]:
-        """Update content item in Firestore."""
+        """
+        Update content item in Firestore.
+        
+        When the caller passes the current item, the result is merged locally
+        instead of being read back from Firestore.
+        """
         try:
-            updates["updated_at"] = firestore.SERVER_TIMESTAMP
+            doc_ref = self._content.document(content_id)
             
-            doc_ref = self.db.collection(self.content_collection).document(content_id)
-            doc_ref.update(updates)
+            if current is not None:
+                updates["updated_at"] = datetime.utcnow()
+                await doc_ref.update(updates)
+                self._evict_cached(self.content_collection, content_id)
+                return ContentItem(**{**current.model_dump(), **updates})
+            
+            updates["updated_at"] = firestore.SERVER_TIMESTAMP
+            await doc_ref.update(updates)
+            self._evict_cached(self.content_collection, content_id)
             
             # Return updated content
             return await self.get_content_item(content_id)
@@ -246,8 +595,9 @@ class FirestoreClient:
     async def delete_content_item(self, content_id: str) -> bool:
         """Delete content item from Firestore."""
         try:
-            doc_ref = self.db.collection(self.content_collection).document(content_id)
-            doc_ref.delete()
+            doc_ref = self._content.document(content_id)
+            await doc_ref.delete()
+            self._evict_cached(self.content_collection, content_id)
             
             self.logger.info("Content item deleted from Firestore", content_id=content_id)
             return True
@@ -256,20 +606,29 @@ class FirestoreClient:
             self.logger.error("Failed to delete content item", content_id=content_id, error=str(e))
             return False
     
-    async def get_content_by_source_id(self, source_id: str, source: str) -> Optional[ContentItem]:
-        """Get content item by source ID to check for duplicates."""
+    async def get_content_by_source_id(
+        self, source_id: str, source: str, id_only: bool = False
+    ) -> Optional[Union[ContentItem, str]]:
+        """
+        Get content item by source ID to check for duplicates.
+        
+        With id_only, only the matching document ID is fetched and returned.
+        """
         try:
-            query = self.db.collection(self.content_collection).where(
+            query = self._content.where(
                 filter=FieldFilter("source_content.source_id", "==", source_id)
             ).where(
                 filter=FieldFilter("source_content.source", "==", source)
             ).limit(1)
+            if id_only:
+                query = query.select([])
             
-            docs = query.stream()
-            for doc in docs:
+            async for doc in query.stream():
+                if id_only:
+                    return doc.id
                 content_data = doc.to_dict()
                 content_data["id"] = doc.id
-                return ContentItem(**content_data)
+                return _build_content(content_data)
             
             return None
             
@@ -286,12 +645,13 @@ class FirestoreClient:
     async def create_post_analytics(self, analytics: PostAnalytics) -> PostAnalytics:
         """Create post analytics record in Firestore."""
         try:
-            analytics_dict = analytics.dict()
+            analytics_dict = analytics.model_dump(exclude=SERVER_TIMESTAMP_FIELDS)
             analytics_dict["created_at"] = firestore.SERVER_TIMESTAMP
             analytics_dict["updated_at"] = firestore.SERVER_TIMESTAMP
             
-            doc_ref = self.db.collection(self.analytics_collection).document(analytics.post_id)
-            doc_ref.set(analytics_dict)
+            doc_ref = self._analytics.document(analytics.post_id)
+            await doc_ref.set(analytics_dict)
+            self._evict_cached(self.analytics_collection, analytics.post_id)
             
             self.logger.info("Post analytics created in Firestore", post_id=analytics.post_id)
             return analytics
@@ -304,15 +664,27 @@ class FirestoreClient:
             )
             raise
     
-    async def get_post_analytics(self, post_id: str) -> Optional[PostAnalytics]:
-        """Get post analytics by post ID from Firestore."""
+    async def get_post_analytics(
+        self, post_id: str, use_cache: bool = False
+    ) -> Optional[PostAnalytics]:
+        """
+        Get post analytics by post ID from Firestore.
+        
+        use_cache allows a read up to READ_CACHE_TTL seconds old.
+        """
         try:
-            doc_ref = self.db.collection(self.analytics_collection).document(post_id)
-            doc = doc_ref.get()
+            if use_cache:
+                cached = self._analytics_cache.get(post_id)
+                if cached is not None:
+                    return cached.model_copy(deep=True)
+            
+            doc_ref = self._analytics.document(post_id)
+            doc = await doc_ref.get()
             
             if doc.exists:
-                analytics_data = doc.to_dict()
-                return PostAnalytics(**analytics_data)
+                analytics = _build_analytics(doc.to_dict())
+                self._analytics_cache[post_id] = analytics
+                return analytics.model_copy(deep=True)
             else:
                 return None
                 
@@ -321,14 +693,29 @@ class FirestoreClient:
             return None
     
     async def update_post_analytics(
-        self, post_id: str, updates: Dict[str, Any]
+        self,
+        post_id: str,
+        updates: Dict[str, Any],
+        current: Optional[PostAnalytics] = None
     ) -> Optional[PostAnalytics]:
-        """Update post analytics in Firestore."""
+        """
+        Update post analytics in Firestore.
+        
+        When the caller passes the current analytics, the result is merged
+        locally instead of being read back from Firestore.
+        """
         try:
-            updates["updated_at"] = firestore.SERVER_TIMESTAMP
+            doc_ref = self._analytics.document(post_id)
             
-            doc_ref = self.db.collection(self.analytics_collection).document(post_id)
-            doc_ref.update(updates)
+            if current is not None:
+                updates["updated_at"] = datetime.utcnow()
+                await doc_ref.update(updates)
+                self._evict_cached(self.analytics_collection, post_id)
+                return PostAnalytics(**{**current.model_dump(), **updates})
+            
+            updates["updated_at"] = firestore.SERVER_TIMESTAMP
+            await doc_ref.update(updates)
+            self._evict_cached(self.analytics_collection, post_id)
             
             # Return updated analytics
             return await self.get_post_analytics(post_id)
@@ -344,8 +731,20 @@ class FirestoreClient:
         end_date: datetime
     ) -> List[PostAnalytics]:
         """Get analytics data for a user within date range."""
+        return [
+            analytics
+            async for analytics in self.iter_user_analytics_data(user_id, start_date, end_date)
+        ]
+    
+    async def iter_user_analytics_data(
+        self,
+        user_id: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> AsyncIterator[PostAnalytics]:
+        """Yield a user's analytics within a date range as they are read."""
         try:
-            query = self.db.collection(self.analytics_collection).where(
+            query = self._analytics.where(
                 filter=FieldFilter("user_id", "==", user_id)
             ).where(
                 filter=FieldFilter("first_tracked_at", ">=", start_date)
@@ -353,12 +752,8 @@ class FirestoreClient:
                 filter=FieldFilter("first_tracked_at", "<=", end_date)
             )
             
-            analytics_list = []
-            for doc in query.stream():
-                analytics_data = doc.to_dict()
-                analytics_list.append(PostAnalytics(**analytics_data))
-            
-            return analytics_list
+            async for doc in query.stream():
+                yield _build_analytics(doc.to_dict())
             
         except Exception as e:
             self.logger.error(
@@ -366,7 +761,7 @@ class FirestoreClient:
                 user_id=user_id,
                 error=str(e)
             )
-            return []
+            raise
     
     # Utility Operations
     async def batch_write(self, operations: List[Dict[str, Any]]) -> bool:
@@ -389,7 +784,9 @@ class FirestoreClient:
                 elif op_type == "delete":
                     batch.delete(doc_ref)
             
-            batch.commit()
+            await batch.commit()
+            for operation in operations:
+                self._evict_cached(operation["collection"], operation["document_id"])
             self.logger.info("Batch write completed", operations_count=len(operations))
             return True
             
@@ -397,12 +794,56 @@ class FirestoreClient:
             self.logger.error("Batch write failed", error=str(e))
             return False
     
+    async def batch_write_unordered(self, operations: List[Dict[str, Any]]) -> int:
+        """
+        Perform write operations as independent, concurrent writes.
+        
+        Unlike batch_write this is not atomic, but it avoids the cross-server
+        commit of a WriteBatch, so it suits bulk work where each write stands
+        alone. Returns the number of operations that succeeded.
+        """
+        semaphore = asyncio.Semaphore(UNORDERED_WRITE_CONCURRENCY)
+        
+        async def write(operation: Dict[str, Any]) -> None:
+            op_type = operation["type"]
+            doc_ref = self.db.collection(operation["collection"]).document(
+                operation["document_id"]
+            )
+            
+            async with semaphore:
+                if op_type == "set":
+                    await doc_ref.set(operation.get("data", {}))
+                elif op_type == "update":
+                    await doc_ref.update(operation.get("data", {}))
+                elif op_type == "delete":
+                    await doc_ref.delete()
+            
+            self._evict_cached(operation["collection"], operation["document_id"])
+        
+        results = await asyncio.gather(
+            *(write(operation) for operation in operations), return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, Exception)]
+        
+        if errors:
+            self.logger.error(
+                "Unordered batch write had failures",
+                operations_count=len(operations),
+                failed_count=len(errors),
+                error=str(errors[0])
+            )
+        else:
+            self.logger.info("Unordered batch write completed", operations_count=len(operations))
+        
+        return len(operations) - len(errors)
+    
     async def health_check(self) -> bool:
         """Check Firestore connection health."""
         try:
             # Try to read from a test collection
             test_ref = self.db.collection("health_check").limit(1)
-            list(test_ref.stream())
+            async for _ in test_ref.stream():
+                break
             return True
             
         except Exception as e:
@@ -412,24 +853,38 @@ class FirestoreClient:
     async def cleanup_old_data(self, days: int = 90) -> int:
         """Clean up old data from Firestore."""
         try:
-            cutoff_date = datetime.utcnow().timestamp() - (days * 24 * 60 * 60)
+            cutoff_date = datetime.utcnow() - timedelta(days=days)
             
-            # Clean up old content items
-            query = self.db.collection(self.content_collection).where(
+            # Clean up old content items, reading only what the cursor needs
+            query = self._content.where(
                 filter=FieldFilter("created_at", "<", cutoff_date)
             ).where(
                 filter=FieldFilter("status", "in", ["failed", "rejected"])
-            )
+            ).select(["created_at"]).limit(CLEANUP_PAGE_SIZE)
             
             deleted_count = 0
-            batch = self.db.batch()
-            
-            for doc in query.limit(500).stream():
-                batch.delete(doc.reference)
-                deleted_count += 1
+            page_query = query
+            while True:
+                docs = [doc async for doc in page_query.stream()]
+                if not docs:
+                    break
+                
+                # Deletions are independent, so they don't need an atomic batch
+                deleted_count += await self.batch_write_unordered([
+                    {
+                        "type": "delete",
+                        "collection": self.content_collection,
+                        "document_id": doc.id,
+                    }
+                    for doc in docs
+                ])
+                
+                if len(docs) < CLEANUP_PAGE_SIZE:
+                    break
+                # Page past the last document so failed deletes aren't re-read forever
+                page_query = query.start_after(docs[-1])
             
             if deleted_count > 0:
-                batch.commit()
                 self.logger.info("Old data cleaned up", deleted_count=deleted_count)
             
             return deleted_count
@@ -438,41 +893,48 @@ class FirestoreClient:
             self.logger.error("Data cleanup failed", error=str(e))
             return 0
 
-    async def get_scheduled_content(self, current_time: datetime) -> List[ContentItem]:
-        """Get content items that are scheduled for publishing at or before the current time."""
+    async def get_scheduled_content(self, current_time: datetime) -> List[ScheduledContent]:
+        """
+        Get content that is scheduled for publishing at or before the current time.
+        
+        Only the fields needed to dispatch each item are read; the publisher
+        loads the full item when it actually publishes it.
+        """
         try:
             if self.db is None:
                 # Development mode: use in-memory storage
                 scheduled_items = []
                 for content_id, content_data in self._mock_storage["content"].items():
-                    content = ContentItem(**content_data)
-                    if (content.status == ContentStatus.SCHEDULED and 
-                        content.scheduled_at and 
-                        content.scheduled_at <= current_time):
-                        scheduled_items.append(content)
+                    scheduled_for = content_data.get("scheduled_for")
+                    if (content_data.get("status") == ContentStatus.SCHEDULED.value and
+                        scheduled_for and
+                        scheduled_for <= current_time):
+                        scheduled_items.append(ScheduledContent(
+                            content_id=content_id,
+                            user_id=content_data["user_id"],
+                            scheduled_for=scheduled_for,
+                            platforms=content_data.get("scheduled_platforms") or [],
+                        ))
                 return scheduled_items
             
             # Production mode: query Firestore
-            query = self.db.collection(self.content_collection).where(
+            query = self._content.where(
                 filter=FieldFilter("status", "==", ContentStatus.SCHEDULED.value)
             ).where(
-                filter=FieldFilter("scheduled_at", "<=", current_time)
-            ).order_by("scheduled_at", direction=firestore.Query.ASCENDING)
-            
-            content_items = []
-            for doc in query.stream():
-                content_data = doc.to_dict()
-                content_data["id"] = doc.id
-                
-                # Convert Firestore timestamps to datetime
-                if "created_at" in content_data and hasattr(content_data["created_at"], 'seconds'):
-                    content_data["created_at"] = datetime.fromtimestamp(content_data["created_at"].seconds)
-                if "scheduled_at" in content_data and hasattr(content_data["scheduled_at"], 'seconds'):
-                    content_data["scheduled_at"] = datetime.fromtimestamp(content_data["scheduled_at"].seconds)
-                
-                content_items.append(ContentItem(**content_data))
-            
-            return content_items
+                filter=FieldFilter("scheduled_for", "<=", current_time)
+            ).order_by(
+                "scheduled_for", direction=firestore.Query.ASCENDING
+            ).select(["user_id", "scheduled_for", "scheduled_platforms"])
+            
+            return [
+                ScheduledContent(
+                    content_id=doc.id,
+                    user_id=doc.get("user_id"),
+                    scheduled_for=doc.get("scheduled_for"),
+                    platforms=(doc.to_dict() or {}).get("scheduled_platforms") or [],
+                )
+                async for doc in query.stream()
+            ]
             
         except Exception as e:
             self.logger.error(
@@ -483,41 +945,52 @@ class FirestoreClient:
             return []
 
 
-# Global Firestore client instance
-firestore_client = FirestoreClient()
+@lru_cache(maxsize=1)
+def get_firestore_client() -> FirestoreClient:
+    """Get the shared Firestore client, connecting on first call."""
+    return FirestoreClient()
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the legacy `firestore_client` global through get_firestore_client()."""
+    if name == "firestore_client":
+        return get_firestore_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Convenience functions
 async def create_user(user: User) -> User:
     """Create a new user."""
-    return await firestore_client.create_user(user)
+    return await get_firestore_client().create_user(user)
 
 
 async def get_user_by_id(user_id: str) -> Optional[User]:
     """Get user by ID."""
-    return await firestore_client.get_user(user_id)
+    return await get_firestore_client().get_user(user_id)
 
 
-async def get_user_by_email(email: str) -> Optional[User]:
-    """Get user by email."""
-    return await firestore_client.get_user_by_email(email)
+async def get_user_by_email(email: str, id_only: bool = False) -> Optional[Union[User, str]]:
+    """Get user by email, or just its ID with id_only."""
+    return await get_firestore_client().get_user_by_email(email, id_only=id_only)
 
 
-async def update_user(user_id: str, updates: Dict[str, Any]) -> Optional[User]:
+async def update_user(
+    user_id: str, updates: Dict[str, Any], current: Optional[User] = None
+) -> Optional[User]:
     """Update user."""
-    return await firestore_client.update_user(user_id, updates)
+    return await get_firestore_client().update_user(user_id, updates, current)
 
 
 async def delete_user(user_id: str) -> bool:
     """Delete user."""
-    return await firestore_client.delete_user(user_id)
+    return await get_firestore_client().delete_user(user_id)
 
 
 async def create_content_item(content: ContentItem) -> ContentItem:
     """Create content item."""
-    return await firestore_client.create_content_item(content)
+    return await get_firestore_client().create_content_item(content)
 
 
-async def get_content_item(content_id: str) -> Optional[ContentItem]:
-    """Get content item by ID."""
-    return await firestore_client.get_content_item(content_id)
\ No newline at end of file
+async def get_content_item(content_id: str, use_cache: bool = False) -> Optional[ContentItem]:
+    """Get content item by ID; use_cache allows a slightly stale read."""
+    return await get_firestore_client().get_content_item(content_id, use_cache=use_cache)
\ No newline at end of file
@@ -6,16 +6,132 @@ from r/AIBusiness and other AI-related subreddits.
 """
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import hashlib
+import re
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import praw
 import structlog
+from cachetools import TTLCache
 from praw.models import Submission
 
 from src.config.settings import get_settings
 from src.models.content import ContentSource, ContentTopic, SourceContent
 
+# Topic keyword mapping
+_TOPIC_KEYWORDS: Dict[ContentTopic, Tuple[str, ...]] = {
+    ContentTopic.ARTIFICIAL_INTELLIGENCE: (
+        "artificial intelligence", "ai", "agi", "superintelligence"
+    ),
+    ContentTopic.MACHINE_LEARNING: (
+        "machine learning", "ml", "neural network", "deep learning"
+    ),
+    ContentTopic.GENERATIVE_AI: (
+        "generative ai", "gpt", "llm", "language model", "chatgpt", "claude"
+    ),
+    ContentTopic.AI_STARTUPS: (
+        "startup", "company", "business", "enterprise", "saas"
+    ),
+    ContentTopic.AI_FUNDING: (
+        "funding", "investment", "venture", "series", "raised", "valuation"
+    ),
+    ContentTopic.AI_RESEARCH: (
+        "research", "paper", "study", "breakthrough", "discovery"
+    ),
+    ContentTopic.AI_ETHICS: (
+        "ethics", "bias", "fairness", "responsible", "alignment"
+    ),
+    ContentTopic.AI_POLICY: (
+        "policy", "regulation", "government", "law", "legal"
+    ),
+    ContentTopic.AI_CAREERS: (
+        "job", "career", "hiring", "salary", "interview"
+    ),
+    ContentTopic.AI_TOOLS: (
+        "tool", "platform", "software", "api", "framework"
+    ),
+}
+
+_KEYWORD_TOPICS = {
+    keyword: topic for topic, keywords in _TOPIC_KEYWORDS.items() for keyword in keywords
+}
+
+_POSITIVE_WORDS = frozenset({
+    "breakthrough", "success", "amazing", "incredible", "revolutionary",
+    "advance", "progress", "achievement", "winner", "best"
+})
+_NEGATIVE_WORDS = frozenset({
+    "failed", "problem", "issue", "concern", "danger", "risk",
+    "threat", "warning", "crisis", "disaster"
+})
+
+
+def _compile_keyword_pattern(keywords) -> re.Pattern:
+    """Compile keywords into one pattern that finds them all in a single scan."""
+    # The zero-width lookahead lets finditer match at every position, so overlapping
+    # keywords ("generative ai" and "ai") are all reported, as with one substring
+    # check per keyword. No keyword is a prefix of another, so none are shadowed.
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+
+
+_TOPIC_PATTERN = _compile_keyword_pattern(_KEYWORD_TOPICS)
+_SENTIMENT_PATTERN = _compile_keyword_pattern(_POSITIVE_WORDS | _NEGATIVE_WORDS)
+
+# Link domains that are not worth discovering as content
+_EXCLUDED_DOMAINS = frozenset({
+    "reddit.com",
+    "redd.it",
+    "imgur.com",
+    "youtube.com",  # Will handle separately in future
+    "youtu.be",
+})
+
+# Seconds a fetched subreddit listing is reused; discovery runs that follow
+# each other closely see nearly the same hot and new posts
+LISTING_CACHE_TTL = 300
+
+# Titles whose 64-bit simhashes differ in at most this many bits are treated as
+# the same story, e.g. a repost with different casing or one word changed
+TITLE_SIMHASH_DISTANCE = 3
+
+
+def _normalize_url(url: str) -> str:
+    """Normalize a link for deduplication: drop tracking parameters and fragment."""
+    parts = urlsplit(url)
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith("utm_") and key != "ref"
+    ]
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query), "")
+    )
+
+
+def _is_excluded_domain(url: str) -> bool:
+    """Check whether a link's host is an excluded domain or one of its subdomains."""
+    labels = (urlsplit(url).hostname or "").split(".")
+    # "www.old.reddit.com" is checked as itself, "old.reddit.com", "reddit.com", ...
+    return any(".".join(labels[i:]) in _EXCLUDED_DOMAINS for i in range(len(labels)))
+
+
+def _title_simhash(title: str) -> Optional[int]:
+    """Compute a 64-bit simhash of a title's words; None if it has no words."""
+    words = re.findall(r"\w+", title.lower())
+    if not words:
+        return None
+    
+    weights = [0] * 64
+    for word in words:
+        word_hash = int.from_bytes(hashlib.blake2b(word.encode(), digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += 1 if word_hash >> bit & 1 else -1
+    
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
 
 class RedditClient:
     """Reddit API client for content discovery."""
@@ -32,6 +148,9 @@ class RedditClient:
             user_agent=self.settings.reddit_user_agent,
         )
         
+        # Fetched listings keyed by (subreddit, listing, limit)
+        self._listing_cache: TTLCache = TTLCache(maxsize=256, ttl=LISTING_CACHE_TTL)
+        
         # Subreddit configurations
         self.subreddits = {
             "AIBusiness": {
@@ -86,27 +205,48 @@ class RedditClient:
         )
         
         discovered_content = []
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours_back)
+        # Epoch seconds, compared directly against each post's created_utc
+        cutoff_timestamp = time.time() - hours_back * 3600
         
-        for subreddit_config in self.subreddits.values():
-            try:
-                subreddit_content = await self._discover_from_subreddit(
-                    subreddit_config=subreddit_config,
-                    cutoff_time=cutoff_time,
-                    min_score=max(min_score, subreddit_config["min_score"]),
-                    limit=limit
-                )
-                discovered_content.extend(subreddit_content)
-                
-            except Exception as e:
+        # Each subreddit gets its own hot and new listings, so busy subreddits
+        # can't crowd quieter ones out; all of them are fetched concurrently
+        listing_limit = limit // 2
+        requests = [
+            (config, listing)
+            for config in self.subreddits.values()
+            for listing in ("hot", "new")
+        ]
+        results = await asyncio.gather(
+            *(
+                self._get_listing(config["name"], listing, listing_limit)
+                for config, listing in requests
+            ),
+            return_exceptions=True
+        )
+        
+        for (subreddit_config, listing), result in zip(requests, results):
+            if isinstance(result, Exception):
                 self.logger.error(
                     "Failed to discover content from subreddit",
                     subreddit=subreddit_config["name"],
-                    error=str(e)
+                    listing=listing,
+                    error=str(result)
                 )
                 continue
+            
+            for submission in result:
+                if self._should_include_submission(
+                    submission,
+                    cutoff_timestamp,
+                    max(min_score, subreddit_config["min_score"])
+                ):
+                    content_item = self._submission_to_content(
+                        submission, subreddit_config["topics"]
+                    )
+                    if content_item:
+                        discovered_content.append(content_item)
         
-        # Remove duplicates based on URL
+        # Remove reposts of the same link or story
         unique_content = self._deduplicate_content(discovered_content)
         
         self.logger.info(
@@ -117,74 +257,40 @@ class RedditClient:
         
         return unique_content
     
-    async def _discover_from_subreddit(
-        self,
-        subreddit_config: Dict,
-        cutoff_time: datetime,
-        min_score: int,
-        limit: int
-    ) -> List[SourceContent]:
-        """Discover content from a specific subreddit."""
-        subreddit_name = subreddit_config["name"]
-        topics = subreddit_config["topics"]
-        
-        self.logger.debug(
-            "Discovering content from subreddit",
-            subreddit=subreddit_name,
-            min_score=min_score
-        )
+    async def _get_listing(self, subreddit_name: str, listing: str, limit: int) -> List[Submission]:
+        """
+        Get a subreddit listing.
+
+        Listings fetched in the last LISTING_CACHE_TTL seconds are reused.
+        """
+        key = (subreddit_name, listing, limit)
+        cached = self._listing_cache.get(key)
+        if cached is not None:
+            return cached
         
-        try:
-            # Get subreddit instance
-            subreddit = self._client.subreddit(subreddit_name)
-            
-            # Get hot and new posts
-            content_items = []
-            
-            # Process hot posts
-            for submission in subreddit.hot(limit=limit // 2):
-                if await self._should_include_submission(submission, cutoff_time, min_score):
-                    content_item = await self._submission_to_content(submission, topics)
-                    if content_item:
-                        content_items.append(content_item)
-            
-            # Process new posts
-            for submission in subreddit.new(limit=limit // 2):
-                if await self._should_include_submission(submission, cutoff_time, min_score):
-                    content_item = await self._submission_to_content(submission, topics)
-                    if content_item:
-                        content_items.append(content_item)
-            
-            self.logger.debug(
-                "Content discovered from subreddit",
-                subreddit=subreddit_name,
-                count=len(content_items)
-            )
-            
-            return content_items
-            
-        except Exception as e:
-            self.logger.error(
-                "Error discovering content from subreddit",
-                subreddit=subreddit_name,
-                error=str(e)
-            )
-            return []
+        # PRAW is synchronous, so listings are fetched off the event loop
+        submissions = await asyncio.to_thread(self._fetch_listing, subreddit_name, listing, limit)
+        self._listing_cache[key] = submissions
+        return submissions
     
-    async def _should_include_submission(
+    def _fetch_listing(self, subreddit_name: str, listing: str, limit: int) -> List[Submission]:
+        """Fetch a subreddit listing ("hot" or "new"); blocks on PRAW's HTTP calls."""
+        subreddit = self._client.subreddit(subreddit_name)
+        return list(getattr(subreddit, listing)(limit=limit))
+    
+    def _should_include_submission(
         self,
         submission: Submission,
-        cutoff_time: datetime,
+        cutoff_timestamp: float,
         min_score: int
     ) -> bool:
         """Check if submission should be included in discovery."""
-        # Check if post is recent enough
-        post_time = datetime.utcfromtimestamp(submission.created_utc)
-        if post_time < cutoff_time:
+        # Cheapest checks first: most posts fail on score or age
+        if submission.score < min_score:
             return False
         
-        # Check minimum score
-        if submission.score < min_score:
+        # Check if post is recent enough
+        if submission.created_utc < cutoff_timestamp:
             return False
         
         # Skip removed or deleted posts
@@ -196,28 +302,24 @@ class RedditClient:
             return False
         
         # Filter out common non-content domains
-        excluded_domains = {
-            "reddit.com",
-            "redd.it", 
-            "imgur.com",
-            "youtube.com",  # Will handle separately in future
-            "youtu.be"
-        }
-        
-        if any(domain in submission.url for domain in excluded_domains):
+        if _is_excluded_domain(submission.url):
             return False
         
         return True
     
-    async def _submission_to_content(
+    def _submission_to_content(
         self,
         submission: Submission,
         default_topics: List[ContentTopic]
     ) -> Optional[SourceContent]:
         """Convert Reddit submission to SourceContent object."""
         try:
+            # Read each PRAW attribute once
+            title = submission.title
+            selftext = submission.selftext
+            
             # Extract topics from title and content
-            topics = await self._extract_topics(submission.title, submission.selftext)
+            topics = self._extract_topics(title, selftext)
             if not topics:
                 topics = default_topics
             
@@ -225,14 +327,14 @@ class RedditClient:
             engagement_score = self._calculate_engagement_score(submission)
             
             # Determine sentiment (basic implementation)
-            sentiment = self._analyze_sentiment(submission.title)
+            sentiment = self._analyze_sentiment(title)
             
             content = SourceContent(
                 source_id=submission.id,
                 source=ContentSource.REDDIT,
                 url=submission.url,
-                title=submission.title,
-                description=submission.selftext[:500] if submission.selftext else None,
+                title=title,
+                description=selftext[:500] if selftext else None,
                 author=str(submission.author) if submission.author else None,
                 published_at=datetime.utcfromtimestamp(submission.created_utc),
                 upvotes=submission.score,
@@ -252,51 +354,17 @@ class RedditClient:
             )
             return None
     
-    async def _extract_topics(self, title: str, content: str) -> List[ContentTopic]:
+    def _extract_topics(self, title: str, content: str) -> List[ContentTopic]:
         """Extract relevant topics from title and content."""
         title_lower = title.lower()
         content_lower = content.lower() if content else ""
         text = f"{title_lower} {content_lower}"
         
-        topics = []
-        
-        # Topic keyword mapping
-        topic_keywords = {
-            ContentTopic.ARTIFICIAL_INTELLIGENCE: [
-                "artificial intelligence", "ai", "agi", "superintelligence"
-            ],
-            ContentTopic.MACHINE_LEARNING: [
-                "machine learning", "ml", "neural network", "deep learning"
-            ],
-            ContentTopic.GENERATIVE_AI: [
-                "generative ai", "gpt", "llm", "language model", "chatgpt", "claude"
-            ],
-            ContentTopic.AI_STARTUPS: [
-                "startup", "company", "business", "enterprise", "saas"
-            ],
-            ContentTopic.AI_FUNDING: [
-                "funding", "investment", "venture", "series", "raised", "valuation"
-            ],
-            ContentTopic.AI_RESEARCH: [
-                "research", "paper", "study", "breakthrough", "discovery"
-            ],
-            ContentTopic.AI_ETHICS: [
-                "ethics", "bias", "fairness", "responsible", "alignment"
-            ],
-            ContentTopic.AI_POLICY: [
-                "policy", "regulation", "government", "law", "legal"
-            ],
-            ContentTopic.AI_CAREERS: [
-                "job", "career", "hiring", "salary", "interview"
-            ],
-            ContentTopic.AI_TOOLS: [
-                "tool", "platform", "software", "api", "framework"
-            ],
+        # One scan of the text finds every keyword occurrence
+        matched = {
+            _KEYWORD_TOPICS[match.group(1)] for match in _TOPIC_PATTERN.finditer(text)
         }
-        
-        for topic, keywords in topic_keywords.items():
-            if any(keyword in text for keyword in keywords):
-                topics.append(topic)
+        topics = [topic for topic in _TOPIC_KEYWORDS if topic in matched]
         
         # Default to AI news if no specific topics found
         if not topics:
@@ -326,19 +394,10 @@ class RedditClient:
     
     def _analyze_sentiment(self, title: str) -> str:
         """Basic sentiment analysis of title."""
-        positive_words = [
-            "breakthrough", "success", "amazing", "incredible", "revolutionary",
-            "advance", "progress", "achievement", "winner", "best"
-        ]
-        negative_words = [
-            "failed", "problem", "issue", "concern", "danger", "risk",
-            "threat", "warning", "crisis", "disaster"
-        ]
-        
-        title_lower = title.lower()
+        found = {match.group(1) for match in _SENTIMENT_PATTERN.finditer(title.lower())}
         
-        positive_count = sum(1 for word in positive_words if word in title_lower)
-        negative_count = sum(1 for word in negative_words if word in title_lower)
+        positive_count = len(found & _POSITIVE_WORDS)
+        negative_count = len(found & _NEGATIVE_WORDS)
         
         if positive_count > negative_count:
             return "positive"
@@ -348,14 +407,27 @@ class RedditClient:
             return "neutral"
     
     def _deduplicate_content(self, content_list: List[SourceContent]) -> List[SourceContent]:
-        """Remove duplicate content based on URL."""
+        """Remove duplicate content by normalized URL and near-identical title."""
         seen_urls = set()
+        seen_title_hashes = []
         unique_content = []
         
         for content in content_list:
-            if content.url not in seen_urls:
-                seen_urls.add(content.url)
-                unique_content.append(content)
+            url = _normalize_url(str(content.url))
+            if url in seen_urls:
+                continue
+            
+            title_hash = _title_simhash(content.title)
+            if title_hash is not None and any(
+                (title_hash ^ seen_hash).bit_count() <= TITLE_SIMHASH_DISTANCE
+                for seen_hash in seen_title_hashes
+            ):
+                continue
+            
+            seen_urls.add(url)
+            if title_hash is not None:
+                seen_title_hashes.append(title_hash)
+            unique_content.append(content)
         
         return unique_content
     
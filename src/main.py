@@ -5,19 +5,26 @@ This module initializes and configures the FastAPI application with all routes,
 middleware, and dependencies.
 """
 
+import asyncio
 import logging
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 import structlog
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from src.api import analytics, auth, content, users
+from src.config.database import prewarm as prewarm_database
 from src.config.settings import get_settings
+from src.integrations.linkedin import get_linkedin_client
+from src.services.auth import close_oauth_http_client, prewarm_password_hashing
+from src.services.user import UserService
 from src.utils.logger import setup_logging
 from src.utils.monitoring import performance_monitor
 
@@ -30,8 +37,37 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger = structlog.get_logger(__name__)
     logger.info("PostSync application starting up")
     
+    # Password hashing and Reddit fetches run in the default executor via asyncio.to_thread
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=2 * (os.cpu_count() or 1))
+    )
+    
+    # Connect to Firestore off the event loop before serving, so request
+    # handlers never wait on its initialization
+    await prewarm_database()
+    
+    # Seed the registered-email filter used by /auth/register
+    seed_task = asyncio.create_task(UserService().seed_email_filter())
+    
+    # Unknown-email logins verify against a dummy hash; build it up front so
+    # the first one takes no longer than the rest
+    hash_task = asyncio.create_task(prewarm_password_hashing())
+    
+    # Complete the LinkedIn TLS handshake before the first publish needs it
+    warmup_task = asyncio.create_task(get_linkedin_client().warmup())
+    
+    # Created here so its worker task runs on, and stops with, this event loop
+    app.state.discovery_batcher = content.create_discovery_batcher()
+    
     yield
     
+    seed_task.cancel()
+    hash_task.cancel()
+    warmup_task.cancel()
+    await app.state.discovery_batcher.aclose()
+    await get_linkedin_client().aclose()
+    await close_oauth_http_client()
+    
     # Shutdown
     logger.info("PostSync application shutting down")
 
@@ -47,6 +83,7 @@ def create_application() -> FastAPI:
         docs_url="/docs" if settings.environment == "development" else None,
         redoc_url="/redoc" if settings.environment == "development" else None,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
     
     # Add performance monitoring middleware
@@ -187,6 +224,8 @@ if __name__ == "__main__":
         "src.main:app",
         host="0.0.0.0",
         port=8000,
+        loop="uvloop",
+        http="httptools",
         reload=settings.environment == "development",
         log_level=settings.log_level.lower()
     )
\ No newline at end of file
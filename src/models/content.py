@@ -9,7 +9,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field, HttpUrl, validator
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_serializer, validator
 
 
 class ContentStatus(str, Enum):
@@ -93,6 +94,11 @@ class SourceContent(BaseModel):
         description="When content was discovered"
     )
     
+    @field_serializer("url")
+    def serialize_url(self, url: HttpUrl) -> str:
+        """Dump the URL as a plain string so it can be stored as-is."""
+        return str(url)
+    
     class Config:
         """Pydantic model configuration."""
         json_encoders = {
@@ -158,6 +164,11 @@ class PublishingResult(BaseModel):
     initial_impressions: Optional[int] = Field(None, description="Initial impression count")
     initial_engagements: Optional[int] = Field(None, description="Initial engagement count")
     
+    @field_serializer("post_url")
+    def serialize_post_url(self, post_url: Optional[HttpUrl]) -> Optional[str]:
+        """Dump the URL as a plain string so it can be stored as-is."""
+        return str(post_url) if post_url is not None else None
+    
     class Config:
         """Pydantic model configuration."""
         json_encoders = {
@@ -260,19 +271,158 @@ class ContentResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        """Pydantic model configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    # Response schemas are built once and never modified
+    model_config = ConfigDict(
+        frozen=True,
+        json_encoders={datetime: lambda v: v.isoformat()},
+    )
 
 
 class ContentListResponse(BaseModel):
     """Response schema for paginated content list."""
     
+    model_config = ConfigDict(frozen=True)
+    
     items: List[ContentResponse]
     total: int
     page: int
     page_size: int
     has_next: bool
-    has_previous: bool
\ No newline at end of file
+    has_previous: bool
+    next_cursor: Optional[str] = None
+
+
+# msgspec encodings of the list response, used to render large content pages
+class SourceContentStruct(msgspec.Struct, frozen=True):
+    """msgspec encoding of SourceContent."""
+    
+    source_id: str
+    source: ContentSource
+    url: str
+    title: str
+    description: Optional[str]
+    author: Optional[str]
+    published_at: datetime
+    upvotes: Optional[int]
+    comments_count: Optional[int]
+    engagement_score: Optional[float]
+    topics: List[ContentTopic]
+    sentiment: Optional[str]
+    discovered_at: datetime
+    
+    @classmethod
+    def from_model(cls, source: SourceContent) -> "SourceContentStruct":
+        """Build from a validated SourceContent."""
+        return cls(
+            source_id=source.source_id,
+            source=source.source,
+            url=str(source.url),
+            title=source.title,
+            description=source.description,
+            author=source.author,
+            published_at=source.published_at,
+            upvotes=source.upvotes,
+            comments_count=source.comments_count,
+            engagement_score=source.engagement_score,
+            topics=source.topics,
+            sentiment=source.sentiment,
+            discovered_at=source.discovered_at,
+        )
+
+
+class GeneratedPostStruct(msgspec.Struct, frozen=True):
+    """msgspec encoding of GeneratedPost."""
+    
+    platform: PlatformType
+    content: str
+    hashtags: List[str]
+    mentions: List[str]
+    character_count: int
+    estimated_reading_time: int
+    relevance_score: float
+    engagement_prediction: float
+    fact_check_score: float
+    ai_model: str
+    generation_prompt: str
+    generated_at: datetime
+    
+    @classmethod
+    def from_model(cls, post: GeneratedPost) -> "GeneratedPostStruct":
+        """Build from a validated GeneratedPost."""
+        return cls(*[getattr(post, name) for name in cls.__struct_fields__])
+
+
+class PublishingResultStruct(msgspec.Struct, frozen=True):
+    """msgspec encoding of PublishingResult."""
+    
+    platform: PlatformType
+    post_id: Optional[str]
+    post_url: Optional[str]
+    success: bool
+    error_message: Optional[str]
+    published_at: Optional[datetime]
+    scheduled_for: Optional[datetime]
+    initial_impressions: Optional[int]
+    initial_engagements: Optional[int]
+    
+    @classmethod
+    def from_model(cls, result: PublishingResult) -> "PublishingResultStruct":
+        """Build from a validated PublishingResult."""
+        return cls(
+            platform=result.platform,
+            post_id=result.post_id,
+            post_url=str(result.post_url) if result.post_url else None,
+            success=result.success,
+            error_message=result.error_message,
+            published_at=result.published_at,
+            scheduled_for=result.scheduled_for,
+            initial_impressions=result.initial_impressions,
+            initial_engagements=result.initial_engagements,
+        )
+
+
+class ContentResponseStruct(msgspec.Struct, frozen=True):
+    """msgspec encoding of ContentResponse."""
+    
+    id: str
+    user_id: str
+    status: ContentStatus
+    source_content: SourceContentStruct
+    generated_posts: Dict[PlatformType, GeneratedPostStruct]
+    publishing_results: Dict[PlatformType, PublishingResultStruct]
+    scheduled_for: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
+    
+    @classmethod
+    def from_model(cls, item: ContentItem) -> "ContentResponseStruct":
+        """Build from a ContentItem produced by our own services."""
+        return cls(
+            id=item.id,
+            user_id=item.user_id,
+            status=item.status,
+            source_content=SourceContentStruct.from_model(item.source_content),
+            generated_posts={
+                platform: GeneratedPostStruct.from_model(post)
+                for platform, post in item.generated_posts.items()
+            },
+            publishing_results={
+                platform: PublishingResultStruct.from_model(result)
+                for platform, result in item.publishing_results.items()
+            },
+            scheduled_for=item.scheduled_for,
+            created_at=item.created_at,
+            updated_at=item.updated_at,
+        )
+
+
+class ContentListResponseStruct(msgspec.Struct, frozen=True):
+    """msgspec encoding of ContentListResponse."""
+    
+    items: List[ContentResponseStruct]
+    total: int
+    page: int
+    page_size: int
+    has_next: bool
+    has_previous: bool
+    next_cursor: Optional[str] = None
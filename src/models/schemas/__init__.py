@@ -12,11 +12,14 @@ __all__ = [
     # Auth schemas
     "LoginRequest",
     "LoginResponse", 
+    "LoginResponseStruct",
     "TokenResponse",
+    "TokenResponseStruct",
     "RefreshTokenRequest",
     
     # Common schemas
     "PaginationParams",
+    "pagination_params",
     "PaginatedResponse",
     "ErrorResponse",
     "SuccessResponse",
@@ -7,6 +7,7 @@ Request and response schemas for authentication-related endpoints.
 from datetime import datetime
 from typing import Optional
 
+import msgspec
 from pydantic import BaseModel, EmailStr, Field
 
 
@@ -35,6 +36,24 @@ class TokenResponse(BaseModel):
     expires_in: int = Field(..., description="Token expiration time in seconds")
 
 
+class LoginResponseStruct(msgspec.Struct):
+    """msgspec encoding of LoginResponse, used to render the login hot path."""
+    
+    access_token: str
+    refresh_token: str
+    expires_in: int
+    user_id: str
+    token_type: str = "bearer"
+
+
+class TokenResponseStruct(msgspec.Struct):
+    """msgspec encoding of TokenResponse, used to render the refresh hot path."""
+    
+    access_token: str
+    expires_in: int
+    token_type: str = "bearer"
+
+
 class RefreshTokenRequest(BaseModel):
     """Request schema for refreshing access token."""
     
@@ -5,30 +5,40 @@ Shared schemas used across multiple API endpoints for consistent
 request/response formatting and validation.
 """
 
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from dataclasses import dataclass
+from typing import Any, Dict, Generic, List, Literal, Optional, TypeVar
 
+from fastapi import Query
 from pydantic import BaseModel, Field
 
 # Type variable for generic responses
 T = TypeVar('T')
 
 
-class PaginationParams(BaseModel):
+@dataclass(slots=True)
+class PaginationParams:
     """Standard pagination parameters."""
     
-    page: int = Field(default=1, ge=1, description="Page number (1-indexed)")
-    page_size: int = Field(
-        default=20,
-        ge=1,
-        le=100,
-        description="Number of items per page"
-    )
-    sort_by: Optional[str] = Field(None, description="Field to sort by")
-    sort_order: Optional[str] = Field(
-        default="desc",
-        pattern="^(asc|desc)$",
-        description="Sort order (asc or desc)"
-    )
+    page: int = 1
+    page_size: int = 20
+    sort_by: Optional[str] = None
+    sort_order: str = "desc"
+
+
+def pagination_params(
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    sort_by: Optional[str] = None,
+    sort_order: Literal["asc", "desc"] = "desc",
+) -> PaginationParams:
+    """
+    Parse pagination query parameters.
+    
+    Used as Depends(pagination_params). FastAPI checks the bounds, so invalid
+    values get the standard 422 response without building a Pydantic model
+    on every request.
+    """
+    return PaginationParams(page, page_size, sort_by, sort_order)
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
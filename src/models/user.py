@@ -8,7 +8,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, PrivateAttr, validator
 
 
 class UserRole(str, Enum):
@@ -34,6 +34,11 @@ class SocialPlatform(str, Enum):
     YOUTUBE = "youtube"
 
 
+# Enum -> value lookups for hot serialization paths
+TIER_STR: Dict[SubscriptionTier, str] = {tier: tier.value for tier in SubscriptionTier}
+PLATFORM_STR: Dict[SocialPlatform, str] = {platform: platform.value for platform in SocialPlatform}
+
+
 class ContentPreferences(BaseModel):
     """User content preferences and settings."""
     
@@ -169,6 +174,22 @@ class User(BaseModel):
         description="Last login timestamp"
     )
     
+    # Lazily built public representation, see to_response()
+    _response_cache: Optional["UserResponse"] = PrivateAttr(default=None)
+    
+    def to_response(self) -> "UserResponse":
+        """
+        Get the public response schema for this user, built once per instance.
+        
+        The user is already validated, so the response is constructed
+        without re-running validation.
+        """
+        if self._response_cache is None:
+            self._response_cache = UserResponse.model_construct(
+                **{name: getattr(self, name) for name in UserResponse.model_fields}
+            )
+        return self._response_cache
+    
     @validator('email')
     def validate_email(cls, v):
         """Validate email format."""
@@ -232,8 +253,9 @@ class UserResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        """Pydantic model configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
\ No newline at end of file
+    # Cached on User and shared between requests, so it must never be modified
+    model_config = ConfigDict(
+        frozen=True,
+        from_attributes=True,
+        json_encoders={datetime: lambda v: v.isoformat()},
+    )
\ No newline at end of file
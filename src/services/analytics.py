@@ -20,9 +20,9 @@ from src.models.analytics import (
     MetricPoint,
     AnalyticsSummary
 )
-from src.integrations.firestore import FirestoreClient
+from src.integrations.firestore import get_firestore_client
 from src.integrations.twitter import TwitterClient
-from src.integrations.linkedin import LinkedInClient
+from src.integrations.linkedin import get_linkedin_client
 
 
 class AnalyticsService:
@@ -30,10 +30,10 @@ class AnalyticsService:
     
     def __init__(self):
         """Initialize analytics service."""
-        self.db = FirestoreClient()
+        self.db = get_firestore_client()
         self.logger = structlog.get_logger(__name__)
         self.twitter = TwitterClient()
-        self.linkedin = LinkedInClient()
+        self.linkedin = get_linkedin_client()
     
     async def get_analytics_summary(
         self,
@@ -154,7 +154,7 @@ class AnalyticsService:
         """Get analytics for a specific content item."""
         try:
             # Get post analytics from database
-            analytics = await self.db.get_post_analytics(content_id)
+            analytics = await self.db.get_post_analytics(content_id, use_cache=True)
             if analytics and analytics.user_id == user_id:
                 return analytics
             return None
@@ -254,15 +254,16 @@ class AnalyticsService:
     ) -> Optional[PlatformAnalytics]:
         """Get analytics for a specific platform."""
         try:
-            # Get analytics data for the specific platform
-            all_analytics = await self.db.get_user_analytics_data(
-                user_id=user_id,
-                start_date=start_date,
-                end_date=end_date
-            )
-            
-            # Filter by platform
-            platform_analytics = [post for post in all_analytics if post.platform == platform]
+            # Get analytics data for the specific platform, filtering as it streams
+            platform_analytics = [
+                post
+                async for post in self.db.iter_user_analytics_data(
+                    user_id=user_id,
+                    start_date=start_date,
+                    end_date=end_date
+                )
+                if post.platform == platform
+            ]
             
             if not platform_analytics:
                 return None
@@ -328,15 +329,16 @@ class AnalyticsService:
     ) -> List[PostAnalytics]:
         """Get post-level analytics."""
         try:
-            analytics_data = await self.db.get_user_analytics_data(
-                user_id=user_id,
-                start_date=start_date,
-                end_date=end_date
-            )
-            
-            # Filter by platform if specified
-            if platform:
-                analytics_data = [post for post in analytics_data if post.platform == platform]
+            # Filter by platform if specified, as the data streams in
+            analytics_data = [
+                post
+                async for post in self.db.iter_user_analytics_data(
+                    user_id=user_id,
+                    start_date=start_date,
+                    end_date=end_date
+                )
+                if not platform or post.platform == platform
+            ]
             
             # Sort by engagement rate and limit results
             analytics_data.sort(key=lambda x: x.engagement_rate, reverse=True)
@@ -357,7 +359,7 @@ class AnalyticsService:
     ) -> Optional[PostAnalytics]:
         """Get analytics for a specific post."""
         try:
-            analytics = await self.db.get_post_analytics(post_id)
+            analytics = await self.db.get_post_analytics(post_id, use_cache=True)
             if analytics and analytics.user_id == user_id:
                 return analytics
             return None
@@ -494,14 +496,15 @@ class AnalyticsService:
     ) -> Dict[str, Any]:
         """Get optimal posting times analysis."""
         try:
-            analytics_data = await self.db.get_user_analytics_data(
-                user_id=user_id,
-                start_date=start_date or datetime.utcnow() - timedelta(days=30),
-                end_date=end_date or datetime.utcnow()
-            )
-            
-            if platform:
-                analytics_data = [post for post in analytics_data if post.platform == platform]
+            analytics_data = [
+                post
+                async for post in self.db.iter_user_analytics_data(
+                    user_id=user_id,
+                    start_date=start_date or datetime.utcnow() - timedelta(days=30),
+                    end_date=end_date or datetime.utcnow()
+                )
+                if not platform or post.platform == platform
+            ]
             
             if not analytics_data:
                 return {"best_times": [], "analysis": "Insufficient data for analysis"}
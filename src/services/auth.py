@@ -9,17 +9,60 @@ This module handles all authentication-related business logic including:
 - Password reset functionality
 """
 
+import asyncio
+import base64
+import hashlib
+import hmac
 import secrets
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 
+import httpx
+import orjson
 import structlog
-from passlib.context import CryptContext
 from jose import JWTError, jwt
 
 from src.config.settings import get_settings
-from src.integrations.firestore import get_user_by_email, get_user_by_id, update_user
+from src.integrations.firestore import (
+    get_firestore_client,
+    get_user_by_email,
+    get_user_by_id,
+    update_user,
+)
 from src.models.user import User
+from src.utils.auth import (
+    blacklist_token,
+    hash_password,
+    is_token_blacklisted,
+    password_needs_rehash,
+    verify_password,
+)
+
+
+@lru_cache(maxsize=1)
+def get_oauth_http_client() -> httpx.AsyncClient:
+    """Get the shared keep-alive client for OAuth token exchange and profile calls."""
+    return httpx.AsyncClient(timeout=10.0)
+
+
+async def close_oauth_http_client() -> None:
+    """Close the shared OAuth HTTP client, if it was ever created."""
+    if get_oauth_http_client.cache_info().currsize:
+        await get_oauth_http_client().aclose()
+        get_oauth_http_client.cache_clear()
+
+
+@lru_cache
+def _dummy_password_hash() -> str:
+    """Get a fixed hash to verify against when the user does not exist."""
+    return hash_password("constant-dummy")
+
+
+async def prewarm_password_hashing() -> None:
+    """Build the dummy hash in a worker thread before the first login needs it."""
+    await asyncio.to_thread(_dummy_password_hash)
 
 
 class AuthService:
@@ -30,49 +73,97 @@ class AuthService:
         self.settings = get_settings()
         self.logger = structlog.get_logger(__name__)
         
-        # Password hashing context
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-        
         # JWT settings
         self.secret_key = self.settings.secret_key
         self.algorithm = self.settings.algorithm
         self.access_token_expire_minutes = self.settings.access_token_expire_minutes
+        
+        # Signing key and the constant JWT header, encoded once
+        self._key_bytes = self.secret_key.encode("utf-8")
+        self._header_b64 = self._b64url(orjson.dumps({"alg": self.algorithm, "typ": "JWT"}))
+        
+        # Claims fixed per token type, serialized once without braces
+        self._static_claims = {
+            token_type: orjson.dumps({"type": token_type})[1:-1]
+            for token_type in ("access", "refresh")
+        }
+    
+    @staticmethod
+    def _b64url(data: bytes) -> str:
+        """Base64url-encode without padding."""
+        return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+    
+    def _encode_token(self, claims: Dict, token_type: Optional[str] = None) -> str:
+        """
+        Encode claims as a JWT, signing HS256 directly with the cached key.
+        
+        Only the per-token claims are serialized; the pre-serialized claims
+        for token_type are spliced into the payload.
+        """
+        if self.algorithm != "HS256":
+            if token_type:
+                claims = {**claims, "type": token_type}
+            return jwt.encode(claims, self.secret_key, algorithm=self.algorithm)
+        
+        payload = orjson.dumps(claims)
+        if token_type:
+            payload = b"%s,%s}" % (payload[:-1], self._static_claims[token_type])
+        
+        signing_input = f"{self._header_b64}.{self._b64url(payload)}"
+        signature = hmac.new(
+            self._key_bytes, signing_input.encode("ascii"), hashlib.sha256
+        ).digest()
+        return f"{signing_input}.{self._b64url(signature)}"
     
     def hash_password(self, password: str) -> str:
-        """Hash a password using bcrypt."""
-        return self.pwd_context.hash(password)
+        """Hash a password using Argon2id."""
+        return hash_password(password)
     
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash."""
-        return self.pwd_context.verify(plain_password, hashed_password)
+        return verify_password(plain_password, hashed_password)
+    
+    def password_needs_rehash(self, hashed_password: str) -> bool:
+        """Check whether a stored hash should be upgraded."""
+        return password_needs_rehash(hashed_password)
+    
+    async def rehash_password(self, user_id: str, password: str) -> None:
+        """Re-hash a verified password with current parameters and store it."""
+        try:
+            password_hash = await asyncio.to_thread(self.hash_password, password)
+            await update_user(user_id, {"password_hash": password_hash})
+            self.logger.info("Password hash upgraded", user_id=user_id)
+        except Exception as e:
+            self.logger.error("Password rehash failed", error=str(e), user_id=user_id)
     
     def create_access_token(self, data: Dict, expires_delta: Optional[timedelta] = None) -> str:
         """Create a JWT access token."""
-        to_encode = data.copy()
+        if expires_delta is None:
+            expires_delta = timedelta(minutes=self.access_token_expire_minutes)
         
-        if expires_delta:
-            expire = datetime.utcnow() + expires_delta
-        else:
-            expire = datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
-        
-        to_encode.update({"exp": expire})
+        to_encode = {
+            **data,
+            "exp": int(time.time() + expires_delta.total_seconds()),
+            "jti": secrets.token_urlsafe(16),
+        }
         
         try:
-            encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
-            return encoded_jwt
+            # Callers normally pass only "sub"; "type" comes pre-serialized
+            return self._encode_token(to_encode, None if "type" in data else "access")
         except Exception as e:
             self.logger.error("Failed to create access token", error=str(e))
             raise
     
     def create_refresh_token(self, user_id: str) -> str:
         """Create a JWT refresh token."""
-        data = {"sub": user_id, "type": "refresh"}
-        expire = datetime.utcnow() + timedelta(days=7)  # 7 days for refresh token
-        data.update({"exp": expire})
+        data = {
+            "sub": user_id,
+            "exp": int(time.time()) + 7 * 24 * 3600,  # 7 days for refresh token
+            "jti": secrets.token_urlsafe(16),
+        }
         
         try:
-            encoded_jwt = jwt.encode(data, self.secret_key, algorithm=self.algorithm)
-            return encoded_jwt
+            return self._encode_token(data, "refresh")
         except Exception as e:
             self.logger.error("Failed to create refresh token", error=str(e))
             raise
@@ -94,31 +185,52 @@ class AuthService:
         try:
             user = await get_user_by_email(email)
             if not user:
+                # Spend the same hashing work as a real check so unknown emails
+                # cannot be told apart by response time; the dummy hash itself
+                # is built in the worker thread too, never on the event loop
+                await asyncio.to_thread(
+                    lambda: self.verify_password(password, _dummy_password_hash())
+                )
                 self.logger.warning("Authentication failed - user not found", email=email)
                 return None
             
-            if not self.verify_password(password, user.password_hash):
+            # Hashing is CPU-bound; keep it off the event loop
+            if not await asyncio.to_thread(self.verify_password, password, user.password_hash):
                 self.logger.warning("Authentication failed - invalid password", email=email)
                 return None
             
-            self.logger.info("User authenticated successfully", user_id=user.id, email=email)
+            self.logger.debug("User authenticated successfully", user_id=user.id, email=email)
             return user
             
         except Exception as e:
             self.logger.error("Authentication error", error=str(e), email=email)
             return None
     
+    async def authenticate_and_touch(self, email: str, password: str) -> Optional[User]:
+        """
+        Authenticate a user and record the login in one call.
+        
+        The last-login write is issued without reading the user back, so a
+        successful login costs one Firestore read and one write.
+        """
+        user = await self.authenticate_user(email, password)
+        if user and user.is_active:
+            login_at = datetime.utcnow()
+            await get_firestore_client().record_login(user.id, login_at)
+            user.last_login_at = login_at
+        return user
+    
     async def create_tokens(self, user_id: str) -> Tuple[str, str]:
         """Create access and refresh tokens for a user."""
         try:
             # Create access token
-            access_token_data = {"sub": user_id, "type": "access"}
+            access_token_data = {"sub": user_id}
             access_token = self.create_access_token(access_token_data)
             
             # Create refresh token
             refresh_token = self.create_refresh_token(user_id)
             
-            self.logger.info("Tokens created successfully", user_id=user_id)
+            self.logger.debug("Tokens created successfully", user_id=user_id)
             return access_token, refresh_token
             
         except Exception as e:
@@ -126,7 +238,11 @@ class AuthService:
             raise
     
     async def refresh_access_token(self, refresh_token: str) -> str:
-        """Create a new access token using a refresh token."""
+        """
+        Create a new access token using a refresh token.
+        
+        Revocation and the user's active status are checked on every refresh.
+        """
         try:
             # Verify refresh token
             payload = self.verify_token(refresh_token)
@@ -137,31 +253,40 @@ class AuthService:
             if not user_id:
                 raise ValueError("Invalid refresh token payload")
             
+            jti = payload.get("jti")
+            if jti and await is_token_blacklisted(jti):
+                raise ValueError("Refresh token revoked")
+            
             # Verify user still exists and is active
             user = await get_user_by_id(user_id)
             if not user or not user.is_active:
                 raise ValueError("User not found or inactive")
             
             # Create new access token
-            access_token_data = {"sub": user_id, "type": "access"}
+            access_token_data = {"sub": user_id}
             access_token = self.create_access_token(access_token_data)
             
-            self.logger.info("Access token refreshed", user_id=user_id)
+            self.logger.debug("Access token refreshed", user_id=user_id)
             return access_token
             
         except Exception as e:
             self.logger.error("Token refresh failed", error=str(e))
             raise
     
-    async def logout_user(self, user_id: str) -> bool:
-        """Logout a user (in a full implementation, this would invalidate tokens)."""
+    async def revoke_refresh_token(self, refresh_token: str) -> None:
+        """Revoke a refresh token by blacklisting it until it expires."""
+        payload = self.verify_token(refresh_token)
+        if payload and payload.get("jti") and payload.get("exp"):
+            await blacklist_token(payload["jti"], payload["exp"])
+    
+    async def logout_user(
+        self, user_id: str, jti: Optional[str] = None, expires_at: Optional[float] = None
+    ) -> bool:
+        """Logout a user by blacklisting the current access token until it expires."""
         try:
-            # In a production system, you would:
-            # 1. Add tokens to a blacklist
-            # 2. Update user's last_logout timestamp
-            # 3. Invalidate any active sessions
+            if jti and expires_at:
+                await blacklist_token(jti, expires_at)
             
-            # For now, just log the logout
             self.logger.info("User logged out", user_id=user_id)
             return True
             
@@ -204,7 +329,7 @@ class AuthService:
             # In a real implementation, you would:
             # 1. Find user by reset token
             # 2. Verify token hasn't expired
-            # 3. Hash new password
+            # 3. Hash new password off the event loop (asyncio.to_thread)
             # 4. Update user password
             # 5. Clear reset token
             
@@ -224,11 +349,13 @@ class AuthService:
                 raise ValueError("User not found")
             
             # Verify current password
-            if not self.verify_password(current_password, user.password_hash):
+            if not await asyncio.to_thread(
+                self.verify_password, current_password, user.password_hash
+            ):
                 raise ValueError("Invalid current password")
             
             # Hash new password
-            new_password_hash = self.hash_password(new_password)
+            new_password_hash = await asyncio.to_thread(self.hash_password, new_password)
             
             # Update user password (in a real implementation)
             # await update_user(user_id, {"password_hash": new_password_hash})
@@ -260,10 +387,7 @@ class AuthService:
                     user_id, authorization_code, redirect_uri
                 )
             else:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Unsupported platform: {platform}"
-                )
+                raise ValueError(f"Unsupported platform: {platform}")
             
             # Store account info in database
             await self._store_social_account(user_id, platform, account_info)
@@ -412,9 +536,11 @@ class AuthService:
                 'oauth_token_secret': 'temp_secret'  # Should be retrieved from storage
             }
             
-            # Get access token
+            # Get access token (tweepy is synchronous; keep it off the event loop)
             try:
-                access_token, access_token_secret = oauth1_user_handler.get_access_token(oauth_verifier)
+                access_token, access_token_secret = await asyncio.to_thread(
+                    oauth1_user_handler.get_access_token, oauth_verifier
+                )
             except Exception:
                 # Fallback to demo account info if OAuth fails
                 self.logger.warning("Twitter OAuth token exchange failed, using demo account")
@@ -429,7 +555,7 @@ class AuthService:
             
             # Get user info
             api = tweepy.API(oauth1_user_handler)
-            twitter_user = api.verify_credentials()
+            twitter_user = await asyncio.to_thread(api.verify_credentials)
             
             return {
                 "account_id": str(twitter_user.id),
@@ -473,8 +599,6 @@ class AuthService:
                 }
             
             # Exchange authorization code for access token
-            import requests
-            
             token_url = "https://www.linkedin.com/oauth/v2/accessToken"
             token_data = {
                 "grant_type": "authorization_code",
@@ -484,7 +608,7 @@ class AuthService:
                 "client_secret": self.settings.linkedin_client_secret
             }
             
-            token_response = requests.post(token_url, data=token_data)
+            token_response = await get_oauth_http_client().post(token_url, data=token_data)
             token_response.raise_for_status()
             token_info = token_response.json()
             
@@ -494,7 +618,7 @@ class AuthService:
             profile_url = "https://api.linkedin.com/v2/me"
             headers = {"Authorization": f"Bearer {access_token}"}
             
-            profile_response = requests.get(profile_url, headers=headers)
+            profile_response = await get_oauth_http_client().get(profile_url, headers=headers)
             profile_response.raise_for_status()
             profile_data = profile_response.json()
             
@@ -524,8 +648,6 @@ class AuthService:
     async def _store_social_account(self, user_id: str, platform: str, account_info: Dict):
         """Store social media account information in database."""
         try:
-            from src.integrations.firestore import firestore_client
-            
             # Create social account record
             social_account_data = {
                 "user_id": user_id,
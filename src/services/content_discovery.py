@@ -12,16 +12,46 @@ from typing import Any, Dict, List, Optional
 
 import structlog
 
-from src.integrations.firestore import firestore_client
+from src.config.redis import get_redis
+from src.integrations.firestore import get_firestore_client
 from src.integrations.reddit import reddit_client
-from src.models.content import ContentItem, ContentListResponse, ContentStatus, SourceContent
+from src.models.content import (
+    ContentItem,
+    ContentListResponseStruct,
+    ContentResponseStruct,
+    ContentStatus,
+    SourceContent,
+)
 from src.models.user import User
-from src.ai.gemini import GeminiClient
+from src.ai.gemini import gemini_client
 from src.utils.error_handling import (
     with_retry, with_error_handling, ErrorContext, ExternalServiceError, 
     ContentGenerationError, error_handler
 )
 
+# Daily Redis Bloom filters of "user:source:source_id" keys for source content
+# already saved for a user, so posts rediscovered by later runs skip the
+# Firestore check. Discovery looks back 24 hours, so a post can only come back
+# the day it was saved or the next; each day's filter expires after that.
+SEEN_SOURCES_FILTER_PREFIX = "content:sources"
+SEEN_SOURCES_RETENTION_DAYS = 2
+SEEN_SOURCES_CAPACITY = 1_000_000
+SEEN_SOURCES_ERROR_RATE = 0.01
+
+
+def _seen_source_key(user_id: str, source_content: SourceContent) -> str:
+    """Build the seen-sources filter key for a user's source content."""
+    return f"{user_id}:{source_content.source.value}:{source_content.source_id}"
+
+
+def _seen_sources_filter_keys() -> List[str]:
+    """Redis keys of the live seen-sources filters, today's first."""
+    today = datetime.utcnow().date()
+    return [
+        f"{SEEN_SOURCES_FILTER_PREFIX}:{today - timedelta(days=days):%Y%m%d}"
+        for days in range(SEEN_SOURCES_RETENTION_DAYS)
+    ]
+
 
 class ContentDiscoveryService:
     """Service for discovering and managing content from external sources."""
@@ -30,11 +60,9 @@ class ContentDiscoveryService:
         """Initialize content discovery service."""
         self.logger = structlog.get_logger(__name__)
         self.reddit = reddit_client
-        self.db = firestore_client
-        self.ai = GeminiClient()
+        self.db = get_firestore_client()
+        self.ai = gemini_client
     
-    @with_error_handling("content_discovery", "discover_content_for_user", "retry_with_backoff")
-    @with_retry(max_attempts=3, retryable_errors=[ExternalServiceError])
     async def discover_content_for_user(self, user_id: str) -> List[ContentItem]:
         """
         Discover new content for a specific user based on their preferences.
@@ -45,29 +73,76 @@ class ContentDiscoveryService:
         Returns:
             List of discovered content items
         """
-        self.logger.info("Starting content discovery for user", user_id=user_id)
+        results = await self.discover_content_for_users([user_id])
+        return results.get(user_id, [])
+    
+    @with_error_handling("content_discovery", "discover_content_for_users", "retry_with_backoff")
+    @with_retry(max_attempts=3, retryable_errors=[ExternalServiceError])
+    async def discover_content_for_users(self, user_ids: List[str]) -> Dict[str, List[ContentItem]]:
+        """
+        Discover new content for several users with a single source fetch.
         
-        try:
-            # Get user preferences
-            user = await self.db.get_user(user_id)
-            if not user:
-                self.logger.error("User not found for content discovery", user_id=user_id)
-                return []
-            
-            # Discover content from Reddit
-            discovered_content = await self._discover_from_reddit(user)
+        Reddit discovery doesn't depend on the user, so it runs once per call
+        and the results are filtered and scored per user.
+        
+        Args:
+            user_ids: User IDs to discover content for
             
+        Returns:
+            Dictionary mapping user_id to its discovered content items
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        results: Dict[str, List[ContentItem]] = {user_id: [] for user_id in user_ids}
+        
+        self.logger.info("Starting content discovery", user_count=len(user_ids))
+        
+        users = await asyncio.gather(*(self.db.get_user(user_id) for user_id in user_ids))
+        found_users = []
+        for user_id, user in zip(user_ids, users):
+            if user:
+                found_users.append(user)
+            else:
+                self.logger.error("User not found for content discovery", user_id=user_id)
+        
+        if not found_users:
+            return results
+        
+        # Discover content from Reddit
+        discovered_content = await self._discover_from_reddit()
+        
+        user_items = await asyncio.gather(*(
+            self._create_content_for_user(user, discovered_content)
+            for user in found_users
+        ))
+        for user, content_items in zip(found_users, user_items):
+            results[user.id] = content_items
+        
+        return results
+    
+    async def _create_content_for_user(
+        self,
+        user: User,
+        discovered_content: List[SourceContent]
+    ) -> List[ContentItem]:
+        """Filter discovered content for a user and save new items."""
+        try:
             # Filter and score content based on user preferences
             filtered_content = await self._filter_and_score_content(discovered_content, user)
             
             # Create content items in database
             content_items = []
-            for source_content in filtered_content:
+            seen_flags = await self._seen_sources(user.id, filtered_content)
+            saved_content = []
+            for source_content, seen in zip(filtered_content, seen_flags):
+                if seen:
+                    continue
+                
                 try:
                     # Check for duplicates
                     existing = await self.db.get_content_by_source_id(
                         source_content.source_id, 
-                        source_content.source.value
+                        source_content.source.value,
+                        id_only=True
                     )
                     
                     if existing:
@@ -75,12 +150,13 @@ class ContentDiscoveryService:
                             "Skipping duplicate content",
                             source_id=source_content.source_id
                         )
+                        saved_content.append(source_content)
                         continue
                     
                     # Create new content item
                     content_item = ContentItem(
                         id=str(uuid.uuid4()),
-                        user_id=user_id,
+                        user_id=user.id,
                         status=ContentStatus.DISCOVERED,
                         source_content=source_content,
                     )
@@ -88,6 +164,7 @@ class ContentDiscoveryService:
                     # Save to database
                     created_item = await self.db.create_content_item(content_item)
                     content_items.append(created_item)
+                    saved_content.append(source_content)
                     
                 except Exception as item_error:
                     # Log individual item error but continue processing
@@ -98,9 +175,11 @@ class ContentDiscoveryService:
                     )
                     continue
             
+            await self._remember_sources(user.id, saved_content)
+            
             self.logger.info(
                 "Content discovery completed",
-                user_id=user_id,
+                user_id=user.id,
                 discovered_count=len(discovered_content),
                 filtered_count=len(filtered_content),
                 created_count=len(content_items)
@@ -113,7 +192,7 @@ class ContentDiscoveryService:
             context = ErrorContext(
                 service="content_discovery",
                 operation="discover_content_for_user",
-                user_id=user_id
+                user_id=user.id
             )
             
             # Handle the error
@@ -121,15 +200,68 @@ class ContentDiscoveryService:
             
             self.logger.error(
                 "Content discovery failed",
-                user_id=user_id,
+                user_id=user.id,
                 error=str(e)
             )
             
             # Return empty list instead of raising to maintain service availability
             return []
     
-    async def _discover_from_reddit(self, user: User) -> List[SourceContent]:
-        """Discover content from Reddit based on user preferences."""
+    async def _seen_sources(
+        self,
+        user_id: str,
+        source_contents: List[SourceContent]
+    ) -> List[bool]:
+        """
+        Check the seen-sources Bloom filter for a user's discovered content.
+
+        True means the item was probably saved for the user already. Any Redis
+        failure answers False for every item, so callers fall back to Firestore.
+        """
+        if not source_contents:
+            return []
+        
+        items = [_seen_source_key(user_id, content) for content in source_contents]
+        try:
+            pipe = get_redis().pipeline(transaction=False)
+            for key in _seen_sources_filter_keys():
+                pipe.execute_command("BF.MEXISTS", key, *items)
+            results = await pipe.execute()
+            return [any(flags) for flags in zip(*results)]
+        except Exception as e:
+            self.logger.debug("Seen-sources filter unavailable", error=str(e))
+            return [False] * len(source_contents)
+    
+    async def _remember_sources(
+        self,
+        user_id: str,
+        source_contents: List[SourceContent]
+    ) -> None:
+        """Add source content saved for a user to today's seen-sources Bloom filter."""
+        if not source_contents:
+            return
+        
+        key = _seen_sources_filter_keys()[0]
+        try:
+            # BF.INSERT reserves today's filter at a fixed size on first use
+            pipe = get_redis().pipeline(transaction=False)
+            pipe.execute_command(
+                "BF.INSERT",
+                key,
+                "CAPACITY",
+                SEEN_SOURCES_CAPACITY,
+                "ERROR",
+                SEEN_SOURCES_ERROR_RATE,
+                "ITEMS",
+                *[_seen_source_key(user_id, content) for content in source_contents],
+            )
+            pipe.expire(key, SEEN_SOURCES_RETENTION_DAYS * 86400)
+            await pipe.execute()
+        except Exception as e:
+            self.logger.debug("Seen-sources filter update failed", error=str(e))
+    
+    async def _discover_from_reddit(self) -> List[SourceContent]:
+        """Discover recent content from Reddit."""
         try:
             # Calculate discovery parameters based on user preferences
             hours_back = 24  # Look back 24 hours
@@ -143,20 +275,12 @@ class ContentDiscoveryService:
                 limit=limit
             )
             
-            self.logger.debug(
-                "Reddit content discovered",
-                user_id=user.id,
-                count=len(reddit_content)
-            )
+            self.logger.debug("Reddit content discovered", count=len(reddit_content))
             
             return reddit_content
             
         except Exception as e:
-            self.logger.error(
-                "Reddit content discovery failed",
-                user_id=user.id,
-                error=str(e)
-            )
+            self.logger.error("Reddit content discovery failed", error=str(e))
             return []
     
     async def _filter_and_score_content(
@@ -184,9 +308,10 @@ class ContentDiscoveryService:
                 if relevance_score < 0.3:
                     continue
                 
-                # Update content with enhanced scoring
-                content.engagement_score = relevance_score
-                filtered_content.append(content)
+                # Copy with enhanced scoring; the source list is shared across users
+                filtered_content.append(
+                    content.model_copy(update={"engagement_score": relevance_score})
+                )
             
             # Sort by relevance score (descending)
             filtered_content.sort(key=lambda x: x.engagement_score, reverse=True)
@@ -372,8 +497,9 @@ class ContentDiscoveryService:
         page_size: int = 20,
         filters: Optional[Dict] = None,
         sort_by: Optional[str] = None,
-        sort_order: str = "desc"
-    ) -> ContentListResponse:
+        sort_order: str = "desc",
+        cursor: Optional[str] = None
+    ) -> ContentListResponseStruct:
         """
         Get paginated list of content for a user with filtering and sorting.
         
@@ -384,64 +510,55 @@ class ContentDiscoveryService:
             filters: Optional filters to apply
             sort_by: Field to sort by
             sort_order: Sort order (asc/desc)
+            cursor: ID of the last item on the previous page; replaces the page offset
             
         Returns:
-            ContentListResponse with paginated content
+            ContentListResponseStruct with paginated content
         """
-        try:
-            # Calculate offset
-            offset = (page - 1) * page_size
-            
-            # Apply filters
-            status_filter = None
-            if filters and "status" in filters:
-                status_filter = filters["status"]
-            
-            # Get content from database
-            content_items = await self.db.get_user_content(
-                user_id=user_id,
-                status=status_filter,
-                limit=page_size,
-                offset=offset,
-                order_by=sort_by or "created_at",
-                descending=sort_order.lower() == "desc"
-            )
-            
-            # Get total count (simplified - in production would need proper count query)
-            total_items = await self._get_user_content_count(user_id, filters)
-            
-            # Calculate pagination info
-            total_pages = (total_items + page_size - 1) // page_size
-            has_next = page < total_pages
-            has_previous = page > 1
-            
-            # Convert to response format
-            from src.models.content import ContentResponse
-            items = [ContentResponse.from_orm(item) for item in content_items]
-            
-            return ContentListResponse(
-                items=items,
-                total=total_items,
-                page=page,
-                page_size=page_size,
-                has_next=has_next,
-                has_previous=has_previous
-            )
-            
-        except Exception as e:
-            self.logger.error(
-                "Failed to get user content",
-                user_id=user_id,
-                error=str(e)
-            )
-            return ContentListResponse(
-                items=[],
-                total=0,
-                page=page,
-                page_size=page_size,
-                has_next=False,
-                has_previous=False
-            )
+        # Read errors propagate, so a failed read is never returned as an
+        # empty or partial page
+        content_items = await self.db.get_user_content(
+            user_id=user_id,
+            status=(filters or {}).get("status"),
+            limit=page_size,
+            offset=(page - 1) * page_size,
+            order_by=sort_by or "created_at",
+            descending=sort_order.lower() == "desc",
+            topic=(filters or {}).get("topic"),
+            start_after=cursor
+        )
+        
+        # Encode straight to msgspec Structs; items come from our own
+        # store, so no Pydantic response models are built
+        items = [ContentResponseStruct.from_model(item) for item in content_items]
+        
+        page_info = await self.get_user_content_page_info(user_id, page, page_size, filters)
+        if cursor:
+            # Page numbers don't apply after a cursor, so the flags come from the page itself
+            page_info.update(has_next=len(items) == page_size, has_previous=True)
+        
+        next_cursor = items[-1].id if len(items) == page_size else None
+        return ContentListResponseStruct(items=items, next_cursor=next_cursor, **page_info)
+    
+    async def get_user_content_page_info(
+        self,
+        user_id: str,
+        page: int,
+        page_size: int,
+        filters: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """Get pagination fields for a page of user content."""
+        # Get total count (simplified - in production would need proper count query)
+        total_items = await self._get_user_content_count(user_id, filters)
+        total_pages = (total_items + page_size - 1) // page_size
+        
+        return {
+            "total": total_items,
+            "page": page,
+            "page_size": page_size,
+            "has_next": page < total_pages,
+            "has_previous": page > 1,
+        }
     
     async def _get_user_content_count(self, user_id: str, filters: Optional[Dict] = None) -> int:
         """Get total count of user content (simplified implementation)."""
@@ -449,19 +566,26 @@ class ContentDiscoveryService:
         # For now, return estimated count
         return 100  # Placeholder
     
-    async def get_content_item(self, content_id: str, user_id: str) -> Optional[ContentItem]:
+    async def get_content_item(
+        self,
+        content_id: str,
+        user_id: str,
+        use_cache: bool = False
+    ) -> Optional[ContentItem]:
         """
         Get a specific content item by ID.
         
         Args:
             content_id: Content item ID
             user_id: User ID (for authorization)
+            use_cache: Allow a slightly stale read; only for display, never
+                before changing the item
             
         Returns:
             ContentItem if found and belongs to user, None otherwise
         """
         try:
-            content_item = await self.db.get_content_item(content_id)
+            content_item = await self.db.get_content_item(content_id, use_cache=use_cache)
             
             if content_item and content_item.user_id == user_id:
                 return content_item
@@ -514,7 +638,9 @@ class ContentDiscoveryService:
                 "rejection_reason": rejection_reason if not approved else None,
             }
             
-            updated_content = await self.db.update_content_item(content_id, updates)
+            updated_content = await self.db.update_content_item(
+                content_id, updates, current=content_item
+            )
             
             self.logger.info(
                 "Content approval processed",
@@ -13,7 +13,7 @@ import structlog
 
 from src.ai.content_optimizer import content_optimizer
 from src.ai.gemini import gemini_client
-from src.integrations.firestore import firestore_client
+from src.integrations.firestore import get_firestore_client
 from src.models.content import ContentItem, ContentStatus, GeneratedPost, PlatformType
 from src.models.user import ContentPreferences
 
@@ -26,7 +26,7 @@ class ContentGenerationService:
         self.logger = structlog.get_logger(__name__)
         self.gemini = gemini_client
         self.optimizer = content_optimizer
-        self.db = firestore_client
+        self.db = get_firestore_client()
     
     async def generate_posts(
         self,
@@ -84,12 +84,14 @@ class ContentGenerationService:
             # Update content item with generated posts
             updates = {
                 "generated_posts": {
-                    platform.value: post.dict() for platform, post in optimized_posts.items()
+                    platform.value: post.model_dump() for platform, post in optimized_posts.items()
                 },
                 "status": ContentStatus.GENERATED,
             }
             
-            updated_content = await self.db.update_content_item(content_id, updates)
+            updated_content = await self.db.update_content_item(
+                content_id, updates, current=content_item
+            )
             
             self.logger.info(
                 "Content generation completed",
@@ -211,7 +213,7 @@ class ContentGenerationService:
             
             # Update content item with new post
             updates = {
-                f"generated_posts.{platform.value}": optimized_post.dict(),
+                f"generated_posts.{platform.value}": optimized_post.model_dump(),
                 "status": ContentStatus.GENERATED,
             }
             
@@ -551,7 +553,7 @@ class ContentGenerationService:
             )
             
             # Store in database
-            await self.db.create_content_item(content_item.dict())
+            await self.db.create_content_item(content_item)
             
             self.logger.info(
                 "Direct content generation completed",
@@ -11,8 +11,8 @@ from typing import Dict, List, Optional
 
 import structlog
 
-from src.integrations.firestore import firestore_client
-from src.integrations.linkedin import linkedin_client
+from src.integrations.firestore import ScheduledContent, get_firestore_client
+from src.integrations.linkedin import get_linkedin_client
 from src.integrations.twitter import twitter_client
 from src.models.content import ContentItem, ContentStatus, GeneratedPost, PlatformType, PublishingResult
 from src.models.user import SocialMediaAccount
@@ -24,9 +24,9 @@ class PublishingService:
     def __init__(self):
         """Initialize publishing service."""
         self.logger = structlog.get_logger(__name__)
-        self.linkedin = linkedin_client
+        self.linkedin = get_linkedin_client()
         self.twitter = twitter_client
-        self.db = firestore_client
+        self.db = get_firestore_client()
     
     async def publish_content(
         self,
@@ -70,40 +70,25 @@ class PublishingService:
             if not user:
                 raise ValueError("User not found")
             
-            # Publish to each platform
-            publishing_results = {}
-            for platform in platforms:
-                try:
-                    result = await self._publish_to_platform(
-                        content_item=content_item,
-                        platform=platform,
-                        user_account=user.social_accounts.get(platform)
-                    )
-                    publishing_results[platform] = result
-                    
-                except Exception as e:
-                    self.logger.error(
-                        "Platform publishing failed",
-                        content_id=content_id,
-                        platform=platform,
-                        error=str(e)
-                    )
-                    # Create failed result
-                    publishing_results[platform] = PublishingResult(
-                        platform=platform,
-                        success=False,
-                        error_message=str(e)
-                    )
+            # Publish to all platforms concurrently
+            user_accounts = user.social_accounts
+            results = await asyncio.gather(*[
+                self._publish_one(content_item, platform, user_accounts.get(platform))
+                for platform in platforms
+            ])
+            publishing_results = dict(zip(platforms, results))
             
             # Update content item with results
             updates = {
                 "publishing_results": {
-                    platform.value: result.dict() for platform, result in publishing_results.items()
+                    platform.value: result.model_dump() for platform, result in publishing_results.items()
                 },
                 "status": ContentStatus.PUBLISHED,
             }
             
-            updated_content = await self.db.update_content_item(content_id, updates)
+            updated_content = await self.db.update_content_item(
+                content_id, updates, current=content_item
+            )
             
             successful_platforms = [p for p, r in publishing_results.items() if r.success]
             self.logger.info(
@@ -127,6 +112,33 @@ class PublishingService:
             await self.db.update_content_item(content_id, {"status": ContentStatus.FAILED})
             raise
     
+    async def _publish_one(
+        self,
+        content_item: ContentItem,
+        platform: PlatformType,
+        user_account: Optional[SocialMediaAccount]
+    ) -> PublishingResult:
+        """Publish to one platform, turning failures into a failed result."""
+        try:
+            return await self._publish_to_platform(
+                content_item=content_item,
+                platform=platform,
+                user_account=user_account
+            )
+        except Exception as e:
+            self.logger.error(
+                "Platform publishing failed",
+                content_id=content_item.id,
+                platform=platform,
+                error=str(e)
+            )
+            # Create failed result
+            return PublishingResult(
+                platform=platform,
+                success=False,
+                error_message=str(e)
+            )
+    
     async def _publish_to_platform(
         self,
         content_item: ContentItem,
@@ -225,7 +237,9 @@ class PublishingService:
             # Store which platforms to publish to (in metadata)
             updates["scheduled_platforms"] = [platform.value for platform in platforms]
             
-            updated_content = await self.db.update_content_item(content_id, updates)
+            updated_content = await self.db.update_content_item(
+                content_id, updates, current=content_item
+            )
             
             self.logger.info(
                 "Content scheduled successfully",
@@ -266,35 +280,44 @@ class PublishingService:
                 "failed": 0
             }
             
-            for content_item in scheduled_content:
-                try:
-                    results["processed"] += 1
-                    
-                    # Get scheduled platforms
-                    platforms = []
-                    if hasattr(content_item, 'scheduled_platforms'):
-                        platforms = [PlatformType(p) for p in content_item.scheduled_platforms]
-                    
-                    if not platforms:
-                        # Default to all platforms with generated posts
-                        platforms = [PlatformType(p) for p in content_item.generated_posts.keys()]
-                    
-                    # Publish the content
-                    await self.publish_content(
-                        content_id=content_item.id,
-                        user_id=content_item.user_id,
-                        platforms=platforms
-                    )
-                    
-                    results["successful"] += 1
-                    
-                except Exception as e:
-                    self.logger.error(
-                        "Scheduled content processing failed",
-                        content_id=content_item.id,
-                        error=str(e)
-                    )
-                    results["failed"] += 1
+            # Publish due items concurrently, each fanning out across its platforms
+            semaphore = asyncio.Semaphore(5)  # Limit to 5 concurrent publications
+            
+            async def publish_scheduled_item(scheduled: ScheduledContent) -> None:
+                async with semaphore:
+                    try:
+                        results["processed"] += 1
+                        
+                        # Get scheduled platforms
+                        platforms = [PlatformType(p) for p in scheduled.platforms]
+                        
+                        if not platforms:
+                            # Default to all platforms with generated posts; the
+                            # platform list tolerates a slightly stale read
+                            content_item = await self.db.get_content_item(
+                                scheduled.content_id, use_cache=True
+                            )
+                            if content_item:
+                                platforms = [PlatformType(p) for p in content_item.generated_posts.keys()]
+                        
+                        # Publish the content
+                        await self.publish_content(
+                            content_id=scheduled.content_id,
+                            user_id=scheduled.user_id,
+                            platforms=platforms
+                        )
+                        
+                        results["successful"] += 1
+                        
+                    except Exception as e:
+                        self.logger.error(
+                            "Scheduled content processing failed",
+                            content_id=scheduled.content_id,
+                            error=str(e)
+                        )
+                        results["failed"] += 1
+            
+            await asyncio.gather(*[publish_scheduled_item(item) for item in scheduled_content])
             
             self.logger.info(
                 "Scheduled content processing completed",
@@ -307,7 +330,7 @@ class PublishingService:
             self.logger.error("Scheduled content processing failed", error=str(e))
             return {"processed": 0, "successful": 0, "failed": 0}
     
-    async def _get_scheduled_content(self, current_time: datetime) -> List[ContentItem]:
+    async def _get_scheduled_content(self, current_time: datetime) -> List[ScheduledContent]:
         """Get content items that are scheduled for the current time or earlier."""
         try:
             # Query Firestore for scheduled content that's ready to publish
@@ -363,7 +386,9 @@ class PublishingService:
             if hasattr(content_item, 'scheduled_platforms'):
                 updates["scheduled_platforms"] = None
             
-            updated_content = await self.db.update_content_item(content_id, updates)
+            updated_content = await self.db.update_content_item(
+                content_id, updates, current=content_item
+            )
             
             self.logger.info(
                 "Scheduled content cancelled",
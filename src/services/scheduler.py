@@ -16,7 +16,7 @@ import structlog
 from src.services.publishing import PublishingService
 from src.services.content_discovery import ContentDiscoveryService
 from src.services.analytics import AnalyticsService
-from src.integrations.firestore import firestore_client
+from src.integrations.firestore import get_firestore_client
 
 
 class BackgroundScheduler:
@@ -28,7 +28,7 @@ class BackgroundScheduler:
         self.publishing = PublishingService()
         self.content_discovery = ContentDiscoveryService()
         self.analytics = AnalyticsService()
-        self.db = firestore_client
+        self.db = get_firestore_client()
         
         # Job control
         self.is_running = False
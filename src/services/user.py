@@ -8,14 +8,16 @@ This module handles all user-related business logic including:
 - User statistics tracking
 """
 
+import asyncio
 import uuid
 from datetime import datetime
 from typing import Dict, List, Optional
 
 import structlog
-from passlib.context import CryptContext
 
+from src.config.redis import get_redis
 from src.integrations.firestore import (
+    get_firestore_client,
     create_user as firestore_create_user,
     get_user_by_email,
     get_user_by_id,
@@ -34,6 +36,17 @@ from src.models.user import (
     SubscriptionTier,
     UserRole,
 )
+from src.utils.auth import hash_password
+
+# Redis Bloom filter of registered (lowercased) emails. It is built under
+# EMAIL_FILTER_SEEDING_KEY and renamed into place once seeded from Firestore,
+# so the filter existing is what says it can be trusted for negatives.
+EMAIL_FILTER_KEY = "users:email_filter"
+EMAIL_FILTER_SEEDING_KEY = "users:email_filter:seeding"
+EMAIL_FILTER_CAPACITY = 1_000_000
+EMAIL_FILTER_ERROR_RATE = 0.001
+# A seeding worker that dies releases the seeding key after this long
+EMAIL_FILTER_SEED_TIMEOUT = 600
 
 
 class UserService:
@@ -42,47 +55,139 @@ class UserService:
     def __init__(self):
         """Initialize user service."""
         self.logger = structlog.get_logger(__name__)
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
     
     def _hash_password(self, password: str) -> str:
-        """Hash a password using bcrypt."""
-        return self.pwd_context.hash(password)
+        """Hash a password using Argon2id."""
+        return hash_password(password)
+    
+    async def email_may_exist(self, email: str) -> bool:
+        """
+        Check the registered-email Bloom filter.
+
+        Returns False only when the email is definitely not registered.
+        Any Redis failure, or an unseeded filter, answers True so callers
+        fall back to the Firestore lookup.
+        """
+        try:
+            pipe = get_redis().pipeline(transaction=False)
+            pipe.exists(EMAIL_FILTER_KEY)
+            pipe.execute_command("BF.EXISTS", EMAIL_FILTER_KEY, email.lower())
+            seeded, present = await pipe.execute()
+            return not seeded or bool(present)
+        except Exception as e:
+            self.logger.debug("Email filter unavailable", error=str(e))
+            return True
+    
+    async def _remember_email(self, email: str) -> None:
+        """
+        Add an email to the registered-email Bloom filter.
+        
+        The email goes into the live filter and into one being seeded, if
+        either exists. A filter that misses an add would answer "definitely
+        not registered" for this email, so it is deleted instead and the
+        Firestore lookup is used until it is seeded again.
+        """
+        keys = (EMAIL_FILTER_KEY, EMAIL_FILTER_SEEDING_KEY)
+        try:
+            redis = get_redis()
+            pipe = redis.pipeline(transaction=False)
+            for key in keys:
+                pipe.execute_command("BF.INSERT", key, "NOCREATE", "ITEMS", email.lower())
+            results = await pipe.execute(raise_on_error=False)
+            
+            # Adding to a missing filter fails too; deleting it is then a no-op
+            failed = [key for key, result in zip(keys, results) if isinstance(result, Exception)]
+            if failed:
+                await redis.delete(*failed)
+        except Exception as e:
+            self.logger.debug("Email filter update failed", error=str(e))
+            try:
+                await get_redis().delete(*keys)
+            except Exception as delete_error:
+                self.logger.error(
+                    "Email filter may be missing an email", error=str(delete_error)
+                )
+    
+    async def seed_email_filter(self) -> int:
+        """Seed the registered-email Bloom filter from Firestore if not done yet."""
+        reserved = False
+        try:
+            redis = get_redis()
+            if await redis.exists(EMAIL_FILTER_KEY):
+                return 0
+            
+            # Reserving the seeding key fails if another worker is seeding
+            await redis.execute_command(
+                "BF.RESERVE",
+                EMAIL_FILTER_SEEDING_KEY,
+                EMAIL_FILTER_ERROR_RATE,
+                EMAIL_FILTER_CAPACITY,
+            )
+            reserved = True
+            await redis.expire(EMAIL_FILTER_SEEDING_KEY, EMAIL_FILTER_SEED_TIMEOUT)
+            
+            # Users created from here on are also added by _remember_email
+            emails = await get_firestore_client().get_all_user_emails()
+            for start in range(0, len(emails), 1000):
+                await redis.execute_command(
+                    "BF.MADD",
+                    EMAIL_FILTER_SEEDING_KEY,
+                    *[email.lower() for email in emails[start:start + 1000]],
+                )
+            
+            pipe = redis.pipeline(transaction=True)
+            pipe.rename(EMAIL_FILTER_SEEDING_KEY, EMAIL_FILTER_KEY)
+            pipe.persist(EMAIL_FILTER_KEY)
+            await pipe.execute()
+            
+            self.logger.info("Email filter seeded", count=len(emails))
+            return len(emails)
+            
+        except Exception as e:
+            self.logger.warning("Email filter seeding failed", error=str(e))
+            if reserved:
+                try:
+                    await get_redis().delete(EMAIL_FILTER_SEEDING_KEY)
+                except Exception:
+                    pass
+            return 0
+    
+    async def _build_user(self, user_data: UserCreateRequest) -> User:
+        """Build a new user model with a hashed password."""
+        now = datetime.utcnow()
+        password_hash = await asyncio.to_thread(self._hash_password, user_data.password)
+        
+        return User(
+            id=str(uuid.uuid4()),
+            email=user_data.email,
+            full_name=user_data.full_name,
+            job_title=user_data.job_title,
+            company=user_data.company,
+            industry=user_data.industry,
+            password_hash=password_hash,
+            role=UserRole.USER,
+            subscription_tier=SubscriptionTier.FREE,
+            is_active=True,
+            is_verified=False,
+            content_preferences=ContentPreferences(),
+            stats=UserStats(),
+            created_at=now,
+            updated_at=now
+        )
     
     async def create_user(self, user_data: UserCreateRequest) -> User:
         """Create a new user account."""
         try:
             # Check if user already exists
-            existing_user = await get_user_by_email(user_data.email)
+            existing_user = await get_user_by_email(user_data.email, id_only=True)
             if existing_user:
                 raise ValueError(f"User with email {user_data.email} already exists")
             
-            # Generate user ID
-            user_id = str(uuid.uuid4())
-            
-            # Hash password
-            password_hash = self._hash_password(user_data.password)
-            
-            # Create user model
-            user = User(
-                id=user_id,
-                email=user_data.email,
-                full_name=user_data.full_name,
-                job_title=user_data.job_title,
-                company=user_data.company,
-                industry=user_data.industry,
-                password_hash=password_hash,  # This field might need to be added to the User model
-                role=UserRole.USER,
-                subscription_tier=SubscriptionTier.FREE,
-                is_active=True,
-                is_verified=False,
-                content_preferences=ContentPreferences(),
-                stats=UserStats(),
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
-            )
+            user = await self._build_user(user_data)
             
             # Store user in Firestore
             await firestore_create_user(user)
+            await self._remember_email(user.email)
             
             self.logger.info("User created successfully", user_id=user.id, email=user.email)
             return user
@@ -91,6 +196,33 @@ class UserService:
             self.logger.error("User creation failed", error=str(e), email=user_data.email)
             raise
     
+    async def create_user_if_absent(self, user_data: UserCreateRequest) -> Optional[User]:
+        """
+        Create a new user account unless the email is already registered.
+        
+        Uniqueness is enforced by the database write itself, so there is no
+        window between checking and creating.
+        
+        Returns:
+            The created user, or None if the email is taken
+        """
+        try:
+            user = await self._build_user(user_data)
+            
+            created = await get_firestore_client().create_user_if_absent(user)
+            if created is None:
+                self.logger.info("User already exists", email=user_data.email)
+                return None
+            
+            await self._remember_email(created.email)
+            
+            self.logger.info("User created successfully", user_id=created.id, email=created.email)
+            return created
+            
+        except Exception as e:
+            self.logger.error("User creation failed", error=str(e), email=user_data.email)
+            raise
+    
     async def get_user_by_id(self, user_id: str) -> Optional[User]:
         """Get user by ID."""
         try:
@@ -136,7 +268,7 @@ class UserService:
             if update_data.avatar_url is not None:
                 update_fields["avatar_url"] = update_data.avatar_url
             if update_data.content_preferences is not None:
-                update_fields["content_preferences"] = update_data.content_preferences.dict()
+                update_fields["content_preferences"] = update_data.content_preferences.model_dump()
             
             # Always update the updated_at timestamp
             update_fields["updated_at"] = datetime.utcnow()
@@ -248,7 +380,7 @@ class UserService:
             social_accounts[platform] = account
             
             update_fields = {
-                "social_accounts": {k.value: v.dict() for k, v in social_accounts.items()},
+                "social_accounts": {k.value: v.model_dump() for k, v in social_accounts.items()},
                 "updated_at": datetime.utcnow()
             }
             
@@ -273,7 +405,7 @@ class UserService:
                 del social_accounts[platform]
             
             update_fields = {
-                "social_accounts": {k.value: v.dict() for k, v in social_accounts.items()},
+                "social_accounts": {k.value: v.model_dump() for k, v in social_accounts.items()},
                 "updated_at": datetime.utcnow()
             }
             
@@ -289,7 +421,7 @@ class UserService:
         """Update user statistics."""
         try:
             update_fields = {
-                "stats": stats.dict(),
+                "stats": stats.model_dump(),
                 "updated_at": datetime.utcnow()
             }
             
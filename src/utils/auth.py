@@ -5,20 +5,33 @@ This module provides authentication and authorization utilities
 including JWT token handling and user verification.
 """
 
+import base64
+import hashlib
+import hmac
+import secrets
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
 import jwt
+import orjson
 import structlog
-from fastapi import Depends, HTTPException, status
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer
 from passlib.context import CryptContext
 
+from src.config.redis import get_redis
 from src.config.settings import get_settings
 from src.integrations.firestore import get_user_by_id
 from src.models.user import User
 
-# Initialize password hashing
+# Initialize password hashing (Argon2id, RFC 9106 low-memory profile)
+password_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+
+# Legacy bcrypt hashes are still verified, then rehashed on login
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 # Initialize HTTP Bearer token scheme
@@ -29,13 +42,26 @@ logger = structlog.get_logger(__name__)
 
 
 def hash_password(password: str) -> str:
-    """Hash a password using bcrypt."""
-    return pwd_context.hash(password)
+    """Hash a password using Argon2id."""
+    return password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    """Verify a password against its Argon2id or legacy bcrypt hash."""
+    if not hashed_password.startswith("$argon2"):
+        return pwd_context.verify(plain_password, hashed_password)
+    
+    try:
+        return password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a hash is legacy bcrypt or uses outdated Argon2 parameters."""
+    if not hashed_password.startswith("$argon2"):
+        return True
+    return password_hasher.check_needs_rehash(hashed_password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -58,7 +84,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
     
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "jti": secrets.token_urlsafe(16)})
     
     encoded_jwt = jwt.encode(
         to_encode,
@@ -102,6 +128,53 @@ def create_refresh_token(user_id: str, expires_delta: Optional[timedelta] = None
     return encoded_jwt
 
 
+# Encoded header of every HS256 token this service issues
+_HS256_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=").decode()
+
+
+@lru_cache
+def _hs256_key() -> bytes:
+    """Get the HMAC signing key as bytes."""
+    return get_settings().secret_key.encode("utf-8")
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """Base64url-decode a segment with its padding stripped."""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _fast_decode_hs256(token: str) -> Optional[dict]:
+    """
+    Verify and decode an HS256 token without going through PyJWT.
+    
+    Args:
+        token: JWT token whose header is the standard HS256 header
+        
+    Returns:
+        Decoded token payload or None if invalid or expired
+    """
+    try:
+        header_b64, payload_b64, signature_b64 = token.split(".")
+        expected = hmac.new(
+            _hs256_key(), f"{header_b64}.{payload_b64}".encode("ascii"), hashlib.sha256
+        ).digest()
+        if not hmac.compare_digest(expected, _b64url_decode(signature_b64)):
+            return None
+        
+        payload = orjson.loads(_b64url_decode(payload_b64))
+    except ValueError:
+        return None
+    
+    if not isinstance(payload, dict):
+        return None
+    
+    exp = payload.get("exp")
+    if exp is not None and (not isinstance(exp, (int, float)) or exp <= time.time()):
+        return None
+    
+    return payload
+
+
 def verify_token(token: str) -> Optional[dict]:
     """
     Verify and decode a JWT token.
@@ -114,6 +187,12 @@ def verify_token(token: str) -> Optional[dict]:
     """
     settings = get_settings()
     
+    if settings.algorithm == "HS256" and token.startswith(_HS256_HEADER_B64 + "."):
+        payload = _fast_decode_hs256(token)
+        if payload is None:
+            logger.warning("Token verification failed", error="invalid signature or expired")
+        return payload
+    
     try:
         payload = jwt.decode(
             token,
@@ -175,7 +254,13 @@ async def get_current_user(token: str = Depends(security)) -> User:
         if user_id is None:
             raise credentials_exception
         
-        # Get user from database
+        # Reject tokens revoked by logout
+        jti = payload.get("jti")
+        if jti and await is_token_blacklisted(jti):
+            raise credentials_exception
+        
+        # Get user from database; read on every request so deactivation,
+        # role and profile changes apply immediately on all workers
         user = await get_user_by_id(user_id)
         if user is None:
             raise credentials_exception
@@ -305,34 +390,44 @@ def verify_email_verification_token(token: str) -> Optional[dict]:
     return None
 
 
-def is_token_blacklisted(token: str) -> bool:
+async def is_token_blacklisted(jti: str) -> bool:
     """
     Check if a token is blacklisted.
     
     Args:
-        token: JWT token to check
+        jti: Token ID (jti claim) to check
         
     Returns:
         True if token is blacklisted, False otherwise
     """
-    # This would typically check against a blacklist stored in Redis or database
-    # For now, return False (no blacklisting implemented)
-    return False
+    try:
+        return bool(await get_redis().exists(f"bl:{jti}"))
+    except Exception as e:
+        logger.warning("Token blacklist check failed", error=str(e))
+        return False
 
 
-def blacklist_token(token: str) -> bool:
+async def blacklist_token(jti: str, expires_at: float) -> bool:
     """
-    Add a token to the blacklist.
+    Add a token to the blacklist until it expires.
     
     Args:
-        token: JWT token to blacklist
+        jti: Token ID (jti claim) to blacklist
+        expires_at: Token expiry as a Unix timestamp
         
     Returns:
         True if successfully blacklisted
     """
-    # This would typically add the token to a blacklist in Redis or database
-    # For now, return True (blacklisting not implemented)
-    return True
+    ttl = int(expires_at - time.time())
+    if ttl <= 0:
+        return True
+    
+    try:
+        await get_redis().set(f"bl:{jti}", "1", ex=ttl)
+        return True
+    except Exception as e:
+        logger.error("Failed to blacklist token", error=str(e))
+        return False
 
 
 def check_permission(user: User, required_permission: str) -> bool:
@@ -409,6 +504,123 @@ def rate_limit_key(user_id: str, endpoint: str) -> str:
     return f"rate_limit:{user_id}:{endpoint}"
 
 
+# Token bucket: refill at capacity/period tokens per second, take one per call
+_TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate))
+return allowed
+"""
+
+
+async def consume_rate_limit(identifier: str, endpoint: str, capacity: int, period: int) -> bool:
+    """
+    Take one token from a Redis token bucket.
+    
+    Args:
+        identifier: Client identifier, e.g. an IP address or email
+        endpoint: API endpoint the bucket applies to
+        capacity: Maximum burst size
+        period: Seconds to refill a full bucket
+        
+    Returns:
+        True if the call is allowed; also True when Redis is unavailable
+    """
+    try:
+        allowed = await get_redis().eval(
+            _TOKEN_BUCKET_SCRIPT,
+            1,
+            rate_limit_key(identifier, endpoint),
+            capacity,
+            capacity / period,
+            time.time(),
+        )
+        return bool(allowed)
+    except Exception as e:
+        logger.warning("Rate limit check failed", error=str(e), endpoint=endpoint)
+        return True
+
+
+async def rate_limit_available(identifier: str, endpoint: str, capacity: int, period: int) -> bool:
+    """
+    Check whether a Redis token bucket has a token left, without taking one.
+    
+    Args:
+        identifier: Client identifier, e.g. an IP address or email
+        endpoint: API endpoint the bucket applies to
+        capacity: Maximum burst size
+        period: Seconds to refill a full bucket
+        
+    Returns:
+        True if a call would be allowed; also True when Redis is unavailable
+    """
+    try:
+        tokens, ts = await get_redis().hmget(rate_limit_key(identifier, endpoint), "tokens", "ts")
+    except Exception as e:
+        logger.warning("Rate limit check failed", error=str(e), endpoint=endpoint)
+        return True
+    
+    if tokens is None or ts is None:
+        return True
+    
+    refilled = float(tokens) + (time.time() - float(ts)) * capacity / period
+    return min(capacity, refilled) >= 1
+
+
+async def enforce_rate_limit(identifier: str, endpoint: str, capacity: int, period: int) -> None:
+    """
+    Raise 429 if the identifier's bucket for the endpoint is empty.
+    
+    Raises:
+        HTTPException: If the rate limit is exceeded
+    """
+    if not await consume_rate_limit(identifier, endpoint, capacity, period):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests. Please try again later.",
+        )
+
+
+def client_ip(request: Request) -> str:
+    """
+    Get the client's IP address.
+    
+    Behind nginx this relies on uvicorn's --proxy-headers, which replaces the
+    proxy's address with the X-Forwarded-For client when the connection comes
+    from one of FORWARDED_ALLOW_IPS.
+    """
+    return request.client.host if request.client else "unknown"
+
+
+def rate_limit_by_ip(endpoint: str, capacity: int, period: int):
+    """
+    Create a dependency that rate limits an endpoint per client IP.
+    
+    Args:
+        endpoint: API endpoint the bucket applies to
+        capacity: Maximum burst size
+        period: Seconds to refill a full bucket
+        
+    Returns:
+        Dependency function
+    """
+    async def rate_limit_dependency(request: Request) -> None:
+        await enforce_rate_limit(client_ip(request), endpoint, capacity, period)
+    
+    return rate_limit_dependency
+
+
 def generate_api_key() -> str:
     """
     Generate API key for programmatic access.
@@ -0,0 +1,119 @@
+"""
+Async Request Batching
+
+This module provides a small batcher that coalesces calls arriving within
+a short window into a single bulk call, so fan-out work like content
+discovery is paid for once per batch instead of once per request.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, List, Optional, Set, Tuple, TypeVar
+
+import structlog
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class AsyncBatcher(Generic[K, V]):
+    """Coalesce individual submissions into bulk handler calls."""
+
+    def __init__(
+        self,
+        handler: Callable[[List[K]], Awaitable[Dict[K, V]]],
+        max_size: int = 64,
+        max_wait_ms: int = 20,
+    ):
+        """
+        Initialize batcher.
+
+        Args:
+            handler: Bulk coroutine taking unique keys and returning a result per key
+            max_size: Flush as soon as this many submissions are queued
+            max_wait_ms: Flush at most this long after the first submission
+        """
+        self.logger = structlog.get_logger(__name__)
+        self._handler = handler
+        self._max_size = max_size
+        self._max_wait = max_wait_ms / 1000
+        self._queue: asyncio.Queue[Tuple[K, asyncio.Future]] = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        self._flushes: Set[asyncio.Task] = set()
+
+    async def submit(self, key: K) -> Optional[V]:
+        """
+        Submit a key and wait for its result from the next bulk call.
+
+        Exceptions raised by the handler are propagated to every
+        submitter in the failed batch.
+        """
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._collect())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((key, future))
+        return await future
+
+    async def aclose(self) -> None:
+        """
+        Stop collecting submissions.
+
+        Batches already handed to the handler are allowed to finish; anything
+        still queued is cancelled.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+
+        await asyncio.gather(*self._flushes, return_exceptions=True)
+
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+
+    async def _collect(self) -> None:
+        """Collect submissions into batches and hand them off for flushing."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._max_wait
+
+            try:
+                while len(batch) < self._max_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Closed mid-batch; don't leave the collected submitters waiting
+                for _, future in batch:
+                    future.cancel()
+                raise
+
+            # Flush in the background so slow bulk calls don't hold up the next batch
+            task = asyncio.create_task(self._flush(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: List[Tuple[K, asyncio.Future]]) -> None:
+        """Run the bulk handler for a batch and resolve its futures."""
+        keys = list(dict.fromkeys(key for key, _ in batch))
+
+        try:
+            results = await self._handler(keys)
+        except Exception as e:
+            self.logger.error("Batch handler failed", batch_size=len(keys), error=str(e))
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in batch:
+            # Submitters may have been cancelled while the batch ran
+            if not future.done():
+                future.set_result(results.get(key))
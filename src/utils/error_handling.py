@@ -14,14 +14,17 @@ import random
 import time
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 from dataclasses import dataclass
 from functools import wraps
 
 import structlog
+from fastapi import HTTPException, status
 
 from src.utils.monitoring import performance_monitor, AlertSeverity
 
+logger = structlog.get_logger(__name__)
+
 
 class ErrorCategory(Enum):
     """Categories of errors for classification."""
@@ -639,4 +642,58 @@ def with_error_handling(
                 raise e
         
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
+
+
+def handle_service_errors(
+    failure_detail: str,
+    client_errors: Tuple[Type[Exception], ...] = (ValueError,),
+    client_error_status: int = status.HTTP_400_BAD_REQUEST,
+    client_error_detail: Optional[str] = None,
+):
+    """
+    Decorator mapping service exceptions raised by an API handler to HTTP errors.
+    
+    HTTPExceptions pass through unchanged. Exceptions in client_errors become
+    client_error_status with client_error_detail (or the exception message),
+    and anything else is logged and becomes a 500 with failure_detail.
+    
+    Apply it below the router decorator so FastAPI registers the wrapped
+    handler; the original signature is still used for dependency injection.
+    """
+    
+    def decorator(func):
+        handler_name = func.__name__
+        
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            
+            except HTTPException:
+                raise
+            except client_errors as e:
+                logger.warning(
+                    "Invalid request",
+                    handler=handler_name,
+                    user_id=getattr(kwargs.get("current_user"), "id", None),
+                    error=str(e)
+                )
+                raise HTTPException(
+                    status_code=client_error_status,
+                    detail=client_error_detail or str(e)
+                )
+            except Exception as e:
+                logger.error(
+                    "Request handler failed",
+                    handler=handler_name,
+                    user_id=getattr(kwargs.get("current_user"), "id", None),
+                    error=str(e)
+                )
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=failure_detail
+                )
+        
+        return wrapper
+    return decorator
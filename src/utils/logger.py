@@ -9,6 +9,7 @@ import logging
 import sys
 from typing import Any, Dict
 
+import orjson
 import structlog
 from structlog.types import Processor
 
@@ -18,12 +19,13 @@ from src.config.settings import get_settings
 def setup_logging() -> None:
     """Set up structured logging for the application."""
     settings = get_settings()
+    log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
     
     # Configure standard library logging
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, settings.log_level.upper(), logging.INFO),
+        level=log_level,
     )
     
     # Define processors for structlog
@@ -48,19 +50,26 @@ def setup_logging() -> None:
         processors.extend([
             # Add context information
             add_app_context,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         ])
     
     # Configure structlog
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Calls below the configured level return immediately, before any
+        # event dict is built or a processor runs
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         logger_factory=structlog.stdlib.LoggerFactory(),
         context_class=dict,
         cache_logger_on_first_use=True,
     )
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log entry with orjson, as text for the stdlib handler."""
+    return orjson.dumps(obj, default=kwargs.get("default")).decode("utf-8")
+
+
 def add_app_context(logger: Any, name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
     """Add application context to log entries."""
     settings = get_settings()
@@ -0,0 +1,52 @@
+"""
+Outbound Rate Limiting
+
+This module provides an in-process token bucket for pacing calls to
+third-party APIs, so bursts wait briefly instead of being rejected with 429s.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncTokenBucket:
+    """Token bucket that makes callers wait until a request may be sent."""
+
+    def __init__(self, requests_per_minute: int, burst: Optional[int] = None):
+        """
+        Initialize token bucket.
+
+        Args:
+            requests_per_minute: Sustained request rate to allow
+            burst: Requests allowed back to back; defaults to ten seconds' worth
+        """
+        self._rate = requests_per_minute / 60
+        self._capacity = burst or max(1, requests_per_minute // 6)
+        self._tokens = float(self._capacity)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Take one token, waiting for it to refill if the bucket is empty."""
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated_at) * self._rate
+            )
+            self._updated_at = now
+
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._tokens = 0.0
+                self._updated_at = time.monotonic()
+            else:
+                self._tokens -= 1
+
+    async def __aenter__(self) -> "AsyncTokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
@@ -0,0 +1,40 @@
+"""
+Response Classes
+
+This module provides custom response classes for endpoints whose
+payloads are encoded outside of Pydantic.
+"""
+
+from typing import Any, Type, TypeVar
+
+import msgspec
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+ResponseModel = TypeVar("ResponseModel", bound=BaseModel)
+
+# msgspec compiles an encoder per Struct type on first use
+_encoder = msgspec.json.Encoder()
+
+
+class MsgspecJSONResponse(ORJSONResponse):
+    """JSON response that encodes msgspec Structs directly, and anything else with orjson."""
+    
+    def render(self, content: Any) -> bytes:
+        """Render response content to bytes."""
+        if isinstance(content, msgspec.Struct):
+            return _encoder.encode(content)
+        return super().render(content)
+
+
+def to_response(model_cls: Type[ResponseModel], obj: Any) -> ResponseModel:
+    """
+    Build a response schema from an already-validated service object.
+    
+    Uses model_construct, so no validation runs; only use it for models our
+    own services produced, never for request data.
+    """
+    return model_cls.model_construct(
+        **{name: getattr(obj, name) for name in model_cls.model_fields}
+    )
+
@@ -0,0 +1,60 @@
+"""
+Route Classes
+
+This module provides custom APIRoute classes used by the API routers.
+"""
+
+import asyncio
+from functools import wraps
+from typing import Any, Callable, Coroutine, Type
+
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+
+def _trust_response_model(
+    call: Callable[..., Coroutine[Any, Any, Any]],
+    model: Type[BaseModel],
+    status_code: int,
+) -> Callable[..., Coroutine[Any, Any, Any]]:
+    """Wrap an endpoint so exact response_model instances skip revalidation."""
+
+    @wraps(call)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        result = await call(*args, **kwargs)
+        if type(result) is model:
+            return ORJSONResponse(
+                content=result.model_dump(mode="json", by_alias=True),
+                status_code=status_code,
+            )
+        return result
+
+    return wrapper
+
+
+class TrustedRoute(APIRoute):
+    """
+    Route that trusts handlers returning their exact response_model.
+
+    FastAPI normally re-validates every return value against the route's
+    response_model before serializing it. When a handler already returns an
+    instance of that exact class, this route dumps it straight to an
+    ORJSONResponse instead. Anything else (dicts, subclasses, other models
+    such as a full User) still goes through the normal response_model
+    filtering, so sensitive fields are never leaked.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        super().__init__(path, endpoint, **kwargs)
+
+        model = self.response_model
+        if (
+            isinstance(model, type)
+            and issubclass(model, BaseModel)
+            and asyncio.iscoroutinefunction(self.dependant.call)
+        ):
+            # The request handler reads dependant.call on every request
+            self.dependant.call = _trust_response_model(
+                self.dependant.call, model, self.status_code or 200
+            )
@@ -24,4 +24,4 @@ echo ""
 echo "Press Ctrl+C to stop the server"
 echo ""
 
-PYTHONPATH=/Users/nio/Desktop/postsync uvicorn src.main:app --reload --host 0.0.0.0 --port 8000
\ No newline at end of file
+PYTHONPATH=/Users/nio/Desktop/postsync uvicorn src.main:app --reload --host 0.0.0.0 --port 8000 --loop uvloop --http httptools
\ No newline at end of file
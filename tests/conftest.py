@@ -6,6 +6,7 @@ This module contains pytest fixtures and configuration for the test suite.
 
 import asyncio
 import os
+from datetime import datetime
 from typing import AsyncGenerator, Generator
 from unittest.mock import AsyncMock, MagicMock
 
@@ -59,6 +60,7 @@ def mock_user() -> User:
         id="test-user-123",
         email="test@example.com",
         full_name="Test User",
+        password_hash="test-password-hash",
         job_title="AI Engineer",
         company="Test Company",
         role=UserRole.USER,
@@ -78,6 +80,7 @@ def mock_admin_user() -> User:
         id="test-admin-123",
         email="admin@example.com",
         full_name="Admin User",
+        password_hash="test-password-hash",
         role=UserRole.ADMIN,
         content_preferences=ContentPreferences()
     )
@@ -126,6 +129,7 @@ def mock_firestore_client() -> MagicMock:
     mock_client.get_user_by_email = AsyncMock(return_value=None)
     mock_client.create_user = AsyncMock()
     mock_client.update_user = AsyncMock()
+    mock_client.record_login = AsyncMock()
     mock_client.get_content_item = AsyncMock(return_value=None)
     mock_client.create_content_item = AsyncMock()
     mock_client.update_content_item = AsyncMock()
@@ -243,14 +247,29 @@ def mock_dependencies(
     mock_twitter_client
 ):
     """Mock external dependencies for all tests."""
-    # Mock database client
-    monkeypatch.setattr("src.integrations.firestore.firestore_client", mock_firestore_client)
+    from src.integrations.firestore import get_firestore_client
+    from src.integrations.linkedin import get_linkedin_client
+    
+    # The database and LinkedIn clients come from cached factories, so the
+    # factories are made to build the mocks instead
+    get_firestore_client.cache_clear()
+    get_linkedin_client.cache_clear()
+    monkeypatch.setattr(
+        "src.integrations.firestore.FirestoreClient", lambda: mock_firestore_client
+    )
+    monkeypatch.setattr(
+        "src.integrations.linkedin.LinkedInClient", lambda: mock_linkedin_client
+    )
     
     # Mock API clients
     monkeypatch.setattr("src.integrations.reddit.reddit_client", mock_reddit_client)
     monkeypatch.setattr("src.ai.gemini.gemini_client", mock_gemini_client)
-    monkeypatch.setattr("src.integrations.linkedin.linkedin_client", mock_linkedin_client)
     monkeypatch.setattr("src.integrations.twitter.twitter_client", mock_twitter_client)
+    
+    yield
+    
+    get_firestore_client.cache_clear()
+    get_linkedin_client.cache_clear()
 
 
 @pytest.fixture
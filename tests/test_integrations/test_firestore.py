@@ -0,0 +1,86 @@
+"""
+Tests for Firestore Integration
+
+This module contains tests for rebuilding models from stored
+documents without re-validating them.
+"""
+
+from enum import Enum
+from typing import Any, Dict
+
+from pydantic import BaseModel
+
+from src.integrations.firestore import _build_content, _build_user
+from src.models.content import ContentItem, ContentStatus, GeneratedPost, PlatformType
+from src.models.user import SocialMediaAccount, SocialPlatform, SubscriptionTier, User, UserRole
+
+
+def _as_stored(model: BaseModel) -> Dict[str, Any]:
+    """Dump a model the way Firestore returns it: plain values, enums as strings."""
+    def plain(value: Any) -> Any:
+        if isinstance(value, Enum):
+            return value.value
+        if isinstance(value, dict):
+            return {plain(key): plain(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [plain(item) for item in value]
+        return value
+    
+    return plain(model.model_dump())
+
+
+class TestModelBuilders:
+    """Test that stored documents rebuild to the models that were written."""
+    
+    def test_build_user(self, mock_user: User):
+        """Test rebuilding a user with nested preferences, accounts and enums."""
+        user = mock_user.model_copy(update={
+            "role": UserRole.ADMIN,
+            "subscription_tier": SubscriptionTier.PROFESSIONAL,
+            "social_accounts": {
+                SocialPlatform.LINKEDIN: SocialMediaAccount(
+                    platform=SocialPlatform.LINKEDIN,
+                    account_id="linkedin-123",
+                    username="test-user",
+                    access_token="token",
+                )
+            },
+        })
+        
+        built = _build_user(_as_stored(user))
+        
+        assert built.model_dump(mode="json") == user.model_dump(mode="json")
+        assert built.role is UserRole.ADMIN
+        assert built.subscription_tier is SubscriptionTier.PROFESSIONAL
+        account = built.social_accounts[SocialPlatform.LINKEDIN]
+        assert isinstance(account, SocialMediaAccount)
+        assert account.platform is SocialPlatform.LINKEDIN
+        assert all(isinstance(p, SocialPlatform) for p in built.content_preferences.platforms)
+    
+    def test_build_content(self, mock_content_item: ContentItem):
+        """Test rebuilding a content item with source content and generated posts."""
+        item = mock_content_item.model_copy(update={
+            "status": ContentStatus.GENERATED,
+            "generated_posts": {
+                PlatformType.LINKEDIN: GeneratedPost(
+                    platform=PlatformType.LINKEDIN,
+                    content="Test generated content",
+                    hashtags=["AI"],
+                    character_count=22,
+                    estimated_reading_time=5,
+                    relevance_score=0.9,
+                    engagement_prediction=0.8,
+                    fact_check_score=0.95,
+                    ai_model="gemini-pro",
+                    generation_prompt="Summarize the post",
+                )
+            },
+        })
+        
+        built = _build_content(_as_stored(item))
+        
+        assert built.model_dump(mode="json") == item.model_dump(mode="json")
+        assert built.status is ContentStatus.GENERATED
+        assert built.source_content.source is item.source_content.source
+        assert built.source_content.topics == item.source_content.topics
+        assert built.generated_posts[PlatformType.LINKEDIN].platform is PlatformType.LINKEDIN
@@ -351,6 +351,38 @@ class TestRedditClient:
         assert "unique_post" in source_ids
         assert "duplicate_post" not in source_ids
     
+    def test_deduplicate_content_by_url_and_title(
+        self,
+        client: RedditClient
+    ):
+        """Test deduplication by normalized URL and title simhash."""
+        def make(source_id: str, url: str, title: str) -> SourceContent:
+            return SourceContent(
+                source_id=source_id,
+                source="reddit",
+                url=url,
+                title=title,
+                author="author",
+                published_at=datetime.utcnow()
+            )
+        
+        content_items = [
+            make("original", "https://example.com/model",
+                 "OpenAI releases new reasoning model for developers today"),
+            # Same link with tracking parameters and a fragment
+            make("tracked", "https://example.com/model?utm_source=reddit&ref=feed#top",
+                 "A different title about the same link"),
+            # Repost of the same story with different casing and punctuation
+            make("repost", "https://news.example.org/openai-model",
+                 "openai releases new reasoning model for developers today!"),
+            make("unique", "https://example.com/tpu",
+                 "Google opens TPU access to academic researchers worldwide"),
+        ]
+        
+        unique_content = client._deduplicate_content(content_items)
+        
+        assert [c.source_id for c in unique_content] == ["original", "unique"]
+    
     @pytest.mark.asyncio
     async def test_get_trending_topics(
         self,
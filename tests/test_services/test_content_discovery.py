@@ -10,7 +10,7 @@ from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.models.content import ContentItem, ContentStatus, ContentTopic, SourceContent
-from src.services.content_discovery import ContentDiscoveryService
+from src.services.content_discovery import ContentDiscoveryService, _seen_sources_filter_keys
 
 
 class TestContentDiscoveryService:
@@ -311,6 +311,95 @@ class TestContentDiscoveryService:
             assert results["user3"] == 0
             assert mock_discover.call_count == 3
     
+    @pytest.mark.asyncio
+    async def test_discover_content_for_users_fetches_once(
+        self,
+        service: ContentDiscoveryService,
+        mock_user,
+        mock_source_content,
+        mock_firestore_client,
+        mock_reddit_client
+    ):
+        """Test that bulk discovery shares one Reddit fetch across users."""
+        mock_firestore_client.get_user.side_effect = lambda user_id: (
+            mock_user if user_id == mock_user.id else None
+        )
+        mock_firestore_client.get_content_by_source_id = AsyncMock(return_value=None)
+        mock_firestore_client.create_content_item.return_value = MagicMock()
+        mock_reddit_client.discover_content.return_value = [mock_source_content]
+        service.db = mock_firestore_client
+        service.reddit = mock_reddit_client
+        
+        results = await service.discover_content_for_users([mock_user.id, "missing", mock_user.id])
+        
+        assert len(results[mock_user.id]) == 1
+        assert results["missing"] == []
+        mock_reddit_client.discover_content.assert_called_once()
+        mock_firestore_client.create_content_item.assert_called_once()
+        # Scoring works on a copy, leaving the shared source content untouched
+        assert mock_source_content.engagement_score == 0.8
+    
+    @pytest.mark.asyncio
+    async def test_seen_sources_checks_recent_filters(
+        self,
+        service: ContentDiscoveryService,
+        mock_user,
+        mock_source_content
+    ):
+        """Test that an item seen in any live daily filter counts as seen."""
+        mock_pipe = MagicMock()
+        mock_pipe.execute = AsyncMock(return_value=[[0, 0], [1, 0]])
+        mock_redis = MagicMock()
+        mock_redis.pipeline.return_value = mock_pipe
+        other_content = mock_source_content.model_copy(update={"source_id": "other"})
+        
+        with patch("src.services.content_discovery.get_redis", return_value=mock_redis):
+            seen = await service._seen_sources(mock_user.id, [mock_source_content, other_content])
+        
+        assert seen == [True, False]
+        keys = [call.args[1] for call in mock_pipe.execute_command.call_args_list]
+        assert keys == _seen_sources_filter_keys()
+        assert len(set(keys)) == 2
+    
+    @pytest.mark.asyncio
+    async def test_remember_sources_uses_sized_expiring_filter(
+        self,
+        service: ContentDiscoveryService,
+        mock_user,
+        mock_source_content
+    ):
+        """Test that saved sources go into today's reserved, expiring filter."""
+        mock_pipe = MagicMock()
+        mock_pipe.execute = AsyncMock(return_value=[[1], True])
+        mock_redis = MagicMock()
+        mock_redis.pipeline.return_value = mock_pipe
+        
+        with patch("src.services.content_discovery.get_redis", return_value=mock_redis):
+            await service._remember_sources(mock_user.id, [mock_source_content])
+        
+        today = _seen_sources_filter_keys()[0]
+        args = mock_pipe.execute_command.call_args.args
+        assert args[:3] == ("BF.INSERT", today, "CAPACITY")
+        assert args[-1] == f"{mock_user.id}:reddit:{mock_source_content.source_id}"
+        mock_pipe.expire.assert_called_once()
+        assert mock_pipe.expire.call_args.args[0] == today
+    
+    @pytest.mark.asyncio
+    async def test_seen_sources_redis_failure(
+        self,
+        service: ContentDiscoveryService,
+        mock_user,
+        mock_source_content
+    ):
+        """Test that Redis errors fall back to the Firestore duplicate check."""
+        with patch(
+            "src.services.content_discovery.get_redis",
+            side_effect=ConnectionError("Redis down")
+        ):
+            seen = await service._seen_sources(mock_user.id, [mock_source_content])
+        
+        assert seen == [False]
+    
     @pytest.mark.asyncio
     async def test_cleanup_old_content(
         self,
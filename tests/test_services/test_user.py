@@ -0,0 +1,113 @@
+"""
+Tests for User Service
+
+This module contains tests for the registered-email Bloom filter
+used to skip Firestore lookups on registration.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from redis.exceptions import ResponseError
+
+from src.services.user import EMAIL_FILTER_KEY, EMAIL_FILTER_SEEDING_KEY, UserService
+
+
+class TestEmailFilter:
+    """Test the registered-email Bloom filter."""
+    
+    @pytest.fixture
+    def service(self) -> UserService:
+        """Create user service instance."""
+        return UserService()
+    
+    @pytest.fixture
+    def mock_pipeline(self) -> MagicMock:
+        """Create a mock Redis pipeline."""
+        mock_pipe = MagicMock()
+        mock_pipe.execute = AsyncMock(return_value=[])
+        return mock_pipe
+    
+    @pytest.fixture
+    def mock_redis(self, mock_pipeline) -> MagicMock:
+        """Create a mock Redis client."""
+        mock_client = MagicMock()
+        mock_client.pipeline.return_value = mock_pipeline
+        mock_client.exists = AsyncMock(return_value=0)
+        mock_client.execute_command = AsyncMock(return_value="OK")
+        mock_client.expire = AsyncMock()
+        mock_client.delete = AsyncMock()
+        return mock_client
+    
+    @pytest.mark.asyncio
+    async def test_unseeded_filter_is_not_trusted(self, service, mock_redis, mock_pipeline):
+        """Test that a missing filter sends callers to Firestore."""
+        mock_pipeline.execute.return_value = [0, 0]
+        
+        with patch("src.services.user.get_redis", return_value=mock_redis):
+            assert await service.email_may_exist("new@example.com") is True
+    
+    @pytest.mark.asyncio
+    async def test_seeded_filter_answers_negatives(self, service, mock_redis, mock_pipeline):
+        """Test that a seeded filter rules out unregistered emails."""
+        mock_pipeline.execute.return_value = [1, 0]
+        
+        with patch("src.services.user.get_redis", return_value=mock_redis):
+            assert await service.email_may_exist("New@Example.com") is False
+        
+        mock_pipeline.execute_command.assert_called_once_with(
+            "BF.EXISTS", EMAIL_FILTER_KEY, "new@example.com"
+        )
+    
+    @pytest.mark.asyncio
+    async def test_redis_failure_is_not_trusted(self, service, mock_redis, mock_pipeline):
+        """Test that Redis errors send callers to Firestore."""
+        mock_pipeline.execute.side_effect = ConnectionError("Redis down")
+        
+        with patch("src.services.user.get_redis", return_value=mock_redis):
+            assert await service.email_may_exist("new@example.com") is True
+    
+    @pytest.mark.asyncio
+    async def test_failed_add_drops_filter(self, service, mock_redis, mock_pipeline):
+        """Test that a filter that missed an email is deleted."""
+        mock_pipeline.execute.return_value = [ResponseError("OOM"), ResponseError("not found")]
+        
+        with patch("src.services.user.get_redis", return_value=mock_redis):
+            await service._remember_email("new@example.com")
+        
+        mock_redis.delete.assert_awaited_once_with(EMAIL_FILTER_KEY, EMAIL_FILTER_SEEDING_KEY)
+    
+    @pytest.mark.asyncio
+    async def test_successful_add_keeps_filter(self, service, mock_redis, mock_pipeline):
+        """Test that the filter is kept when the email was added."""
+        mock_pipeline.execute.return_value = [1, ResponseError("not found")]
+        
+        with patch("src.services.user.get_redis", return_value=mock_redis):
+            await service._remember_email("new@example.com")
+        
+        mock_redis.delete.assert_awaited_once_with(EMAIL_FILTER_SEEDING_KEY)
+    
+    @pytest.mark.asyncio
+    async def test_seed_builds_filter_before_publishing(self, service, mock_redis, mock_pipeline):
+        """Test that seeding reserves a sized filter and renames it into place."""
+        mock_firestore = MagicMock()
+        mock_firestore.get_all_user_emails = AsyncMock(return_value=["A@example.com"])
+        
+        with patch("src.services.user.get_redis", return_value=mock_redis), \
+             patch("src.services.user.get_firestore_client", return_value=mock_firestore):
+            assert await service.seed_email_filter() == 1
+        
+        reserve, madd = mock_redis.execute_command.call_args_list
+        assert reserve.args[:2] == ("BF.RESERVE", EMAIL_FILTER_SEEDING_KEY)
+        assert madd.args == ("BF.MADD", EMAIL_FILTER_SEEDING_KEY, "a@example.com")
+        mock_pipeline.rename.assert_called_once_with(EMAIL_FILTER_SEEDING_KEY, EMAIL_FILTER_KEY)
+    
+    @pytest.mark.asyncio
+    async def test_seed_skips_while_another_worker_seeds(self, service, mock_redis):
+        """Test that a worker that can't reserve the seeding key leaves it alone."""
+        mock_redis.execute_command.side_effect = ResponseError("item exists")
+        
+        with patch("src.services.user.get_redis", return_value=mock_redis):
+            assert await service.seed_email_filter() == 0
+        
+        mock_redis.delete.assert_not_called()
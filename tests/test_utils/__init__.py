@@ -0,0 +1 @@
+"""Tests for utility modules."""
\ No newline at end of file
@@ -0,0 +1,131 @@
+"""
+Tests for Authentication Utilities
+
+This module contains tests for JWT verification and the Redis
+token bucket rate limiter.
+"""
+
+import time
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import jwt
+import pytest
+
+from src.config.settings import get_settings
+from src.utils.auth import (
+    _HS256_HEADER_B64,
+    consume_rate_limit,
+    create_access_token,
+    rate_limit_available,
+    verify_token,
+)
+
+
+class TestVerifyToken:
+    """Test JWT verification, including the HS256 fast path."""
+    
+    def test_issued_tokens_take_fast_path(self):
+        """Test that tokens issued by the service use the fast path header."""
+        token = create_access_token({"sub": "user-123"})
+        
+        assert token.startswith(_HS256_HEADER_B64 + ".")
+        with patch("src.utils.auth.jwt.decode") as mock_decode:
+            payload = verify_token(token)
+        
+        assert payload["sub"] == "user-123"
+        mock_decode.assert_not_called()
+    
+    def test_fast_path_matches_pyjwt(self):
+        """Test that the fast path decodes the same payload as PyJWT."""
+        settings = get_settings()
+        token = create_access_token({"sub": "user-123", "role": "admin"})
+        
+        assert verify_token(token) == jwt.decode(
+            token, settings.secret_key, algorithms=[settings.algorithm]
+        )
+    
+    def test_fast_path_rejects_tampered_payload(self):
+        """Test that a token whose payload was changed is rejected."""
+        token = create_access_token({"sub": "user-123"})
+        other = create_access_token({"sub": "admin-456"})
+        header, _, signature = token.split(".")
+        
+        assert verify_token(f"{header}.{other.split('.')[1]}.{signature}") is None
+    
+    def test_fast_path_rejects_wrong_key(self):
+        """Test that a token signed with another key is rejected."""
+        token = jwt.encode(
+            {"sub": "user-123", "exp": time.time() + 60}, "another-key", algorithm="HS256"
+        )
+        
+        assert verify_token(token) is None
+    
+    def test_fast_path_rejects_expired_token(self):
+        """Test that an expired token is rejected."""
+        token = create_access_token({"sub": "user-123"}, expires_delta=timedelta(seconds=-1))
+        
+        assert verify_token(token) is None
+    
+    def test_malformed_token(self):
+        """Test that a malformed token is rejected."""
+        assert verify_token(_HS256_HEADER_B64 + ".not-a-token") is None
+        assert verify_token("not-a-token") is None
+
+
+class TestTokenBucket:
+    """Test the Redis token bucket rate limiter."""
+    
+    @pytest.fixture
+    def mock_redis(self) -> MagicMock:
+        """Create a mock Redis client."""
+        mock_client = MagicMock()
+        mock_client.eval = AsyncMock(return_value=1)
+        mock_client.hmget = AsyncMock(return_value=[None, None])
+        return mock_client
+    
+    @pytest.mark.asyncio
+    async def test_consume_passes_bucket_parameters(self, mock_redis):
+        """Test that a call takes a token from the endpoint's bucket."""
+        with patch("src.utils.auth.get_redis", return_value=mock_redis):
+            assert await consume_rate_limit("1.2.3.4", "login", 10, 60) is True
+        
+        args = mock_redis.eval.call_args.args
+        assert args[1:5] == (1, "rate_limit:1.2.3.4:login", 10, 10 / 60)
+    
+    @pytest.mark.asyncio
+    async def test_consume_rejects_empty_bucket(self, mock_redis):
+        """Test that a call is rejected once the bucket is empty."""
+        mock_redis.eval.return_value = 0
+        
+        with patch("src.utils.auth.get_redis", return_value=mock_redis):
+            assert await consume_rate_limit("1.2.3.4", "login", 10, 60) is False
+    
+    @pytest.mark.asyncio
+    async def test_consume_fails_open(self, mock_redis):
+        """Test that calls are allowed when Redis is unavailable."""
+        mock_redis.eval.side_effect = ConnectionError("Redis down")
+        
+        with patch("src.utils.auth.get_redis", return_value=mock_redis):
+            assert await consume_rate_limit("1.2.3.4", "login", 10, 60) is True
+    
+    @pytest.mark.asyncio
+    async def test_available_for_new_bucket(self, mock_redis):
+        """Test that a bucket that was never used has tokens."""
+        with patch("src.utils.auth.get_redis", return_value=mock_redis):
+            assert await rate_limit_available("user@example.com", "login", 10, 3600) is True
+    
+    @pytest.mark.asyncio
+    async def test_available_refills_over_time(self, mock_redis):
+        """Test that an empty bucket only has a token again after refilling."""
+        now = time.time()
+        
+        with patch("src.utils.auth.get_redis", return_value=mock_redis):
+            mock_redis.hmget.return_value = ["0.5", str(now)]
+            assert await rate_limit_available("user@example.com", "login", 10, 3600) is False
+            
+            # 10 tokens per hour refill one token every 360 seconds
+            mock_redis.hmget.return_value = ["0.5", str(now - 200)]
+            assert await rate_limit_available("user@example.com", "login", 10, 3600) is True
+        
+        mock_redis.eval.assert_not_called()
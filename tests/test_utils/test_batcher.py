@@ -0,0 +1,79 @@
+"""
+Tests for Async Request Batching
+
+This module contains tests for coalescing submissions into bulk calls
+and for shutting the batcher down.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.utils.batcher import AsyncBatcher
+
+
+class TestAsyncBatcher:
+    """Test AsyncBatcher batching and shutdown."""
+    
+    @pytest.mark.asyncio
+    async def test_submissions_share_one_bulk_call(self):
+        """Test that concurrent submissions are coalesced and deduplicated."""
+        handler = AsyncMock(side_effect=lambda keys: {key: key.upper() for key in keys})
+        batcher = AsyncBatcher(handler, max_size=10, max_wait_ms=20)
+        
+        results = await asyncio.gather(*[batcher.submit(key) for key in ["a", "b", "a"]])
+        
+        assert results == ["A", "B", "A"]
+        handler.assert_awaited_once_with(["a", "b"])
+        await batcher.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_handler_error_reaches_every_submitter(self):
+        """Test that a failed bulk call raises in each submitter."""
+        batcher = AsyncBatcher(AsyncMock(side_effect=RuntimeError("boom")), max_wait_ms=5)
+        
+        results = await asyncio.gather(
+            batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+        )
+        
+        assert all(isinstance(result, RuntimeError) for result in results)
+        await batcher.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_aclose_stops_worker_and_cancels_pending(self):
+        """Test that closing stops the worker and cancels submissions not yet flushed."""
+        handler = AsyncMock(return_value={})
+        batcher = AsyncBatcher(handler, max_size=10, max_wait_ms=10_000)
+        
+        pending = asyncio.create_task(batcher.submit("a"))
+        await asyncio.sleep(0.01)
+        worker = batcher._worker
+        
+        await batcher.aclose()
+        
+        assert worker.done()
+        with pytest.raises(asyncio.CancelledError):
+            await pending
+        handler.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_aclose_waits_for_running_flush(self):
+        """Test that closing lets a batch already handed to the handler finish."""
+        release = asyncio.Event()
+        
+        async def handler(keys):
+            await release.wait()
+            return {key: True for key in keys}
+        
+        batcher = AsyncBatcher(handler, max_size=1)
+        pending = asyncio.create_task(batcher.submit("a"))
+        await asyncio.sleep(0.01)
+        
+        closing = asyncio.create_task(batcher.aclose())
+        await asyncio.sleep(0.01)
+        assert not closing.done()
+        
+        release.set()
+        await closing
+        assert await pending is True
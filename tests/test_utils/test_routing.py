@@ -0,0 +1,80 @@
+"""
+Tests for Route Classes
+
+This module contains tests for the TrustedRoute response handling.
+"""
+
+from unittest.mock import patch
+
+from fastapi import APIRouter, FastAPI, routing
+from fastapi.responses import ORJSONResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from src.utils.routing import TrustedRoute
+
+
+class ItemResponse(BaseModel):
+    """Response model returned by the test routes."""
+    
+    id: str
+    name: str
+
+
+class StoredItem(ItemResponse):
+    """Stored model with a field the response model must not expose."""
+    
+    secret: str
+
+
+class TestTrustedRoute:
+    """Test that TrustedRoute only skips validation for exact response models."""
+    
+    def _client(self, result) -> TestClient:
+        """Create a client for an app whose route returns the given result."""
+        router = APIRouter(route_class=TrustedRoute)
+        
+        @router.get("/item", response_model=ItemResponse, status_code=201)
+        async def get_item():
+            return result
+        
+        app = FastAPI()
+        app.include_router(router)
+        return TestClient(app)
+    
+    def test_exact_model_is_dumped_directly(self):
+        """Test that an exact response_model instance skips revalidation."""
+        with patch.object(
+            routing, "serialize_response", wraps=routing.serialize_response
+        ) as mock_serialize:
+            response = self._client(ItemResponse(id="1", name="test")).get("/item")
+        
+        assert response.status_code == 201
+        assert response.json() == {"id": "1", "name": "test"}
+        mock_serialize.assert_not_called()
+    
+    def test_subclass_is_filtered(self):
+        """Test that a subclass still goes through response_model filtering."""
+        with patch.object(
+            routing, "serialize_response", wraps=routing.serialize_response
+        ) as mock_serialize:
+            response = self._client(
+                StoredItem(id="1", name="test", secret="hidden")
+            ).get("/item")
+        
+        assert response.status_code == 201
+        assert response.json() == {"id": "1", "name": "test"}
+        mock_serialize.assert_called_once()
+    
+    def test_dict_is_validated(self):
+        """Test that a dict result is still validated."""
+        response = self._client({"id": "1", "name": "test", "secret": "hidden"}).get("/item")
+        
+        assert response.json() == {"id": "1", "name": "test"}
+    
+    def test_response_passes_through(self):
+        """Test that Response objects are returned unchanged."""
+        response = self._client(ORJSONResponse({"raw": True}, status_code=202)).get("/item")
+        
+        assert response.status_code == 202
+        assert response.json() == {"raw": True}